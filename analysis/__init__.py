@@ -1,10 +1,33 @@
 """
 분석 엔진 모듈
 """
-from .monte_carlo import run_monte_carlo_analysis
-from .quant_metrics import run_quant_analysis
+from .monte_carlo import run_monte_carlo_analysis, compute_monte_carlo_analysis
+from .quant_metrics import run_quant_analysis, compute_quant_metrics
+from .volatility import fit_volatility_model, simulate_volatility_paths
+from .forward_returns import get_forward_return_index
+from .incremental import IncrementalQuantState
+from .backtest import run_threshold_backtest, backtest_threshold_grid
+from .scenarios import run_scenario_analysis, replay_scenarios
+from .sensitivity import run_sensitivity_analysis, compute_sensitivity_surface
+from .serialization import save_result, load_result, serialize_result, deserialize_result
 
 __all__ = [
     'run_monte_carlo_analysis',
-    'run_quant_analysis'
+    'compute_monte_carlo_analysis',
+    'run_quant_analysis',
+    'compute_quant_metrics',
+    'fit_volatility_model',
+    'simulate_volatility_paths',
+    'get_forward_return_index',
+    'IncrementalQuantState',
+    'run_threshold_backtest',
+    'backtest_threshold_grid',
+    'run_scenario_analysis',
+    'replay_scenarios',
+    'run_sensitivity_analysis',
+    'compute_sensitivity_surface',
+    'save_result',
+    'load_result',
+    'serialize_result',
+    'deserialize_result'
 ]
@@ -0,0 +1,182 @@
+"""
+백분위 / 복합 지수 임계값 신호 백테스트 엔진
+- 진입/청산 임계값 그리드 전체를 2차원 브로드캐스팅과 누적합으로 한 번에 평가
+- 날짜 축 파이썬 루프 없음 (청산 신호는 전체 청산 임계값에 대해 한 번에 계산, 성과 집계만 청산 임계값 축 순회)
+- 지표는 확장 창 백분위 / Z-score (각 날짜까지 알려진 데이터만 사용, look-ahead 없음)
+"""
+import numpy as np
+import pandas as pd
+from data import (
+    get_trading_calendar,
+    PriceHistory,
+    calculate_returns_array,
+    calculate_expanding_percentile_rank_array,
+    calculate_zscore_array
+)
+
+BACKTEST_SIGNALS = ('percentile', 'composite')
+BACKTEST_DIRECTIONS = ('mean_reversion', 'momentum')
+# 각 날짜까지 알려진 데이터만 쓰는 모드 (full은 미래 값 포함)
+BACKTEST_ZSCORE_MODES = ('expanding', 'rolling')
+
+def backtest_threshold_grid(readings, closes, entry_thresholds, exit_thresholds,
+                            direction='mean_reversion', periods_per_year=252):
+    """
+    지표 임계값 그리드 전체의 백테스트 성과를 계산합니다.
+
+    mean_reversion: 지표 <= 진입 임계값이면 매수, 지표 >= 청산 임계값이면 매도
+    momentum: 지표 >= 진입 임계값이면 매수, 지표 <= 청산 임계값이면 매도
+    같은 날 진입/청산 조건이 모두 성립하면 청산이 우선하며, 포지션은 당일 종가에 결정되어
+    다음 거래일 수익률부터 적용됩니다.
+
+    Args:
+        readings: 지표 배열 (n,)
+        closes: 같은 날짜의 종가 배열 (n,)
+        entry_thresholds: 진입 임계값 배열 (E,)
+        exit_thresholds: 청산 임계값 배열 (X,)
+        direction: 'mean_reversion' 또는 'momentum'
+        periods_per_year: 연간 거래일 수
+
+    Returns:
+        dict: (E, X) 배열 cagr, max_drawdown, hit_rate, turnover, n_trades, exposure
+    """
+    if direction not in BACKTEST_DIRECTIONS:
+        raise ValueError(f"지원하지 않는 방향: {direction}")
+
+    readings = np.asarray(readings, dtype=float)
+    closes = np.asarray(closes, dtype=float)
+    entry = np.asarray(entry_thresholds, dtype=float)
+    exits = np.asarray(exit_thresholds, dtype=float)
+    if direction == 'momentum':
+        # 부호를 뒤집으면 같은 "<= 진입 / >= 청산" 규칙으로 평가할 수 있음
+        readings, entry, exits = -readings, -entry, -exits
+
+    n = len(readings)
+    t = np.arange(n)
+    years = (n - 1) / periods_per_year
+    log_ret = np.diff(np.log(closes))
+
+    # 배열은 (날짜, 진입 임계값) 배치: 날짜 축 누적 연산이 연속 메모리에서 임계값 방향으로 벡터화됨
+    # 임계값별 마지막 진입 신호 시점 (n, E)
+    last_entry = np.maximum.accumulate(np.where(readings[:, None] <= entry[None, :], t[:, None], -1),
+                                       axis=0)
+    # 청산 임계값별 마지막 청산 신호 시점 (X, n): 행 하나가 연속 메모리
+    last_exits = np.maximum.accumulate(np.where(readings[None, :] >= exits[:, None], t[None, :], -1),
+                                       axis=1)
+
+    shape = (len(entry), len(exits))
+    out = {key: np.empty(shape) for key in ('cagr', 'max_drawdown', 'hit_rate', 'turnover',
+                                            'n_trades', 'exposure')}
+    cum = np.zeros((n, len(entry)))
+    running_max = np.empty_like(cum)
+    edge = np.zeros((1, len(entry)), dtype=np.int8)
+
+    for j, last_exit in enumerate(last_exits):
+        position = last_entry > last_exit[:, None]
+
+        # 누적 로그 수익률 cum[t] (t 시점 종가 기준 평가액)
+        np.multiply(position[:-1], log_ret[:, None], out=cum[1:])
+        np.cumsum(cum, axis=0, out=cum)
+
+        # CAGR / 최대 낙폭
+        out['cagr'][:, j] = (np.exp(cum[-1] / years) - 1) * 100
+        np.maximum.accumulate(cum, axis=0, out=running_max)
+        running_max -= cum
+        out['max_drawdown'][:, j] = (np.exp(-running_max.max(axis=0)) - 1) * 100
+
+        # 거래 단위 승률: 진입(0->1)~청산(1->0) 구간의 누적 수익
+        change = np.diff(position.view(np.int8), axis=0, prepend=edge, append=edge)
+        event_t, event_col = np.divmod(np.flatnonzero(change), len(entry))
+        order = np.argsort(event_col, kind='stable')
+        event_t, event_col = event_t[order], event_col[order]
+        # 임계값별로 시간순 정렬하면 진입/청산 이벤트가 번갈아 나타남
+        start_t, end_t, trade_col = event_t[0::2], np.minimum(event_t[1::2], n - 1), event_col[0::2]
+        pnl = cum[end_t, trade_col] - cum[start_t, trade_col]
+        trades = np.bincount(trade_col, minlength=len(entry))
+        wins = np.bincount(trade_col, weights=pnl > 0, minlength=len(entry))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            out['hit_rate'][:, j] = np.where(trades > 0, wins / trades * 100, np.nan)
+
+        out['n_trades'][:, j] = trades
+        out['turnover'][:, j] = np.count_nonzero(change[:-1], axis=0) / years
+        out['exposure'][:, j] = position.mean(axis=0) * 100
+
+    buy_hold = log_ret.sum()
+    out.update({
+        "entry_thresholds": np.asarray(entry_thresholds, dtype=float),
+        "exit_thresholds": np.asarray(exit_thresholds, dtype=float),
+        "direction": direction,
+        "buy_hold_cagr": float((np.exp(buy_hold / years) - 1) * 100),
+        "n_days": n
+    })
+    return out
+
+def causal_readings(full_series, lookback=252, signal='percentile', zscore_mode='expanding',
+                    zscore_window=252, min_periods=252):
+    """
+    각 날짜까지 알려진 데이터만 사용한 지표 시계열을 계산합니다 (백테스트용, look-ahead 없음).
+
+    - 백분위: 그 이전 날짜까지의 N일 수익률 분포에서의 확장 창 순위
+    - 복합 지수: 확장 창 백분위 + 확장/이동 창 Z-score
+
+    Args:
+        full_series: 전체 기간 가격 시계열
+        lookback: 수익률 계산 기간 (일)
+        signal: 'percentile' 또는 'composite'
+        zscore_mode: 'expanding' 또는 'rolling' (둘 다 해당 시점까지의 값만 사용)
+        zscore_window: rolling 모드의 창 길이 (일)
+        min_periods: 순위를 매기기 위한 최소 이전 표본 수
+
+    Returns:
+        pd.Series: 지표 시계열 (표본이 부족한 초기 구간 제외)
+    """
+    if signal not in BACKTEST_SIGNALS:
+        raise ValueError(f"지원하지 않는 신호: {signal}")
+    if zscore_mode not in BACKTEST_ZSCORE_MODES:
+        raise ValueError(f"백테스트는 look-ahead 없는 Z-score 모드만 지원합니다: {BACKTEST_ZSCORE_MODES}")
+
+    returns = calculate_returns_array(PriceHistory.from_series(full_series), lookback)
+    readings = calculate_expanding_percentile_rank_array(returns, min_periods).values
+    if signal == 'composite':
+        z_score = calculate_zscore_array(returns, zscore_mode, zscore_window).values
+        readings = (readings + (np.clip(z_score, -3, 3) + 3) / 6 * 100) / 2
+    return returns.to_series(readings).dropna()
+
+def run_threshold_backtest(full_series, start_date="1928-01-01", lookback=252, signal='percentile',
+                           zscore_mode='expanding',
+                           entry_thresholds=None, exit_thresholds=None, direction='mean_reversion'):
+    """
+    퀀트 지표를 계산해 임계값 그리드 백테스트를 실행합니다.
+
+    지표는 각 날짜까지 알려진 데이터만 사용합니다 (causal_readings: 확장 창 백분위).
+
+    Args:
+        full_series: 전체 기간 가격 시계열
+        start_date: 백테스트 시작일 (지표의 확장 창은 전체 기간 처음부터 누적)
+        lookback: 지표 수익률 계산 기간 (일)
+        signal: 'percentile' 또는 'composite'
+        zscore_mode: 복합 지수의 Z-score 모드 ('expanding' 또는 'rolling')
+        entry_thresholds: 진입 임계값 (기본: 0~100 사이 100개)
+        exit_thresholds: 청산 임계값 (기본: 0~100 사이 100개)
+        direction: 'mean_reversion' 또는 'momentum'
+
+    Returns:
+        dict: backtest_threshold_grid 결과 + signal 정보
+    """
+    readings = causal_readings(full_series, lookback, signal, zscore_mode)
+    readings = readings[readings.index >= pd.Timestamp(start_date)]
+    if len(readings) < 2:
+        return None
+
+    calendar = get_trading_calendar(full_series)
+    closes = calendar.closes[calendar.positions(readings.index)]
+
+    if entry_thresholds is None:
+        entry_thresholds = np.linspace(0, 100, 100)
+    if exit_thresholds is None:
+        exit_thresholds = np.linspace(0, 100, 100)
+
+    result = backtest_threshold_grid(readings.values, closes, entry_thresholds,
+                                     exit_thresholds, direction)
+    result.update({"signal": signal, "lookback": lookback, "zscore_mode": zscore_mode})
+    return result
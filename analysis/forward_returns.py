@@ -0,0 +1,143 @@
+"""
+역사적 선행 수익률 조건부 분포 인덱스
+- "현재와 비슷한 백분위였던 날, 이후 N일 수익률은 어땠나?"
+- 전체 기간의 각 날짜를 (기간별) 지표 구간에 배정하고, 구간별 선행 수익률을 정렬 배열로 저장
+- 지표는 각 날짜까지 알려진 데이터만 사용 (확장 창 백분위 / Z-score, look-ahead 없음)
+- 데이터 버전별로 한 번만 생성 (최근 항목만 유지), 조회는 O(1)
+"""
+import numpy as np
+from data import (
+    get_data_version,
+    DataVersionCache,
+    PriceHistory,
+    calculate_returns_array,
+    calculate_expanding_percentile_rank_array,
+    calculate_zscore_array
+)
+
+FORWARD_READINGS = ('percentile', 'composite')
+_SUMMARY_QUANTILES = (5, 25, 50, 75, 95)
+
+# (데이터 버전, 기간, 지표, 구간 수) -> ForwardReturnIndex
+_INDEX_CACHE = DataVersionCache(32)
+
+class ForwardReturnIndex:
+    """
+    지표 구간별 선행 수익률 분포 인덱스 (단일 기간).
+
+    Attributes:
+        horizon: 수익률 기간 (일) - 과거 수익률과 선행 수익률에 동일하게 적용
+        reading: 'percentile' 또는 'composite'
+        n_buckets: 0~100 지표를 나누는 구간 수
+        buckets: 구간별 정렬된 선행 수익률 배열 (%) 리스트
+        summaries: 구간별 요약 통계 리스트
+        current_reading: 마지막 날짜의 지표 값
+    """
+
+    def __init__(self, prices, horizon, reading='percentile', n_buckets=20, min_periods=252):
+        if reading not in FORWARD_READINGS:
+            raise ValueError(f"지원하지 않는 지표: {reading}")
+        if len(prices) < 2 * horizon + 1:
+            raise ValueError(f"데이터 부족: {len(prices)}일 < 필요: {2 * horizon + 1}일")
+
+        self.horizon = horizon
+        self.reading = reading
+        self.n_buckets = n_buckets
+
+        # 1. 과거 h일 수익률과 그 날짜까지의 확장 창 지표 (이후 수익률 미사용)
+        trailing = calculate_returns_array(prices, horizon)
+        readings = self._readings(trailing, reading, min_periods)
+        self.current_reading = float(readings[-1])
+
+        # 2. 선행 h일 수익률 (trailing[k]는 날짜 k + horizon 기준)
+        closes = prices.values
+        forward = (closes[2 * horizon:] / closes[horizon:-horizon] - 1) * 100
+        past = readings[:len(forward)]
+
+        # 3. 표본이 부족한 초기 구간 제외 후 구간 배정, (구간, 수익률) 순으로 정렬해 구간별로 분할
+        valid = np.isfinite(past)
+        forward, past = forward[valid], past[valid]
+        bucket_ids = self.bucket_of(past)
+        order = np.lexsort((forward, bucket_ids))
+        counts = np.bincount(bucket_ids, minlength=n_buckets)
+        self.buckets = np.split(forward[order], np.cumsum(counts)[:-1])
+        self.summaries = [self._summarize(b) for b in self.buckets]
+
+    @staticmethod
+    def _readings(trailing, reading, min_periods):
+        percentile = calculate_expanding_percentile_rank_array(trailing, min_periods).values
+        if reading == 'percentile':
+            return percentile
+
+        z_score = calculate_zscore_array(trailing, 'expanding').values
+        z_scaled = (np.clip(z_score, -3, 3) + 3) / 6 * 100
+        return (percentile + z_scaled) / 2
+
+    @staticmethod
+    def _summarize(values):
+        if len(values) == 0:
+            return {"count": 0}
+
+        # 정렬 배열이므로 분위수는 인덱스 조회
+        idx = [int(round(q / 100 * (len(values) - 1))) for q in _SUMMARY_QUANTILES]
+        return {
+            "count": len(values),
+            "mean": float(values.mean()),
+            "win_rate": float(np.mean(values > 0) * 100),
+            "quantiles": dict(zip(_SUMMARY_QUANTILES, values[idx].tolist()))
+        }
+
+    def bucket_of(self, value):
+        """
+        지표 값(0~100)의 구간 번호를 반환합니다.
+        """
+        width = 100 / self.n_buckets
+        ids = np.floor_divide(value, width).astype(int)
+        return np.clip(ids, 0, self.n_buckets - 1)
+
+    def bucket_range(self, bucket):
+        """
+        구간 번호의 지표 범위 (하한, 상한)를 반환합니다.
+        """
+        width = 100 / self.n_buckets
+        return bucket * width, (bucket + 1) * width
+
+    def lookup(self, value=None):
+        """
+        지표 값이 속한 구간의 선행 수익률 분포를 조회합니다 (O(1)).
+
+        Args:
+            value: 지표 값 (None이면 현재 값)
+
+        Returns:
+            dict: horizon, reading, bucket, range, returns(정렬 배열), summary
+        """
+        if value is None:
+            value = self.current_reading
+        bucket = int(self.bucket_of(value))
+        return {
+            "horizon": self.horizon,
+            "reading": self.reading,
+            "reading_value": float(value),
+            "bucket": bucket,
+            "range": self.bucket_range(bucket),
+            "returns": self.buckets[bucket],
+            "summary": self.summaries[bucket]
+        }
+
+def get_forward_return_index(series, horizon, reading='percentile', n_buckets=20):
+    """
+    전체 가격 시계열의 선행 수익률 인덱스를 반환합니다 (데이터 버전별 캐시).
+
+    Args:
+        series: 전체 가격 시계열
+        horizon: 수익률 기간 (일)
+        reading: 'percentile' 또는 'composite'
+        n_buckets: 구간 수
+
+    Returns:
+        ForwardReturnIndex: 선행 수익률 인덱스
+    """
+    return _INDEX_CACHE.get((get_data_version(series), horizon, reading, n_buckets),
+                            lambda: ForwardReturnIndex(PriceHistory.from_series(series), horizon,
+                                                       reading, n_buckets))
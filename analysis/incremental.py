@@ -0,0 +1,243 @@
+"""
+실시간 증분 업데이트 엔진
+- 새 종가(날짜, 가격) 1개를 추가할 때 전체 재계산 없이 최신 수익률/백분위/Z-score/복합 지수를 갱신
+- 기준 분포는 정렬 버킷 + 펜윅 트리로 순위 탐색/삽입, Z-score는 누적 모멘트(Welford)로 갱신
+- 결과 배열은 여유 용량을 둔 버퍼에 제자리 추가
+"""
+from bisect import bisect_left, insort
+import numpy as np
+import pandas as pd
+from data import ZSCORE_MODES
+from .quant_metrics import compute_quant_metrics
+
+class _GrowableArray:
+    """
+    용량을 두 배씩 늘리는 1차원 버퍼 (추가는 분할 상환 O(1)).
+    """
+
+    def __init__(self, values, dtype=float):
+        values = np.asarray(values, dtype=dtype)
+        self._data = np.empty(max(16, 2 * len(values)), dtype=dtype)
+        self._data[:len(values)] = values
+        self._size = len(values)
+
+    def __len__(self):
+        return self._size
+
+    def _reserve(self, size):
+        if size > len(self._data):
+            grown = np.empty(max(size, 2 * len(self._data)), dtype=self._data.dtype)
+            grown[:self._size] = self._data[:self._size]
+            self._data = grown
+
+    def append(self, value):
+        self._reserve(self._size + 1)
+        self._data[self._size] = value
+        self._size += 1
+
+    @property
+    def values(self):
+        return self._data[:self._size]
+
+class _SortedBuckets:
+    """
+    정렬 버킷 목록으로 유지하는 정렬 다중집합 (삽입 전용).
+
+    버킷 최댓값 목록을 이진 탐색해 버킷을 고르고, 앞선 버킷들의 원소 수는
+    버킷 크기 위의 펜윅 트리로 구합니다. 삽입은 O(log n) 탐색 + 버킷 크기(상수) 이내의
+    원소 이동이며, 버킷이 2 * load를 넘으면 둘로 나누고 트리를 다시 만듭니다 (분할 상환).
+    """
+
+    def __init__(self, sorted_values, load=512):
+        self._load = load
+        values = [float(v) for v in sorted_values]
+        self._buckets = [values[i:i + load] for i in range(0, len(values), load)] or [[]]
+        self._size = len(values)
+        self._rebuild()
+
+    def __len__(self):
+        return self._size
+
+    def _rebuild(self):
+        self._maxes = [bucket[-1] if bucket else np.inf for bucket in self._buckets]
+        # 펜윅 트리 O(B) 구성
+        self._tree = [0] * (len(self._buckets) + 1)
+        for i, bucket in enumerate(self._buckets, 1):
+            self._tree[i] += len(bucket)
+            parent = i + (i & -i)
+            if parent <= len(self._buckets):
+                self._tree[parent] += self._tree[i]
+
+    def _prefix(self, k):
+        """앞에서 k개 버킷의 원소 수 합."""
+        total = 0
+        while k > 0:
+            total += self._tree[k]
+            k -= k & -k
+        return total
+
+    def _add(self, k, delta):
+        k += 1
+        while k < len(self._tree):
+            self._tree[k] += delta
+            k += k & -k
+
+    def insert_sorted(self, value):
+        """
+        정렬 상태를 유지하며 삽입하고, 삽입 위치(= value보다 작은 원소 수)를 반환합니다.
+        """
+        value = float(value)
+        k = min(bisect_left(self._maxes, value), len(self._buckets) - 1)
+        bucket = self._buckets[k]
+        pos = self._prefix(k) + bisect_left(bucket, value)
+        insort(bucket, value)
+        self._size += 1
+        self._maxes[k] = bucket[-1]
+
+        if len(bucket) > 2 * self._load:
+            self._buckets[k:k + 1] = [bucket[:self._load], bucket[self._load:]]
+            self._rebuild()
+        else:
+            self._add(k, 1)
+        return pos
+
+    @property
+    def values(self):
+        return np.array([v for bucket in self._buckets for v in bucket])
+
+class IncrementalQuantState:
+    """
+    퀀트 지표의 증분 업데이트 상태.
+
+    run_quant_analysis와 같은 설정으로 초기화한 뒤 append()로 새 종가를 추가합니다.
+    각 시점의 값은 "그 시점까지의 데이터로 전체 재계산했을 때의 최신 값"과 같습니다.
+
+    복잡도: 순위 탐색/기준 분포 삽입 O(log n) (+ 버킷 크기 이내 이동), Z-score/복합 지수 O(1).
+    """
+
+    def __init__(self, full_series, start_date, lookback=252, rank_mode='relative',
+                 zscore_mode='full', zscore_window=252):
+        if zscore_mode not in ZSCORE_MODES:
+            raise ValueError(f"지원하지 않는 Z-score 모드: {zscore_mode}")
+
+        self.lookback = lookback
+        self.rank_mode = rank_mode
+        self.zscore_mode = zscore_mode
+        self.zscore_window = zscore_window
+
+        result = compute_quant_metrics(full_series, start_date, lookback, rank_mode,
+                                       zscore_mode, zscore_window)
+        if result is None:
+            raise ValueError("초기 상태를 계산할 데이터가 부족합니다.")
+
+        # 1. 가격 / 결과 버퍼
+        closes = full_series.values
+        self._closes = _GrowableArray(closes)
+        self._dates = _GrowableArray(full_series.index.values, dtype='datetime64[ns]')
+        self._result_dates = _GrowableArray(result["percentile"].index.values, dtype='datetime64[ns]')
+        self._percentile = _GrowableArray(result["percentile"].values)
+        self._z_score = _GrowableArray(result["z_score"].values)
+        self._composite = _GrowableArray(result["composite_idx"].values)
+
+        # 2. 순위 기준 분포 (절대: 전체 기간 수익률, 상대: 선택 기간 수익률)
+        all_returns = closes[lookback:] / closes[:-lookback] - 1
+        self._returns = _GrowableArray(all_returns)
+        selected = all_returns[-len(result["percentile"]):]
+        reference = all_returns if rank_mode == 'absolute' else selected
+        self._sorted = _SortedBuckets(np.sort(reference))
+
+        # 3. Z-score 누적 모멘트 (count, mean, M2)
+        if zscore_mode == 'full':
+            moment_values = selected
+        elif zscore_mode == 'rolling':
+            moment_values = all_returns[-zscore_window:]
+        else:
+            moment_values = all_returns
+        self._count = len(moment_values)
+        self._mean = float(moment_values.mean())
+        self._m2 = float(((moment_values - self._mean) ** 2).sum())
+
+    def __len__(self):
+        return len(self._percentile)
+
+    def _update_moments(self, value):
+        if self.zscore_mode == 'rolling' and self._count >= self.zscore_window:
+            # 창에서 가장 오래된 값을 빼고 새 값을 더하는 슬라이딩 Welford 갱신
+            old = self._returns.values[-self.zscore_window - 1]
+            new_mean = self._mean + (value - old) / self.zscore_window
+            self._m2 += (value - old) * (value - new_mean + old - self._mean)
+            self._mean = new_mean
+            self._m2 = max(self._m2, 0.0)
+        else:
+            self._count += 1
+            delta = value - self._mean
+            self._mean += delta / self._count
+            self._m2 += delta * (value - self._mean)
+
+    def append(self, date, close):
+        """
+        새 종가를 추가하고 최신 지표를 갱신합니다.
+
+        Args:
+            date: 날짜
+            close: 종가
+
+        Returns:
+            dict: date, return, percentile, z_score, composite
+        """
+        date = np.datetime64(pd.Timestamp(date), 'ns')
+        if len(self._dates) and date <= self._dates.values[-1]:
+            raise ValueError(f"마지막 날짜 이후의 데이터만 추가할 수 있습니다: {date}")
+
+        self._dates.append(date)
+        self._closes.append(close)
+        closes = self._closes.values
+        ret = closes[-1] / closes[-1 - self.lookback] - 1
+        self._returns.append(ret)
+
+        # 백분위: 삽입 위치가 곧 ret보다 작은 값의 개수
+        rank = self._sorted.insert_sorted(ret)
+        percentile = rank / len(self._sorted) * 100
+
+        # Z-score (표본 표준편차, ddof=1)
+        self._update_moments(ret)
+        if self._count > 1 and self._m2 > 0:
+            z = (ret - self._mean) / np.sqrt(self._m2 / (self._count - 1))
+        else:
+            z = np.nan
+        composite = (percentile + (np.clip(z, -3, 3) + 3) / 6 * 100) / 2
+
+        self._result_dates.append(date)
+        self._percentile.append(percentile)
+        self._z_score.append(z)
+        self._composite.append(composite)
+
+        return {
+            "date": pd.Timestamp(date),
+            "return": float(ret),
+            "percentile": float(percentile),
+            "z_score": float(z),
+            "composite": float(composite)
+        }
+
+    def to_result(self):
+        """
+        run_quant_analysis와 같은 형식의 결과 딕셔너리를 반환합니다 (차트/API 경계용).
+
+        Note:
+            각 시점의 값은 그 시점 기준으로 계산된 값입니다. 날짜 축, 메타데이터, current_val,
+            마지막 행과 rolling/expanding Z-score는 일괄 재계산과 같고, percentile / composite_idx와
+            'full' Z-score의 과거 값은 다를 수 있습니다 (tests/test_incremental.py 참고).
+        """
+        index = pd.DatetimeIndex(self._result_dates.values)
+        composite_idx = pd.Series(self._composite.values.copy(), index=index)
+        return {
+            "percentile": pd.Series(self._percentile.values.copy(), index=index),
+            "z_score": pd.Series(self._z_score.values.copy(), index=index),
+            "composite_idx": composite_idx,
+            "lookback": self.lookback,
+            "current_val": composite_idx.iloc[-1],
+            "rank_mode": self.rank_mode,
+            "zscore_mode": self.zscore_mode,
+            "zscore_window": self.zscore_window
+        }
@@ -4,14 +4,34 @@
 import numpy as np
 from data import (
     load_sp500_data, 
-    filter_by_date, 
-    calculate_returns,
-    calculate_percentile_rank,
-    calculate_log_returns
+    PriceHistory,
+    calculate_returns_array,
+    calculate_percentile_rank_array,
+    calculate_log_returns_array
+)
+from .volatility import VOL_MODELS, fit_volatility_model, simulate_volatility_paths
+from .forward_returns import get_forward_return_index
+from .path_risk import (
+    DEFAULT_CVAR_LEVELS,
+    DEFAULT_TOUCH_LEVELS,
+    compute_path_risk_metrics
+)
+from .summary import (
+    summarize_terminal_returns,
+    compute_percentile_bands,
+    gbm_terminal_stats,
+    gbm_percentile_bands,
+    gbm_tail_risk,
+    gbm_touch_probability
 )
 
+MC_METHODS = ('sampled', 'analytic')
+
 def run_monte_carlo_analysis(file_path, start_date, forecast_days=252, 
-                             iterations=10000, rank_mode='relative'):
+                             iterations=10000, rank_mode='relative', vol_model='gbm',
+                             method='sampled', sample_paths=100,
+                             cvar_levels=DEFAULT_CVAR_LEVELS, touch_levels=DEFAULT_TOUCH_LEVELS,
+                             seed=None):
     """
     몬테카를로 시뮬레이션 분석을 실행합니다.
     
@@ -21,6 +41,12 @@ def run_monte_carlo_analysis(file_path, start_date, forecast_days=252,
         forecast_days: 예측 기간 (일)
         iterations: 시뮬레이션 반복 횟수
         rank_mode: 'relative' (선택기간 상대순위) 또는 'absolute' (전체기간 절대순위)
+        vol_model: 'gbm' (고정 변동성), 'ewma' 또는 'garch' (시변 변동성)
+        method: 'sampled' (전체 표본 시뮬레이션) 또는 'analytic' (GBM 정확해, 표본 추출 없음)
+        sample_paths: analytic 모드에서 배경 시나리오용으로 생성할 경로 수
+        cvar_levels: CVaR(기대 손실) 신뢰 수준 (예: 95 -> 하위 5%)
+        touch_levels: 만기 전 도달 확률을 계산할 수익률 수준 (%)
+        seed: 경로 난수 시드 (None이면 새로 뽑아 결과의 'seed'에 기록, 같은 시드로 같은 결과 재현)
     
     Returns:
         dict: 분석 결과 딕셔너리
@@ -35,91 +61,174 @@ def run_monte_carlo_analysis(file_path, start_date, forecast_days=252,
         full_series = load_sp500_data(file_path)
         print(f"   전체 데이터: {len(full_series)}일 ({full_series.index[0]} ~ {full_series.index[-1]})")
         
-        series = filter_by_date(full_series, start_date)
-        print(f"   선택 데이터: {len(series)}일 ({series.index[0]} ~ {series.index[-1]})")
-        
-        # 데이터 충분성 검증
-        if len(series) < forecast_days + 1:
-            print(f"❌ 데이터 부족: {len(series)}일 < 필요: {forecast_days + 1}일")
-            print(f"   해결: 시작일을 더 과거로 설정하거나, 분석 기간을 줄여주세요.")
-            return None
-        
-        # 1. 순위 계산 (모드에 따라)
-        returns = calculate_returns(series, forecast_days)
-        print(f"   수익률 계산: {len(returns)}개")
-        
-        if len(returns) == 0:
-            print("❌ 수익률 계산 결과가 비어있습니다.")
-            return None
-        
-        if rank_mode == 'absolute':
-            # 전체 기간 수익률로 절대 순위 계산
-            full_returns = calculate_returns(full_series, forecast_days)
-            print(f"   전체 수익률: {len(full_returns)}개")
-            rank_ts = calculate_percentile_rank(returns, mode='absolute', full_returns=full_returns)
-        else:
-            # 선택 기간 내 상대 순위 계산
-            rank_ts = calculate_percentile_rank(returns, mode='relative')
-        
-        print(f"   순위 계산: {len(rank_ts)}개")
-        print(f"✅ 순위 데이터 준비 완료")
-        
-        # 2. 몬테카를로 시뮬레이션
-        print(f"\n🎲 몬테카를로 시뮬레이션 시작...")
-        S0 = series.iloc[-1]
-        print(f"   현재 가격: ${S0:.2f}")
-        
-        log_returns = calculate_log_returns(series)
-        log_returns = log_returns.dropna()
-        
-        if len(log_returns) == 0:
-            print("❌ 로그 수익률 계산 실패")
-            return None
-        
-        # 드리프트 및 변동성 계산
-        drift = log_returns.mean() - (0.5 * log_returns.var())
-        stdev = log_returns.std()
-        
-        print(f"   드리프트: {drift:.6f}, 변동성: {stdev:.6f}")
-        
-        # 시뮬레이션 실행
-        daily_returns = np.exp(
-            drift + stdev * np.random.normal(0, 1, (forecast_days, iterations))
-        )
-        
-        price_list = np.zeros_like(daily_returns)
-        price_list[0] = S0
-        for t in range(1, forecast_days):
-            price_list[t] = price_list[t - 1] * daily_returns[t]
-        
-        # 최종 수익률 계산
-        final_prices = price_list[-1]
-        sim_returns_pct = ((final_prices - S0) / S0) * 100
-        
-        print(f"✅ 시뮬레이션 완료 ({iterations}회)")
-        
-        # 반환 전 데이터 검증
-        print(f"\n🔍 반환 데이터 검증:")
-        print(f"   rank_ts 타입: {type(rank_ts)}")
-        print(f"   rank_ts 길이: {len(rank_ts)}")
-        
-        result = {
-            "current_price": S0,
-            "price_list": price_list,
-            "returns_pct": sim_returns_pct,
-            "days": forecast_days,
-            "percentile": float(rank_ts.iloc[-1]) if len(rank_ts) > 0 else 50.0,
-            "rank_ts": rank_ts,
-            "rank_mode": rank_mode
-        }
-        
-        print(f"   result['rank_ts'] 타입: {type(result['rank_ts'])}")
-        print(f"   result['rank_ts'] 샘플 (처음 3개): {result['rank_ts'].head(3).tolist()}")
-        
-        return result
+        return compute_monte_carlo_analysis(full_series, start_date, forecast_days, iterations,
+                                            rank_mode, vol_model, method, sample_paths,
+                                            cvar_levels, touch_levels, seed)
         
     except Exception as e:
         print(f"\n❌ Error in monte_carlo.py: {e}")
         import traceback
         traceback.print_exc()
         return None
+
+def compute_monte_carlo_analysis(full_series, start_date, forecast_days=252, iterations=10000,
+                                 rank_mode='relative', vol_model='gbm', method='sampled',
+                                 sample_paths=100, cvar_levels=DEFAULT_CVAR_LEVELS,
+                                 touch_levels=DEFAULT_TOUCH_LEVELS, seed=None):
+    """
+    이미 로드된 전체 시계열로 몬테카를로 분석을 계산합니다.
+    
+    Args:
+        full_series: 전체 기간 가격 시계열
+        start_date ~ touch_levels: run_monte_carlo_analysis와 동일
+    
+    Returns:
+        dict: 분석 결과 딕셔너리 (데이터 부족 시 None)
+    """
+    if vol_model not in VOL_MODELS:
+        print(f"❌ 지원하지 않는 변동성 모델: {vol_model}")
+        return None
+    
+    if method not in MC_METHODS:
+        print(f"❌ 지원하지 않는 계산 방식: {method}")
+        return None
+    
+    if method == 'analytic' and vol_model != 'gbm':
+        print(f"⚠️  analytic 모드는 GBM 전용입니다. {vol_model.upper()}는 표본 시뮬레이션으로 계산합니다.")
+        method = 'sampled'
+    
+    # 배열 기반 계산 (pandas 변환은 결과 반환 시점에만)
+    prices = PriceHistory.from_series(full_series)
+    series = prices.from_date(start_date)
+    print(f"   선택 데이터: {len(series)}일 ({series.index[0]} ~ {series.index[-1]})")
+    
+    # 데이터 충분성 검증
+    if len(series) < forecast_days + 1:
+        print(f"❌ 데이터 부족: {len(series)}일 < 필요: {forecast_days + 1}일")
+        print(f"   해결: 시작일을 더 과거로 설정하거나, 분석 기간을 줄여주세요.")
+        return None
+    
+    # 1. 순위 계산 (모드에 따라)
+    returns = calculate_returns_array(series, forecast_days)
+    print(f"   수익률 계산: {len(returns)}개")
+    
+    if len(returns) == 0:
+        print("❌ 수익률 계산 결과가 비어있습니다.")
+        return None
+    
+    if rank_mode == 'absolute':
+        # 전체 기간 수익률로 절대 순위 계산
+        full_returns = calculate_returns_array(prices, forecast_days)
+        print(f"   전체 수익률: {len(full_returns)}개")
+        rank_ts = calculate_percentile_rank_array(returns, full_returns).to_series()
+    else:
+        # 선택 기간 내 상대 순위 계산
+        rank_ts = calculate_percentile_rank_array(returns).to_series()
+    
+    print(f"   순위 계산: {len(rank_ts)}개")
+    print(f"✅ 순위 데이터 준비 완료")
+    
+    # 2. 몬테카를로 시뮬레이션
+    print(f"\n🎲 몬테카를로 시뮬레이션 시작...")
+    S0 = series.last
+    print(f"   현재 가격: ${S0:.2f}")
+    
+    log_returns = calculate_log_returns_array(series).values
+    
+    if len(log_returns) == 0:
+        print("❌ 로그 수익률 계산 실패")
+        return None
+    
+    # 드리프트 및 변동성 계산
+    drift = log_returns.mean() - (0.5 * log_returns.var(ddof=1))
+    stdev = log_returns.std(ddof=1)
+    
+    print(f"   드리프트: {drift:.6f}, 변동성: {stdev:.6f}")
+    
+    # 시뮬레이션 실행 (analytic 모드는 배경 시나리오용 소수 경로만 생성)
+    n_paths = min(sample_paths, iterations) if method == 'analytic' else iterations
+    if seed is None:
+        seed = int(np.random.randint(0, 2**31 - 1))
+    rng = np.random.default_rng(seed)
+    vol_params = None
+    if vol_model == 'gbm':
+        daily_returns = np.exp(
+            drift + stdev * rng.normal(0, 1, (forecast_days, n_paths))
+        )
+    else:
+        # 변동성 파라미터는 전체 기간(1928~)으로 적합, 드리프트는 선택 기간 평균
+        vol_params = fit_volatility_model(full_series, vol_model)
+        print(f"   {vol_model.upper()}: alpha={vol_params['alpha']:.4f}, "
+              f"beta={vol_params['beta']:.4f}, "
+              f"현재 변동성={np.sqrt(vol_params['current_var']):.6f}")
+        daily_returns = simulate_volatility_paths(
+            vol_params, log_returns.mean(), forecast_days, n_paths, rng
+        )
+    
+    price_list = np.zeros_like(daily_returns)
+    price_list[0] = S0
+    for t in range(1, forecast_days):
+        price_list[t] = price_list[t - 1] * daily_returns[t]
+    
+    # 최종 수익률 계산
+    final_prices = price_list[-1]
+    sim_returns_pct = ((final_prices - S0) / S0) * 100
+    
+    # 최종 분포 통계 및 일별 분위수 밴드
+    terminal_density = None
+    if method == 'analytic':
+        terminal_stats, terminal_density = gbm_terminal_stats(drift, stdev, forecast_days - 1)
+        percentile_bands = gbm_percentile_bands(drift, stdev, forecast_days)
+        print(f"✅ 정확해 계산 완료 (배경 경로 {n_paths}개)")
+    else:
+        terminal_stats = summarize_terminal_returns(sim_returns_pct)
+        percentile_bands = compute_percentile_bands(price_list, S0)
+        print(f"✅ 시뮬레이션 완료 ({iterations}회)")
+    
+    # 경로 의존 리스크 지표 (analytic 모드: VaR/CVaR / 도달 확률은 정확해, 경로 표본 추가 생성 없음.
+    # 최대 낙폭 / 회복 기간 분포는 배경 경로 n_paths개로 근사)
+    path_risk = compute_path_risk_metrics(price_list, S0, cvar_levels, touch_levels)
+    path_risk["closed_form"] = method == 'analytic'
+    if method == 'analytic':
+        path_risk["var"], path_risk["cvar"] = gbm_tail_risk(drift, stdev, forecast_days - 1, cvar_levels)
+        path_risk["touch_prob"] = gbm_touch_probability(drift, stdev, forecast_days - 1, touch_levels)
+    print(f"   최대 낙폭 중윗값: {path_risk['max_drawdown_stats']['median']:.1f}% "
+          f"({path_risk['n_paths']}개 경로)")
+    
+    # 3. 역사적 선행 수익률 조건부 분포 (현재 확장 창 백분위 구간, rank_mode와 무관)
+    forward_returns = None
+    if len(full_series) >= 2 * forecast_days + 1:
+        forward_index = get_forward_return_index(full_series, forecast_days)
+        forward_returns = forward_index.lookup()
+        summary = forward_returns["summary"]
+        print(f"   선행 수익률 구간 (확장 창 백분위): {forward_returns['range'][0]:.0f}~{forward_returns['range'][1]:.0f}% "
+              f"({summary['count']}개 표본)")
+    
+    # 반환 전 데이터 검증
+    print(f"\n🔍 반환 데이터 검증:")
+    print(f"   rank_ts 타입: {type(rank_ts)}")
+    print(f"   rank_ts 길이: {len(rank_ts)}")
+    
+    result = {
+        "current_price": S0,
+        "price_list": price_list,
+        "returns_pct": sim_returns_pct,
+        "terminal_stats": terminal_stats,
+        "terminal_density": terminal_density,
+        "percentile_bands": percentile_bands,
+        "forward_returns": forward_returns,
+        "path_risk": path_risk,
+        "days": forecast_days,
+        "percentile": float(rank_ts.iloc[-1]) if len(rank_ts) > 0 else 50.0,
+        "rank_ts": rank_ts,
+        "rank_mode": rank_mode,
+        "vol_model": vol_model,
+        "vol_params": vol_params,
+        "method": method,
+        "seed": seed
+    }
+    
+    print(f"   result['rank_ts'] 타입: {type(result['rank_ts'])}")
+    print(f"   result['rank_ts'] 샘플 (처음 3개): {result['rank_ts'].head(3).tolist()}")
+    
+    return result
@@ -0,0 +1,98 @@
+"""
+경로 의존 리스크 지표 엔진
+- 최대 낙폭(MDD) 분포, CVaR(기대 손실), -X% 도달 확률, 회복 기간, 수면 아래 기간
+- 경로 행렬을 열(반복) 구간 단위로 처리해 전체 경로 행렬의 두 번째 사본을 만들지 않음
+"""
+import numpy as np
+
+DEFAULT_CVAR_LEVELS = (95, 99)
+DEFAULT_TOUCH_LEVELS = (-10, -20, -30)
+
+def tail_risk(returns_pct, levels=DEFAULT_CVAR_LEVELS):
+    """
+    최종 수익률의 VaR / CVaR(기대 손실)을 계산합니다.
+
+    Args:
+        returns_pct: 최종 수익률 배열 (%)
+        levels: 신뢰 수준 (예: 95 -> 하위 5%)
+
+    Returns:
+        tuple: ({수준: VaR}, {수준: CVaR})
+    """
+    returns_pct = np.asarray(returns_pct)
+    var, cvar = {}, {}
+    for level in levels:
+        q = np.percentile(returns_pct, 100 - level)
+        var[level] = float(q)
+        cvar[level] = float(returns_pct[returns_pct <= q].mean())
+    return var, cvar
+
+def _chunk_path_metrics(paths, S0, rows):
+    """
+    경로 구간 (days, chunk)의 경로별 최대 낙폭 / 최저 수익률 / 회복 기간 / 수면 아래 일수.
+    """
+    cols = np.arange(paths.shape[1])
+    running_max = np.maximum.accumulate(paths, axis=0)
+    drawdown = paths / running_max - 1
+
+    trough = drawdown.argmin(axis=0)
+    max_drawdown = drawdown[trough, cols] * 100
+    min_return = (paths.min(axis=0) / S0 - 1) * 100
+    underwater_days = np.count_nonzero(drawdown < 0, axis=0)
+
+    # 최대 낙폭 저점 이후 직전 고점을 다시 넘는 첫 날까지의 일수
+    peak = running_max[trough, cols]
+    recovered = (paths >= peak) & (rows > trough)
+    has_recovered = recovered.any(axis=0)
+    recovery_days = np.where(has_recovered, recovered.argmax(axis=0) - trough, np.nan)
+    recovery_days[max_drawdown == 0] = 0
+    return max_drawdown, min_return, recovery_days, underwater_days
+
+def _summarize_path_metrics(max_drawdown, min_return, recovery_days, underwater_days, returns_pct, days,
+                            cvar_levels, touch_levels):
+    var, cvar = tail_risk(returns_pct, cvar_levels)
+    recovered_mask = ~np.isnan(recovery_days)
+
+    return {
+        "n_paths": len(max_drawdown),
+        "max_drawdown": max_drawdown,
+        "max_drawdown_stats": {
+            "mean": float(max_drawdown.mean()),
+            "median": float(np.median(max_drawdown)),
+            "p5": float(np.percentile(max_drawdown, 5))
+        },
+        "var": var,
+        "cvar": cvar,
+        "touch_prob": {level: float(np.mean(min_return <= level) * 100) for level in touch_levels},
+        "recovered_pct": float(recovered_mask.mean() * 100),
+        "median_recovery_days": float(np.median(recovery_days[recovered_mask])) if recovered_mask.any() else None,
+        "mean_underwater_pct": float(underwater_days.mean() / days * 100)
+    }
+
+def compute_path_risk_metrics(price_list, S0, cvar_levels=DEFAULT_CVAR_LEVELS,
+                              touch_levels=DEFAULT_TOUCH_LEVELS, chunk_size=1000):
+    """
+    시뮬레이션 경로 전체에 대해 경로 의존 리스크 지표를 계산합니다.
+
+    Args:
+        price_list: 가격 경로 (days, iterations), 0행 = S0
+        S0: 시작 가격
+        cvar_levels: CVaR 신뢰 수준
+        touch_levels: 도달 확률을 계산할 수익률 수준 (%)
+        chunk_size: 한 번에 처리할 경로 수 (임시 메모리 = days x chunk_size)
+
+    Returns:
+        dict: max_drawdown(경로별 %), 요약 통계, var, cvar, touch_prob, 회복/수면 아래 기간
+    """
+    days, iterations = price_list.shape
+    buffers = [np.empty(iterations) for _ in range(4)]
+    rows = np.arange(days)[:, None]
+
+    for start in range(0, iterations, chunk_size):
+        paths = price_list[:, start:start + chunk_size]
+        out = slice(start, start + paths.shape[1])
+        for buffer, values in zip(buffers, _chunk_path_metrics(paths, S0, rows)):
+            buffer[out] = values
+
+    returns_pct = (price_list[-1] / S0 - 1) * 100
+    return _summarize_path_metrics(*buffers, returns_pct, days, cvar_levels, touch_levels)
@@ -4,13 +4,15 @@
 import numpy as np
 from data import (
     load_sp500_data,
-    filter_by_date,
-    calculate_returns,
-    calculate_percentile_rank,
-    calculate_zscore
+    calculate_returns_array,
+    calculate_percentile_rank_array,
+    calculate_zscore_array,
+    PriceHistory,
+    ZSCORE_MODES
 )
 
-def run_quant_analysis(file_path, start_date, lookback=252, rank_mode='relative'):
+def run_quant_analysis(file_path, start_date, lookback=252, rank_mode='relative',
+                       zscore_mode='full', zscore_window=252):
     """
     퀀트 리스크 지표 분석을 실행합니다.
     
@@ -19,10 +21,16 @@ def run_quant_analysis(file_path, start_date, lookback=252, rank_mode='relative'
         start_date: 분석 시작일
         lookback: 수익률 계산 기간 (일)
         rank_mode: 'relative' (선택기간 상대순위) 또는 'absolute' (전체기간 절대순위)
+        zscore_mode: 'full' (선택기간 전체 기준), 'rolling' (이동 창), 'expanding' (확장 창)
+        zscore_window: rolling 모드의 창 길이 (일)
     
     Returns:
         dict: 분석 결과 딕셔너리
     """
+    if zscore_mode not in ZSCORE_MODES:
+        print(f"❌ 지원하지 않는 Z-score 모드: {zscore_mode}")
+        return None
+    
     try:
         # 데이터 로드 (하이브리드)
         print(f"\n📊 Tab 2 데이터 로딩 중...")
@@ -32,47 +40,84 @@ def run_quant_analysis(file_path, start_date, lookback=252, rank_mode='relative'
         full_series = load_sp500_data(file_path)
         print(f"   전체 데이터: {len(full_series)}일")
         
-        series = filter_by_date(full_series, start_date)
-        print(f"   선택 데이터: {len(series)}일")
-        
-        # 데이터 충분성 검증
-        if len(series) < lookback + 1:
-            print(f"❌ 데이터 부족: {len(series)}일 < 필요: {lookback + 1}일")
-            return None
-        
-        # 수익률 계산
-        returns = calculate_returns(series, lookback)
-        print(f"   수익률 계산: {len(returns)}개")
-        
-        if len(returns) == 0:
-            print("❌ 수익률 계산 결과가 비어있습니다.")
-            return None
-        
-        # 백분위 순위 계산 (모드에 따라)
-        if rank_mode == 'absolute':
-            full_returns = calculate_returns(full_series, lookback)
-            percentile = calculate_percentile_rank(returns, mode='absolute', full_returns=full_returns)
-        else:
-            percentile = calculate_percentile_rank(returns, mode='relative')
-        
-        # Z-score 계산
-        z_score = calculate_zscore(returns)
-        
-        # 복합 지수 계산 (백분위 + 정규화된 Z-score의 평균)
-        z_scaled = (z_score.clip(-3, 3) + 3) / 6 * 100
-        composite_idx = (percentile + z_scaled) / 2
-        
-        return {
-            "percentile": percentile,
-            "z_score": z_score,
-            "composite_idx": composite_idx,
-            "lookback": lookback,
-            "current_val": composite_idx.iloc[-1],
-            "rank_mode": rank_mode
-        }
+        return compute_quant_metrics(full_series, start_date, lookback, rank_mode,
+                                     zscore_mode, zscore_window)
         
     except Exception as e:
         print(f"Error in quant_metrics.py: {e}")
         import traceback
         traceback.print_exc()
         return None
+
+def compute_quant_metrics(full_series, start_date, lookback=252, rank_mode='relative',
+                          zscore_mode='full', zscore_window=252):
+    """
+    이미 로드된 전체 시계열로 퀀트 리스크 지표를 계산합니다.
+    
+    백분위 순위는 사후(in-sample) 값입니다: 'relative'는 선택 기간 전체, 'absolute'는 전체 기간
+    분포 기준이라 과거 시점의 값에도 그 이후 수익률이 반영됩니다. 따라서 백분위와 이를 포함한
+    복합 지수의 과거 구간은 당시 신호가 아니며 (Z-score 'rolling' / 'expanding'만 시점 기준),
+    마지막 값(current_val)만 현재 시점 기준입니다. 시점 기준 지표는 backtest.causal_readings 참고.
+    
+    Args:
+        full_series: 전체 기간 가격 시계열
+        start_date: 분석 시작일
+        lookback: 수익률 계산 기간 (일)
+        rank_mode: 'relative' 또는 'absolute'
+        zscore_mode: 'full', 'rolling', 'expanding'
+        zscore_window: rolling 모드의 창 길이 (일)
+    
+    Returns:
+        dict: 분석 결과 딕셔너리 (데이터 부족 시 None)
+    """
+    # 배열 기반 계산 (pandas 변환은 반환 시점에만)
+    prices = PriceHistory.from_series(full_series)
+    series = prices.from_date(start_date)
+    print(f"   선택 데이터: {len(series)}일")
+    
+    # 데이터 충분성 검증
+    if len(series) < lookback + 1:
+        print(f"❌ 데이터 부족: {len(series)}일 < 필요: {lookback + 1}일")
+        return None
+    
+    # 수익률 계산
+    returns = calculate_returns_array(series, lookback)
+    print(f"   수익률 계산: {len(returns)}개")
+    
+    if len(returns) == 0:
+        print("❌ 수익률 계산 결과가 비어있습니다.")
+        return None
+    
+    # 백분위 순위 계산 (모드에 따라)
+    full_returns = None
+    if rank_mode == 'absolute':
+        full_returns = calculate_returns_array(prices, lookback)
+        percentile = calculate_percentile_rank_array(returns, full_returns)
+    else:
+        percentile = calculate_percentile_rank_array(returns)
+    
+    # Z-score 계산
+    if zscore_mode == 'full':
+        z_score = calculate_zscore_array(returns)
+    else:
+        # 이동/확장 창은 시작일 이전 데이터부터 누적해 과거 시점 정보만 사용 (look-ahead 없음)
+        if full_returns is None:
+            full_returns = calculate_returns_array(prices, lookback)
+        z_score = calculate_zscore_array(full_returns, mode=zscore_mode, window=zscore_window)
+        # 선택 기간 수익률은 전체 수익률의 끝부분과 같은 위치 -> 위치 슬라이스 (재정렬 없음)
+        z_score = z_score[len(full_returns) - len(returns):]
+    
+    # 복합 지수 계산 (백분위 + 정규화된 Z-score의 평균)
+    z_scaled = (np.clip(z_score.values, -3, 3) + 3) / 6 * 100
+    composite_idx = (percentile.values + z_scaled) / 2
+    
+    return {
+        "percentile": percentile.to_series(),
+        "z_score": z_score.to_series(),
+        "composite_idx": returns.to_series(composite_idx),
+        "lookback": lookback,
+        "current_val": float(composite_idx[-1]),
+        "rank_mode": rank_mode,
+        "zscore_mode": zscore_mode,
+        "zscore_window": zscore_window
+    }
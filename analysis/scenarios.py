@@ -0,0 +1,134 @@
+"""
+역사적 스트레스 시나리오 재현 엔진
+- "1929/1987/2008/2020이 오늘 시작된다면?"을 현재 가격(S0)에 적용
+- 모든 과거 구간(forecast_days 길이)을 로그 가격 배열의 무복사 슬라이딩 뷰로 인덱싱
+- 결과는 몬테카를로와 같은 분위수/분포 요약 경로로 처리 (같은 차트 사용 가능)
+"""
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from data import load_sp500_data, get_trading_calendar
+from .summary import BAND_PERCENTILES, summarize_terminal_returns
+
+# 위기 직전 고점 기준 시작일
+NAMED_SCENARIOS = {
+    "1929 대공황": "1929-09-16",
+    "1987 블랙먼데이": "1987-08-25",
+    "2008 금융위기": "2007-10-09",
+    "2020 코로나": "2020-02-19"
+}
+
+def scenario_windows(log_prices, forecast_days):
+    """
+    모든 과거 구간의 로그 가격 창을 무복사 뷰로 반환합니다.
+
+    Args:
+        log_prices: 로그 가격 배열 (n,)
+        forecast_days: 구간 길이 (0행 = 시작일)
+
+    Returns:
+        np.ndarray: (n - forecast_days + 1, forecast_days) 읽기 전용 뷰
+    """
+    return sliding_window_view(log_prices, forecast_days)
+
+def _replay_bands(windows, chunk=32):
+    """
+    모든 구간의 일별 분위수 밴드를 열 구간 단위로 계산합니다 (임시 메모리 = 구간 수 x chunk).
+    """
+    days = windows.shape[1]
+    bands = np.empty((len(BAND_PERCENTILES), days))
+    base = windows[:, :1]
+    for k in range(0, days, chunk):
+        cum_log = windows[:, k:k + chunk] - base
+        bands[:, k:k + chunk] = np.percentile(cum_log, BAND_PERCENTILES, axis=0)
+    bands = (np.exp(bands) - 1) * 100
+    return dict(zip(BAND_PERCENTILES, bands))
+
+def replay_scenarios(full_series, forecast_days=252, sample_paths=100, named=None):
+    """
+    과거 모든 구간과 주요 위기 구간을 현재 가격에 적용합니다.
+
+    Args:
+        full_series: 전체 기간 가격 시계열
+        forecast_days: 구간 길이 (일)
+        sample_paths: 배경 시나리오로 표시할 구간 수 (등간격 표본)
+        named: {이름: 시작일} 주요 위기 (기본: NAMED_SCENARIOS)
+
+    Returns:
+        dict: 몬테카를로 결과와 같은 키(current_price, price_list, returns_pct,
+              terminal_stats, percentile_bands, days) + named_scenarios, n_windows
+    """
+    if named is None:
+        named = NAMED_SCENARIOS
+
+    calendar = get_trading_calendar(full_series)
+    closes = calendar.closes
+    if len(closes) < forecast_days + 1:
+        return None
+
+    S0 = float(closes[-1])
+    log_prices = np.log(closes)
+    windows = scenario_windows(log_prices, forecast_days)
+
+    # 1. 전체 구간 최종 수익률 (창의 첫/마지막 열만 읽음)
+    terminal_log = windows[:, -1] - windows[:, 0]
+    returns_pct = (np.exp(terminal_log) - 1) * 100
+
+    # 2. 배경 시나리오: 등간격 표본 구간만 경로로 생성
+    sample_idx = np.linspace(0, len(windows) - 1, min(sample_paths, len(windows))).astype(int)
+    price_list = S0 * np.exp(windows[sample_idx] - windows[sample_idx, :1]).T
+
+    # 3. 주요 위기 구간
+    named_results = {}
+    for name, start in named.items():
+        pos = calendar.position(start)
+        if pos >= len(windows):
+            continue
+        path = S0 * np.exp(windows[pos] - windows[pos, 0])
+        named_results[name] = {
+            "start": calendar.date_at(pos),
+            "path": path,
+            "return_pct": float((path[-1] / S0 - 1) * 100),
+            "max_drawdown": float((path / np.maximum.accumulate(path) - 1).min() * 100),
+            "trough_price": float(path.min())
+        }
+
+    return {
+        "current_price": S0,
+        "price_list": price_list,
+        "returns_pct": returns_pct,
+        "terminal_stats": summarize_terminal_returns(returns_pct),
+        "percentile_bands": _replay_bands(windows),
+        "days": forecast_days,
+        "named_scenarios": named_results,
+        "n_windows": len(windows)
+    }
+
+def run_scenario_analysis(file_path, forecast_days=252, sample_paths=100):
+    """
+    역사적 스트레스 시나리오 분석을 실행합니다.
+
+    Args:
+        file_path: CSV 파일 경로
+        forecast_days: 구간 길이 (일)
+        sample_paths: 배경 시나리오 경로 수
+
+    Returns:
+        dict: 분석 결과 딕셔너리
+    """
+    try:
+        print(f"\n🧨 스트레스 시나리오 재현 중... (구간: {forecast_days}일)")
+        full_series = load_sp500_data(file_path)
+
+        result = replay_scenarios(full_series, forecast_days, sample_paths)
+        if result is None:
+            print(f"❌ 데이터 부족: {len(full_series)}일 < 필요: {forecast_days + 1}일")
+            return None
+
+        print(f"✅ {result['n_windows']}개 구간 재현 완료 (현재 가격: ${result['current_price']:.2f})")
+        return result
+
+    except Exception as e:
+        print(f"\n❌ Error in scenarios.py: {e}")
+        import traceback
+        traceback.print_exc()
+        return None
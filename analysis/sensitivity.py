@@ -0,0 +1,167 @@
+"""
+분석 기간 x 시작일 민감도 표면
+- 여러 분석 기간(horizon)과 시작일 조합의 현재 백분위 / Z-score / 복합 지수를 한 번에 계산
+- 기간별 수익률 행렬 (기간, 날짜) 하나에서 시작일 축은 뒤쪽 누적합(suffix sum) 조회로 처리
+  · 상대순위: (수익률 < 현재 수익률) 지표의 뒤쪽 누적합 = 시작일별 하위 개수
+  · Z-score (full): 현재 수익률 기준 중심화 값과 제곱의 뒤쪽 누적합 = 시작일별 평균 / 분산
+  · 절대순위: 기간별 전체 수익률 정렬 배열 이진 탐색 (시작일과 무관)
+- 요청별 파이프라인(compute_quant_metrics)을 반복 호출하지 않음
+"""
+import time
+import numpy as np
+from data import (
+    load_sp500_data,
+    get_trading_calendar,
+    PriceHistory,
+    calculate_returns_array,
+    calculate_zscore_array
+)
+
+SENSITIVITY_METRICS = ('percentile', 'z_score', 'composite')
+
+def default_horizons(n=50, lo=20, hi=1000):
+    """
+    기본 분석 기간 격자 (lo~hi 사이 n개, 정수).
+    """
+    return np.unique(np.linspace(lo, hi, n).astype(int))
+
+def default_start_positions(calendar, max_horizon, n=50):
+    """
+    기본 시작일 격자: 전체 기간에서 가장 긴 분석 기간이 가능한 범위까지 등간격 n개 (위치).
+    """
+    last = len(calendar) - max_horizon - 2
+    return np.unique(np.linspace(0, max(last, 0), n).astype(int))
+
+def _suffix_sums_at(matrix, starts):
+    """
+    행별 뒤쪽 누적합을 시작 위치에서만 구합니다: out[:, j] = matrix[:, starts[j]:].sum(axis=1).
+
+    시작 위치 사이 구간합(reduceat) 후 시작일 축으로 역누적 (전체 누적합 행렬을 만들지 않음).
+
+    Args:
+        matrix: (H, n) 배열
+        starts: 오름차순 고유 위치 (S,)
+    """
+    segments = np.add.reduceat(matrix, starts, axis=1)
+    return np.cumsum(segments[:, ::-1], axis=1)[:, ::-1]
+
+def compute_sensitivity_surface(full_series, horizons=None, start_dates=None, rank_mode='relative',
+                                zscore_mode='full', zscore_window=252, n_starts=50):
+    """
+    분석 기간 x 시작일 격자의 현재 지표를 한 번에 계산합니다.
+
+    각 칸은 compute_quant_metrics(full_series, 시작일, 기간, ...)의 마지막 값과 같습니다.
+
+    Args:
+        full_series: 전체 기간 가격 시계열
+        horizons: 분석 기간 배열 (기본: 20~1000일 50개)
+        start_dates: 시작일 목록 (기본: 전체 기간 등간격 50개)
+        rank_mode: 'relative' 또는 'absolute'
+        zscore_mode: 'full', 'rolling', 'expanding'
+        zscore_window: rolling 모드의 창 길이 (일)
+        n_starts: start_dates가 None일 때 기본 시작일 개수
+
+    Returns:
+        dict: horizons (H,), start_dates (S,), percentile / z_score / composite / n_obs (H, S)
+              데이터가 부족한 칸은 NaN
+    """
+    calendar = get_trading_calendar(full_series)
+    closes = calendar.closes
+    n = len(closes)
+
+    horizons = default_horizons() if horizons is None else np.asarray(horizons, dtype=int)
+    horizons = horizons[(horizons >= 1) & (horizons < n)]
+    if start_dates is None:
+        starts = default_start_positions(calendar, horizons.max(), n_starts)
+    else:
+        starts = np.unique(calendar.positions(start_dates))
+        starts = starts[starts < n]
+
+    # 1. 기간별 수익률 행렬 R[i, k] = C[k + h_i] / C[k] - 1 (범위 밖은 NaN)
+    H = len(horizons)
+    returns = np.full((H, n), np.nan)
+    for i, h in enumerate(horizons):
+        np.divide(closes[h:], closes[:-h], out=returns[i, :n - h])
+    returns -= 1
+    current = returns[np.arange(H), n - 1 - horizons]
+
+    # 시작일 위치 p에서 선택되는 수익률 = R[i, p:] 중 유효한 값 (개수 n - h - p)
+    n_obs = (n - horizons)[:, None] - starts[None, :]
+    valid = n_obs >= 1
+
+    # 2. 백분위
+    if rank_mode == 'absolute':
+        percentile = np.empty((H, len(starts)))
+        for i, h in enumerate(horizons):
+            full = np.sort(returns[i, :n - h])
+            percentile[i] = np.searchsorted(full, current[i]) / len(full) * 100
+    else:
+        below = _suffix_sums_at((returns < current[:, None]).astype(float), starts)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            percentile = below / n_obs * 100
+
+    # 3. Z-score
+    if zscore_mode == 'full':
+        # 현재 수익률 기준 중심화 (상쇄 오차 감소): mean - c = S1 / n, var = (S2 - S1^2 / n) / (n - 1)
+        centered = np.nan_to_num(returns - current[:, None])
+        s1 = _suffix_sums_at(centered, starts)
+        s2 = _suffix_sums_at(centered * centered, starts)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            offset = s1 / n_obs
+            var = np.maximum(s2 - s1 * offset, 0.0) / (n_obs - 1)
+            z_score = -offset / np.sqrt(var)
+        z_score[n_obs < 2] = np.nan
+    else:
+        # 이동/확장 창은 전체 수익률 기준 -> 현재 값은 시작일과 무관
+        prices = PriceHistory.from_series(full_series)
+        last_z = np.array([calculate_zscore_array(calculate_returns_array(prices, h), zscore_mode,
+                                                  zscore_window).values[-1] for h in horizons])
+        z_score = np.repeat(last_z[:, None], len(starts), axis=1)
+
+    # 4. 복합 지수
+    z_scaled = (np.clip(z_score, -3, 3) + 3) / 6 * 100
+    composite = (percentile + z_scaled) / 2
+
+    for grid in (percentile, z_score, composite):
+        grid[~valid] = np.nan
+
+    return {
+        "horizons": horizons,
+        "start_dates": calendar.index[starts],
+        "percentile": percentile,
+        "z_score": z_score,
+        "composite": composite,
+        "n_obs": np.where(valid, n_obs, 0),
+        "rank_mode": rank_mode,
+        "zscore_mode": zscore_mode,
+        "zscore_window": zscore_window
+    }
+
+def run_sensitivity_analysis(file_path, horizons=None, start_dates=None, rank_mode='relative',
+                             zscore_mode='full', zscore_window=252, n_starts=50):
+    """
+    민감도 표면 분석을 실행합니다.
+
+    Args:
+        file_path: CSV 파일 경로
+        horizons ~ n_starts: compute_sensitivity_surface와 동일
+
+    Returns:
+        dict: 분석 결과 딕셔너리
+    """
+    try:
+        print(f"\n🧭 민감도 표면 계산 중...")
+        full_series = load_sp500_data(file_path)
+
+        t0 = time.perf_counter()
+        result = compute_sensitivity_surface(full_series, horizons, start_dates, rank_mode,
+                                             zscore_mode, zscore_window, n_starts)
+        shape = result["composite"].shape
+        print(f"✅ {shape[0]}개 기간 x {shape[1]}개 시작일: {time.perf_counter() - t0:.3f}s")
+        return result
+
+    except Exception as e:
+        print(f"\n❌ Error in sensitivity.py: {e}")
+        import traceback
+        traceback.print_exc()
+        return None
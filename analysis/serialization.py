@@ -0,0 +1,220 @@
+"""
+분석 결과 저장 / 불러오기 모듈 (Arrow IPC / Parquet)
+- 결과 딕셔너리 -> 1행 테이블 (배열마다 list 열, 스칼라는 스키마 메타데이터)
+- Arrow IPC 파일: 비압축, 메모리 맵으로 읽으면 배열이 파일 매핑을 직접 참조 (재계산 / 복사 없음)
+- Parquet: 압축 보관용
+- pyarrow는 저장 / 불러오기 시점에만 가져옴 (분석 엔진은 pyarrow 없이 동작)
+"""
+import os
+import json
+import numpy as np
+import pandas as pd
+
+RESULT_FORMATS = ('arrow', 'parquet')
+_FORMAT_VERSION = "1"
+_MAGIC = {b"ARROW1": 'arrow', b"PAR1": 'parquet'}
+
+def _pyarrow():
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ImportError("결과 저장/불러오기에는 pyarrow가 필요합니다 (pip install pyarrow).")
+    return pa
+
+def _to_scalar(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    if isinstance(value, tuple):
+        return [_to_scalar(v) for v in value]
+    return value
+
+def _restore_key(key):
+    return int(key) if key.lstrip('-').isdigit() else key
+
+def flatten_result(result, prefix=""):
+    """
+    중첩 결과 딕셔너리를 메타데이터와 배열로 분리합니다.
+
+    배열 키는 '.'으로 연결한 경로 (예: 'path_risk.max_drawdown'), pandas Series는
+    값 배열과 '<키>.index' 인덱스 배열로 나눕니다.
+
+    Args:
+        result: 분석 결과 딕셔너리
+        prefix: 키 접두사 (재귀용)
+
+    Returns:
+        tuple: (meta dict, {경로: np.ndarray})
+    """
+    meta, arrays = {}, {}
+    for key, value in result.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, pd.Series):
+            arrays[path] = value.to_numpy()
+            arrays[f"{path}.index"] = value.index.to_numpy()
+        elif isinstance(value, np.ndarray):
+            arrays[path] = value
+        elif isinstance(value, dict):
+            sub_meta, sub_arrays = flatten_result(value, f"{path}.")
+            meta[str(key)] = sub_meta
+            arrays.update(sub_arrays)
+        else:
+            meta[str(key)] = _to_scalar(value)
+    return meta, arrays
+
+def unflatten_result(meta, arrays):
+    """
+    flatten_result의 역변환 (정수 딕셔너리 키 복원, 튜플은 리스트로 반환).
+
+    Args:
+        meta: 메타데이터 dict
+        arrays: {경로: np.ndarray}
+
+    Returns:
+        dict: 결과 딕셔너리
+    """
+    def restore(node):
+        if isinstance(node, dict):
+            return {_restore_key(k): restore(v) for k, v in node.items()}
+        return node
+
+    result = restore(meta)
+    for path, values in arrays.items():
+        if path.endswith(".index") and path[:-len(".index")] in arrays:
+            continue
+        index = arrays.get(f"{path}.index")
+        if index is not None:
+            values = pd.Series(values, index=pd.Index(index), copy=False)
+
+        *parents, name = path.split(".")
+        node = result
+        for part in parents:
+            node = node.setdefault(_restore_key(part), {})
+        node[_restore_key(name)] = values
+    return result
+
+def result_to_table(result):
+    """
+    결과 딕셔너리를 1행 Arrow 테이블로 변환합니다 (배열 데이터 복사 없음).
+
+    Returns:
+        pyarrow.Table: 배열별 large_list 열 + 스키마 메타데이터 (meta, shapes)
+    """
+    pa = _pyarrow()
+    meta, arrays = flatten_result(result)
+
+    columns, shapes = {}, {}
+    for key, values in arrays.items():
+        flat = np.ascontiguousarray(values).reshape(-1)
+        offsets = pa.array(np.array([0, len(flat)], dtype=np.int64))
+        columns[key] = pa.LargeListArray.from_arrays(offsets, pa.array(flat))
+        shapes[key] = list(values.shape)
+
+    schema_meta = {"format_version": _FORMAT_VERSION,
+                   "meta": json.dumps(meta, ensure_ascii=False),
+                   "shapes": json.dumps(shapes)}
+    return pa.table(columns).replace_schema_metadata(schema_meta)
+
+def table_to_result(table):
+    """
+    result_to_table의 역변환. 메모리 맵 / 버퍼 기반 테이블이면 배열은 그 메모리를 그대로 참조합니다.
+
+    Returns:
+        dict: 결과 딕셔너리 (배열은 읽기 전용일 수 있음)
+    """
+    schema_meta = table.schema.metadata
+    meta = json.loads(schema_meta[b"meta"])
+    shapes = json.loads(schema_meta[b"shapes"])
+
+    arrays = {}
+    for key in table.column_names:
+        column = table.column(key)
+        column = column.chunk(0) if column.num_chunks == 1 else column.combine_chunks()
+        values = column.flatten().to_numpy(zero_copy_only=False)
+        arrays[key] = values.reshape(shapes[key])
+    return unflatten_result(meta, arrays)
+
+def _write(table, sink, fmt, compression):
+    pa = _pyarrow()
+    if fmt == 'arrow':
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    elif fmt == 'parquet':
+        import pyarrow.parquet as pq
+        pq.write_table(table, sink, compression=compression)
+    else:
+        raise ValueError(f"지원하지 않는 형식: {fmt}")
+
+def _detect_format(head):
+    for magic, fmt in _MAGIC.items():
+        if head.startswith(magic):
+            return fmt
+    raise ValueError("Arrow IPC 파일 또는 Parquet 형식이 아닙니다.")
+
+def save_result(result, path, fmt='arrow', compression='zstd'):
+    """
+    결과를 파일로 저장합니다.
+
+    Args:
+        result: run_monte_carlo_analysis / run_quant_analysis 결과
+        path: 저장 경로
+        fmt: 'arrow' (비압축 IPC 파일, 메모리 맵 읽기) 또는 'parquet' (압축 보관)
+        compression: Parquet 압축 방식
+
+    Returns:
+        int: 저장된 파일 크기 (bytes)
+    """
+    _write(result_to_table(result), str(path), fmt, compression)
+    return os.path.getsize(path)
+
+def load_result(path, memory_map=True):
+    """
+    저장된 결과를 불러옵니다 (형식은 파일 시그니처로 판별).
+
+    Args:
+        path: 파일 경로
+        memory_map: Arrow 파일을 메모리 맵으로 열지 여부 (배열 복사 없음)
+
+    Returns:
+        dict: 결과 딕셔너리
+    """
+    pa = _pyarrow()
+    with open(path, 'rb') as f:
+        fmt = _detect_format(f.read(6))
+
+    if fmt == 'arrow':
+        source = pa.memory_map(str(path)) if memory_map else pa.OSFile(str(path))
+        table = pa.ipc.open_file(source).read_all()
+    else:
+        import pyarrow.parquet as pq
+        table = pq.read_table(str(path), memory_map=memory_map)
+    return table_to_result(table)
+
+def serialize_result(result, fmt='arrow', compression='zstd'):
+    """
+    결과를 메모리 버퍼로 직렬화합니다 (다운로드 / 프로세스 간 전달용).
+
+    Returns:
+        pyarrow.Buffer: 직렬화된 버퍼 (버퍼 프로토콜 지원)
+    """
+    pa = _pyarrow()
+    sink = pa.BufferOutputStream()
+    _write(result_to_table(result), sink, fmt, compression)
+    return sink.getvalue()
+
+def deserialize_result(data):
+    """
+    serialize_result 버퍼(또는 bytes)를 결과로 복원합니다 (Arrow는 버퍼를 그대로 참조).
+
+    Returns:
+        dict: 결과 딕셔너리
+    """
+    pa = _pyarrow()
+    buffer = data if isinstance(data, pa.Buffer) else pa.py_buffer(data)
+    if _detect_format(buffer[:6].to_pybytes()) == 'arrow':
+        table = pa.ipc.open_file(pa.BufferReader(buffer)).read_all()
+    else:
+        import pyarrow.parquet as pq
+        table = pq.read_table(pa.BufferReader(buffer))
+    return table_to_result(table)
@@ -0,0 +1,158 @@
+"""
+시뮬레이션 결과 요약 통계 모듈
+- 최종 수익률 통계 (승률, 평균, VaR)
+- 일별 분위수 밴드
+- GBM 정확해 (최종 분포 / 분위수 밴드 / VaR·CVaR / 하락 도달 확률)
+"""
+from statistics import NormalDist
+import numpy as np
+
+BAND_PERCENTILES = (5, 25, 50, 75, 95)
+TERMINAL_QUANTILES = (1, 5, 10, 25, 50, 75, 90, 95, 99)
+
+def summarize_terminal_returns(returns_pct):
+    """
+    표본 최종 수익률로 요약 통계를 계산합니다.
+
+    Args:
+        returns_pct: 최종 수익률 배열 (%)
+
+    Returns:
+        dict: win_rate, mean, var_95, quantiles
+    """
+    returns_pct = np.asarray(returns_pct)
+    q = np.percentile(returns_pct, TERMINAL_QUANTILES)
+    return {
+        "win_rate": float(np.mean(returns_pct > 0) * 100),
+        "mean": float(np.mean(returns_pct)),
+        "var_95": float(q[TERMINAL_QUANTILES.index(5)]),
+        "quantiles": dict(zip(TERMINAL_QUANTILES, q.tolist()))
+    }
+
+def compute_percentile_bands(price_list, S0):
+    """
+    경로 행렬에서 일별 분위수 밴드를 계산합니다.
+
+    Args:
+        price_list: 가격 경로 (days, iterations)
+        S0: 시작 가격
+
+    Returns:
+        dict: {백분위: 일별 수익률 배열 (%)}
+    """
+    returns_paths = (price_list / S0 - 1) * 100
+    bands = np.percentile(returns_paths, BAND_PERCENTILES, axis=1)
+    return dict(zip(BAND_PERCENTILES, bands))
+
+def gbm_terminal_stats(drift, stdev, steps, bins=50):
+    """
+    GBM 최종 수익률 분포의 정확한 통계를 계산합니다 (표본 추출 없음).
+
+    log(S_T / S0) ~ N(drift * steps, stdev^2 * steps)
+
+    Args:
+        drift: 일간 로그 드리프트
+        stdev: 일간 로그 변동성
+        steps: 누적 일수
+        bins: 분포 히스토그램 구간 수
+
+    Returns:
+        tuple: (요약 통계 dict, 분포 구간 dict {bins, probs})
+    """
+    mu = drift * steps
+    sigma = stdev * np.sqrt(steps)
+    dist = NormalDist(mu, sigma)
+
+    def to_pct(log_ret):
+        return (np.exp(log_ret) - 1) * 100
+
+    quantiles = {p: float(to_pct(dist.inv_cdf(p / 100))) for p in TERMINAL_QUANTILES}
+    stats = {
+        "win_rate": (1 - dist.cdf(0.0)) * 100,
+        "mean": float((np.exp(mu + 0.5 * sigma ** 2) - 1) * 100),
+        "var_95": quantiles[5],
+        "quantiles": quantiles
+    }
+
+    # 0.1% ~ 99.9% 구간을 등간격으로 나눈 정확한 구간 확률
+    lo, hi = dist.inv_cdf(0.001), dist.inv_cdf(0.999)
+    edges_pct = np.linspace(to_pct(lo), to_pct(hi), bins + 1)
+    cdf = np.array([dist.cdf(x) for x in np.log1p(edges_pct / 100)])
+    density = {"bins": edges_pct, "probs": np.diff(cdf)}
+
+    return stats, density
+
+def gbm_percentile_bands(drift, stdev, days):
+    """
+    GBM 일별 분위수 밴드를 정확하게 계산합니다 (O(days)).
+
+    Args:
+        drift: 일간 로그 드리프트
+        stdev: 일간 로그 변동성
+        days: 예측 기간 (경로 행렬의 행 수, 0행 = S0)
+
+    Returns:
+        dict: {백분위: 일별 수익률 배열 (%)}
+    """
+    t = np.arange(days)
+    z = np.array([NormalDist().inv_cdf(p / 100) for p in BAND_PERCENTILES])
+    log_q = drift * t[None, :] + z[:, None] * stdev * np.sqrt(t)[None, :]
+    bands = (np.exp(log_q) - 1) * 100
+    return dict(zip(BAND_PERCENTILES, bands))
+
+def gbm_tail_risk(drift, stdev, steps, levels):
+    """
+    GBM 최종 수익률의 VaR / CVaR(기대 손실)을 정확하게 계산합니다.
+
+    E[e^X | X <= x_a] = e^(mu + sigma^2 / 2) * Phi(z_a - sigma) / a
+
+    Args:
+        drift: 일간 로그 드리프트
+        stdev: 일간 로그 변동성
+        steps: 누적 일수
+        levels: 신뢰 수준 (예: 95 -> 하위 5%)
+
+    Returns:
+        tuple: ({수준: VaR}, {수준: CVaR}) - 단위 %
+    """
+    mu = drift * steps
+    sigma = stdev * np.sqrt(steps)
+    std_normal = NormalDist()
+    var, cvar = {}, {}
+    for level in levels:
+        tail = 1 - level / 100
+        z = std_normal.inv_cdf(tail)
+        var[level] = float((np.exp(mu + sigma * z) - 1) * 100)
+        expected = np.exp(mu + 0.5 * sigma ** 2) * std_normal.cdf(z - sigma) / tail
+        cvar[level] = float((expected - 1) * 100)
+    return var, cvar
+
+# 일별 관측 보정 계수 (Broadie-Glasserman-Kou: zeta(1/2) / sqrt(2 pi))
+_BARRIER_SHIFT = 0.5826
+
+def gbm_touch_probability(drift, stdev, steps, levels):
+    """
+    GBM 경로가 기간 중 -X% 이하에 도달할 확률을 정확하게 계산합니다 (경로 표본 없음).
+
+    드리프트가 있는 브라운 운동 최솟값의 반사 원리:
+    P(min X_t <= b) = Phi((b - mu T) / (sigma sqrt(T))) + exp(2 mu b / sigma^2) Phi((b + mu T) / (sigma sqrt(T)))
+    일별 종가로만 관측하는 시뮬레이션과 맞추기 위해 경계를 0.5826 sigma만큼 낮춥니다.
+
+    Args:
+        drift: 일간 로그 드리프트
+        stdev: 일간 로그 변동성
+        steps: 누적 일수
+        levels: 수익률 수준 (%, 음수)
+
+    Returns:
+        dict: {수준: 도달 확률 (%)}
+    """
+    std_normal = NormalDist()
+    scale = stdev * np.sqrt(steps)
+    mu = drift * steps
+    prob = {}
+    for level in levels:
+        b = np.log(1 + level / 100) - _BARRIER_SHIFT * stdev
+        reflected = np.exp(min(2 * drift * b / stdev ** 2, 700.0)) * std_normal.cdf((b + mu) / scale)
+        prob[level] = float(min(std_normal.cdf((b - mu) / scale) + reflected, 1.0) * 100)
+    return prob
@@ -0,0 +1,194 @@
+"""
+변동성 모델 엔진 (EWMA / GARCH(1,1))
+- 분산 타게팅 기반 최대우도 추정 (그리드 탐색 + 확대 탐색)
+- 조건부 분산 필터는 구간(chunk) 단위 벡터 연산으로 계산 (일 단위 파이썬 루프 없음)
+- 적합 결과는 데이터 버전(내용 해시 포함)별로 캐시 (최근 버전만 유지)
+"""
+import numpy as np
+from data import calculate_log_returns, get_data_version, DataVersionCache
+
+VOL_MODELS = ('gbm', 'ewma', 'garch')
+
+# 구간 스캔 길이: beta >= _BETA_MIN 에서 beta^-L 이 float64 범위 안에 머물도록 설정
+_CHUNK = 128
+_BETA_MIN = 0.70
+_BETA_MAX = 0.999
+
+# (데이터 버전, 모델) -> 적합 파라미터
+_FIT_CACHE = DataVersionCache(8)
+
+def _ewm_scan(d, betas):
+    """
+    y_t = beta * y_{t-1} + d_t 를 여러 beta에 대해 동시에 계산합니다.
+
+    Args:
+        d: 입력 배열 (n,)
+        betas: 감쇠 계수 배열 (m,)
+
+    Returns:
+        np.ndarray: 필터 결과 (m, n)
+    """
+    d = np.asarray(d, dtype=float)
+    betas = np.atleast_1d(np.asarray(betas, dtype=float))
+    n = len(d)
+    out = np.empty((len(betas), n))
+    powers = betas[:, None] ** np.arange(_CHUNK)[None, :]
+    carry = np.zeros(len(betas))
+
+    for start in range(0, n, _CHUNK):
+        chunk = d[start:start + _CHUNK]
+        pw = powers[:, :len(chunk)]
+        # y_{o+j} = b^j * (b * carry + sum_{i<=j} b^-i * d_{o+i})
+        acc = np.cumsum(chunk[None, :] / pw, axis=1)
+        out[:, start:start + len(chunk)] = pw * (betas[:, None] * carry[:, None] + acc)
+        carry = out[:, start + len(chunk) - 1]
+
+    return out
+
+def _lagged_deviation(sq_resid, long_run_var, betas):
+    """
+    D_t = sum_k beta^k (e_{t-1-k}^2 - v) 를 계산합니다 (D_0 = 0).
+
+    분산 타게팅 하에서 조건부 분산은 sigma2_t = v + alpha * D_t 가 되므로
+    D 는 beta 에만 의존하고, alpha 축은 브로드캐스팅으로 한 번에 평가할 수 있습니다.
+    """
+    y = _ewm_scan(sq_resid - long_run_var, betas)
+    lagged = np.zeros_like(y)
+    lagged[:, 1:] = y[:, :-1]
+    return lagged
+
+def _log_likelihood(sq_resid, long_run_var, alphas, lagged_row):
+    """
+    alpha 그리드 전체에 대한 가우시안 로그우도를 계산합니다.
+
+    Returns:
+        np.ndarray: alpha별 로그우도 (len(alphas),)
+    """
+    sigma2 = long_run_var + alphas[:, None] * lagged_row[None, :]
+    sigma2 = np.maximum(sigma2, 1e-12)
+    return -0.5 * np.sum(np.log(2 * np.pi * sigma2) + sq_resid[None, :] / sigma2, axis=1)
+
+def _grid_search(sq_resid, long_run_var, model, alpha_grid, beta_grid):
+    """
+    (alpha, beta) 그리드에서 로그우도 최대점을 찾습니다.
+
+    Returns:
+        tuple: (alpha, beta, loglik)
+    """
+    best = (None, None, -np.inf)
+    lagged = _lagged_deviation(sq_resid, long_run_var, beta_grid)
+
+    for j, beta in enumerate(beta_grid):
+        if model == 'ewma':
+            alphas = np.array([1.0 - beta])
+        else:
+            alphas = alpha_grid[alpha_grid + beta < 0.9999]
+            if len(alphas) == 0:
+                continue
+        ll = _log_likelihood(sq_resid, long_run_var, alphas, lagged[j])
+        k = int(np.argmax(ll))
+        if ll[k] > best[2]:
+            best = (float(alphas[k]), float(beta), float(ll[k]))
+
+    return best
+
+def _fit(log_returns, model):
+    """
+    EWMA 또는 GARCH(1,1) 파라미터를 추정합니다.
+    """
+    resid = log_returns - log_returns.mean()
+    sq_resid = resid ** 2
+    long_run_var = float(sq_resid.mean())
+
+    # 1. 거친 그리드
+    alpha_grid = np.linspace(0.01, 0.30, 30)
+    beta_grid = np.linspace(_BETA_MIN, 0.995, 40)
+    alpha, beta, loglik = _grid_search(sq_resid, long_run_var, model, alpha_grid, beta_grid)
+
+    # 2. 최적점 주변 확대 탐색
+    a_span, b_span = 0.02, 0.015
+    for _ in range(4):
+        alpha_grid = np.clip(np.linspace(alpha - a_span, alpha + a_span, 15), 1e-4, 1.0)
+        beta_grid = np.clip(np.linspace(beta - b_span, beta + b_span, 15), _BETA_MIN, _BETA_MAX)
+        alpha, beta, loglik = _grid_search(sq_resid, long_run_var, model, alpha_grid, beta_grid)
+        a_span /= 4
+        b_span /= 4
+
+    # 3. 마지막 시점의 1일 후 조건부 분산 (현재 변동성 국면)
+    state = _ewm_scan(sq_resid - long_run_var, [beta])[0, -1]
+    current_var = long_run_var + alpha * state
+
+    return {
+        "model": model,
+        "alpha": alpha,
+        "beta": beta,
+        "omega": long_run_var * (1 - alpha - beta),
+        "long_run_var": long_run_var,
+        "current_var": float(max(current_var, 1e-12)),
+        "loglik": loglik,
+        "n_obs": len(sq_resid)
+    }
+
+def fit_volatility_model(series, model='garch'):
+    """
+    전체 가격 시계열로 변동성 모델을 적합합니다 (데이터 버전별 캐시).
+
+    Args:
+        series: 가격 시계열 (전체 기간 권장)
+        model: 'ewma' 또는 'garch'
+
+    Returns:
+        dict: 모델 파라미터 (alpha, beta, omega, long_run_var, current_var, ...)
+    """
+    if model not in ('ewma', 'garch'):
+        raise ValueError(f"지원하지 않는 변동성 모델: {model}")
+
+    return _FIT_CACHE.get((get_data_version(series), model),
+                          lambda: _fit(calculate_log_returns(series).dropna().values, model))
+
+def filter_conditional_variance(log_returns, params):
+    """
+    적합된 파라미터로 과거 조건부 분산 시계열을 계산합니다.
+
+    Args:
+        log_returns: 로그 수익률 배열
+        params: fit_volatility_model 결과
+
+    Returns:
+        np.ndarray: 조건부 분산 (log_returns와 같은 길이)
+    """
+    log_returns = np.asarray(log_returns, dtype=float)
+    sq_resid = (log_returns - log_returns.mean()) ** 2
+    lagged = _lagged_deviation(sq_resid, params["long_run_var"], [params["beta"]])[0]
+    return np.maximum(params["long_run_var"] + params["alpha"] * lagged, 1e-12)
+
+def simulate_volatility_paths(params, mean_return, forecast_days, iterations, rng=None):
+    """
+    시변 변동성 일별 수익률(배수)을 반복 횟수 축으로 배치 시뮬레이션합니다.
+
+    Args:
+        params: fit_volatility_model 결과
+        mean_return: 일간 로그 수익률 평균
+        forecast_days: 예측 기간 (일)
+        iterations: 시뮬레이션 반복 횟수
+        rng: np.random.Generator (None이면 전역 np.random)
+
+    Returns:
+        np.ndarray: 일별 수익률 배수 (forecast_days, iterations)
+    """
+    alpha = params["alpha"]
+    beta = params["beta"]
+    long_run_var = params["long_run_var"]
+
+    shocks = (np.random if rng is None else rng).normal(0, 1, (forecast_days, iterations))
+    sigma2 = np.full(iterations, params["current_var"])
+
+    # 0행은 시작 가격(S0) 자리이므로 수익률 배수 1로 둡니다
+    shocks[0] = 0.0
+    for t in range(1, forecast_days):
+        eps = np.sqrt(sigma2) * shocks[t]
+        shocks[t] = mean_return - 0.5 * sigma2 + eps
+        sigma2 = long_run_var + alpha * (eps ** 2 - long_run_var) + beta * (sigma2 - long_run_var)
+        np.maximum(sigma2, 1e-12, out=sigma2)
+
+    return np.exp(shocks, out=shocks)
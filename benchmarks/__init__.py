@@ -0,0 +1,5 @@
+"""
+성능 벤치마크 모듈 (라이브러리 코드와 분리)
+
+실행: python -m benchmarks [이름 ...]
+"""
@@ -0,0 +1,59 @@
+"""
+벤치마크 실행기
+
+실행: python -m benchmarks              # 전체
+      python -m benchmarks quant backtest   # 일부 (이름 여러 개 가능)
+      python -m benchmarks --list
+"""
+import argparse
+from . import (
+    volatility,
+    quant,
+    incremental,
+    path_risk,
+    backtest,
+    scenarios,
+    sensitivity,
+    serialization,
+    charts,
+    fetcher,
+    session_memory
+)
+
+# 이름 -> 실행할 벤치마크 함수 (기본 인자)
+BENCHMARKS = {
+    "volatility": (volatility.benchmark_volatility_models,),
+    "quant": (quant.benchmark_rolling_zscore, quant.benchmark_quant_pipeline),
+    "incremental": (incremental.benchmark_incremental_update,),
+    "path_risk": (path_risk.benchmark_path_risk,),
+    "backtest": (backtest.benchmark_backtest_grid,),
+    "scenarios": (scenarios.benchmark_scenario_replay,),
+    "sensitivity": (sensitivity.benchmark_sensitivity_surface,),
+    "serialization": (serialization.benchmark_result_io,),
+    "charts": (charts.benchmark_chart_payload,),
+    "fetcher": (fetcher.benchmark_fetcher,),
+    "session_memory": (session_memory.soak_test,)
+}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="S&P 500 분석 엔진 벤치마크")
+    parser.add_argument("names", nargs="*", help=f"실행할 벤치마크 (기본: 전체) - {', '.join(BENCHMARKS)}")
+    parser.add_argument("--list", action="store_true", help="벤치마크 목록 출력")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, funcs in BENCHMARKS.items():
+            print(f"{name}: {', '.join(f.__name__ for f in funcs)}")
+        return
+
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"알 수 없는 벤치마크: {', '.join(unknown)}")
+
+    for name in args.names or BENCHMARKS:
+        print(f"\n===== {name} =====")
+        for func in BENCHMARKS[name]:
+            func()
+
+if __name__ == "__main__":
+    main()
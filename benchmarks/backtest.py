@@ -0,0 +1,30 @@
+"""
+임계값 그리드 백테스트 벤치마크
+"""
+import time
+import numpy as np
+from data import load_sp500_data
+from analysis.backtest import run_threshold_backtest
+
+def benchmark_backtest_grid(file_path="sp500.csv", grid=100):
+    """
+    1928~현재 전체 기간에서 grid x grid 임계값 백테스트 시간을 측정합니다.
+
+    Returns:
+        dict: {seconds, best_cagr, best_entry, best_exit}
+    """
+    full_series = load_sp500_data(file_path, use_live_data=False)
+    thresholds = np.linspace(0, 100, grid)
+
+    t0 = time.perf_counter()
+    result = run_threshold_backtest(full_series, entry_thresholds=thresholds,
+                                    exit_thresholds=thresholds)
+    elapsed = time.perf_counter() - t0
+
+    i, j = np.unravel_index(np.nanargmax(result["cagr"]), result["cagr"].shape)
+    print(f"⏱️  {grid}x{grid} 그리드, {result['n_days']}일: {elapsed:.2f}s")
+    print(f"   최고 CAGR {result['cagr'][i, j]:.2f}% (진입 <= {thresholds[i]:.0f}, 청산 >= {thresholds[j]:.0f}), "
+          f"MDD {result['max_drawdown'][i, j]:.1f}%, 매수 후 보유 {result['buy_hold_cagr']:.2f}%")
+
+    return {"seconds": elapsed, "best_cagr": float(result["cagr"][i, j]),
+            "best_entry": float(thresholds[i]), "best_exit": float(thresholds[j])}
@@ -0,0 +1,56 @@
+"""
+차트 백엔드 벤치마크 (matplotlib PNG vs Plotly 페이로드)
+"""
+import io
+import time
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+from data import load_sp500_data
+from analysis import compute_monte_carlo_analysis
+from visualizations import (
+    InteractivePanel,
+    draw_simulation_chart,
+    draw_distribution_chart,
+    draw_forward_return_chart,
+    draw_risk_chart,
+    draw_percentile_chart
+)
+
+def benchmark_chart_payload(file_path="sp500.csv", start_date="2010-01-01"):
+    """
+    Tab 1 차트의 서버 렌더링(PNG) 대비 인터랙티브 페이로드 크기 / 생성 시간을 비교합니다.
+
+    Returns:
+        dict: {png_kb, png_s, plotly_kb, plotly_s}
+    """
+    full_series = load_sp500_data(file_path, use_live_data=False)
+    data = compute_monte_carlo_analysis(full_series, start_date)
+
+    def draw_all(axes):
+        draw_simulation_chart(axes[0], data)
+        draw_distribution_chart(axes[1], data)
+        draw_forward_return_chart(axes[2], data)
+        draw_risk_chart(axes[3], data)
+        draw_percentile_chart(axes[4], data, start_date=start_date, prices=full_series)
+
+    t0 = time.perf_counter()
+    fig = plt.figure(figsize=(18, 14))
+    draw_all([fig.add_subplot(s) for s in (331, 332, 333, 312, 313)])
+    fig.tight_layout()
+    png = io.BytesIO()
+    fig.savefig(png, format='png')
+    plt.close(fig)
+    png_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    panels = [InteractivePanel() for _ in range(5)]
+    draw_all(panels)
+    payload = sum(len(p.figure.to_json()) for p in panels)
+    plotly_s = time.perf_counter() - t0
+
+    print(f"🖼️  matplotlib PNG: {len(png.getvalue()) / 1024:.0f}KB, {png_s:.2f}s (옵션 변경마다 반복)")
+    print(f"   Plotly 페이로드: {payload / 1024:.0f}KB, {plotly_s:.2f}s (확대/라벨/가격 배경은 브라우저 처리)")
+
+    return {"png_kb": len(png.getvalue()) / 1024, "png_s": png_s,
+            "plotly_kb": payload / 1024, "plotly_s": plotly_s}
@@ -0,0 +1,99 @@
+"""
+실시간 데이터 수집 벤치마크 (로컬 스텁, 네트워크 불필요)
+"""
+import io
+import os
+import time
+import random
+import shutil
+import tempfile
+import contextlib
+import multiprocessing
+import numpy as np
+import pandas as pd
+from data import load_sp500_data
+from data.fetcher import (
+    SNAPSHOT_DIR,
+    LiveDataRefresher,
+    FileBackend,
+    HTTPBackend,
+    FaultInjection,
+    _parse_close_csv,
+    configure_live_data,
+    fetch_with_retry,
+    get_live_refresher,
+    serve_stub
+)
+
+def _single_flight_worker(args):
+    file_path, source, snapshot_dir, latency = args
+    refresher = LiveDataRefresher(file_path, FileBackend(source, FaultInjection(latency)), snapshot_dir)
+    return refresher.refresh(force=True)
+
+def benchmark_fetcher(file_path="sp500.csv", latency=2.0, processes=8):
+    """
+    로컬 스텁으로 요청 경로 지연 / 재시도 / 프로세스 간 단일 실행을 확인합니다 (네트워크 불필요).
+
+    - 기준 CSV를 과거 시점에서 잘라 스텁이 나머지 구간을 '실시간' 데이터로 제공
+    - 인라인 가져오기(기존 방식) 대비 스냅샷 읽기 요청 시간
+    - 실패율 50% 스텁 재시도
+    - 여러 프로세스가 동시에 갱신해도 실제 가져오기는 1회
+
+    Returns:
+        dict: {inline_s, snapshot_request_s, retry_attempts, fetches, http_s}
+    """
+    full = _parse_close_csv(file_path)
+    work_dir = tempfile.mkdtemp(prefix="sp500_fetcher_")
+    base_path = os.path.join(work_dir, "base.csv")
+    full.iloc[:-150].rename('Close').rename_axis('Date').to_csv(base_path)
+    snapshot_dir = os.path.join(work_dir, SNAPSHOT_DIR)
+
+    # 1. 기존 방식: 요청마다 느린 업스트림을 인라인 호출
+    slow = FileBackend(file_path, FaultInjection(latency))
+    t0 = time.perf_counter()
+    slow.fetch((full.index[-151] + pd.Timedelta(days=1)).strftime('%Y-%m-%d'))
+    inline = time.perf_counter() - t0
+
+    # 2. 스냅샷 방식: 백그라운드 갱신 후 요청은 스냅샷만 읽음
+    configure_live_data(backend=slow, snapshot_dir=snapshot_dir)
+    with contextlib.redirect_stdout(io.StringIO()):
+        t0 = time.perf_counter()
+        first = load_sp500_data(base_path)        # 스냅샷 없음 -> CSV만, 갱신 시작
+        cold = time.perf_counter() - t0
+        get_live_refresher(base_path).wait()
+        t0 = time.perf_counter()
+        warm = load_sp500_data(base_path)
+        warm_s = time.perf_counter() - t0
+    print(f"⏱️  요청 경로 (업스트림 지연 {latency:.1f}s): 인라인 {inline:.3f}s / "
+          f"스냅샷 없음 {cold:.3f}s ({len(first)}개) / 스냅샷 {warm_s:.3f}s ({len(warm)}개)")
+    assert warm.index.equals(full.index) and np.allclose(warm.values, full.values, rtol=1e-14, atol=0)
+
+    # 3. 실패율 50% 재시도
+    flaky = FileBackend(file_path, FaultInjection(0.01, failure_rate=0.5, seed=4))
+    with contextlib.redirect_stdout(io.StringIO()):
+        _, attempts = fetch_with_retry(flaky, "2025-01-01", base_delay=0.05, rng=random.Random(0))
+    print(f"🔁 실패율 50% 스텁: {attempts}회 시도 후 성공")
+
+    # 4. 프로세스 간 단일 실행
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Pool(processes) as pool:
+        fetched = pool.map(_single_flight_worker,
+                           [(base_path, file_path, snapshot_dir, 1.0)] * processes)
+    print(f"🔒 {processes}개 프로세스 동시 갱신: 실제 가져오기 {sum(fetched)}회")
+
+    # 5. 풀링 HTTP 백엔드 + 로컬 HTTP 스텁
+    server = serve_stub(file_path, faults=FaultInjection(0.005))
+    host, port = server.server_address
+    backend = HTTPBackend(f"http://{host}:{port}/history")
+    t0 = time.perf_counter()
+    for _ in range(20):
+        series = backend.fetch("2025-06-01")
+    http_s = (time.perf_counter() - t0) / 20
+    backend.close()
+    server.shutdown()
+    print(f"🌐 HTTP 스텁 (연결 재사용): 요청당 {http_s * 1000:.1f}ms, {len(series)}개")
+
+    configure_live_data()
+    shutil.rmtree(work_dir, ignore_errors=True)
+    return {"inline_s": inline, "snapshot_request_s": warm_s, "retry_attempts": attempts,
+            "fetches": sum(fetched), "http_s": http_s}
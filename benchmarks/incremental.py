@@ -0,0 +1,35 @@
+"""
+증분 업데이트 벤치마크 (동치성은 tests/test_incremental.py에서 검증)
+"""
+import io
+import time
+import contextlib
+from data import load_sp500_data
+from analysis.incremental import IncrementalQuantState
+from analysis.quant_metrics import compute_quant_metrics
+
+def benchmark_incremental_update(file_path="sp500.csv", start_date="2010-01-01", holdout=20, lookback=252):
+    """
+    새 종가 1개 추가 시간을 전체 재계산과 비교합니다 (동치성은 tests/test_incremental.py에서 검증).
+
+    Returns:
+        dict: {append_ms, recompute_ms}
+    """
+    full_series = load_sp500_data(file_path, use_live_data=False)
+    base, new_bars = full_series.iloc[:-holdout], full_series.iloc[-holdout:]
+    state = IncrementalQuantState(base, start_date, lookback)
+
+    t0 = time.perf_counter()
+    for date, close in new_bars.items():
+        state.append(date, close)
+    append_ms = (time.perf_counter() - t0) / holdout * 1000
+
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(holdout):
+            compute_quant_metrics(full_series.iloc[:len(base) + i + 1], start_date, lookback)
+    recompute_ms = (time.perf_counter() - t0) / holdout * 1000
+
+    print(f"⏱️  종가 1개 추가: 증분 {append_ms:.3f}ms / 전체 재계산 {recompute_ms:.2f}ms "
+          f"({recompute_ms / append_ms:.0f}배)")
+    return {"append_ms": append_ms, "recompute_ms": recompute_ms}
@@ -0,0 +1,99 @@
+"""
+퀀트 지표 벤치마크
+- 이동 창 Z-score: 누적합 O(n) vs 창별 재계산 O(n*w)
+- 전체 기간 퀀트 요청: pandas 경로 vs 배열 경로 (지연 시간 / 메모리 할당)
+"""
+import contextlib
+import io
+import time
+import tracemalloc
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from data import (
+    load_sp500_data,
+    filter_by_date,
+    calculate_returns,
+    calculate_percentile_rank,
+    calculate_zscore
+)
+from analysis.quant_metrics import compute_quant_metrics
+
+def benchmark_rolling_zscore(file_path="sp500.csv", lookback=252, windows=(252, 500, 750, 1000)):
+    """
+    전체 기간에서 이동 창 Z-score 계산 시간을 측정합니다.
+    
+    누적합 기반 O(n) 계산과 창마다 다시 계산하는 O(n*w) 방식을 비교합니다.
+    
+    Returns:
+        dict: 창 길이별 {streaming_sec, naive_sec, max_abs_diff}
+    """
+    series = load_sp500_data(file_path, use_live_data=False)
+    returns = calculate_returns(series, lookback)
+    values = returns.values
+    results = {}
+    
+    for w in windows:
+        t0 = time.perf_counter()
+        z_fast = calculate_zscore(returns, mode='rolling', window=w)
+        t1 = time.perf_counter()
+        windows_view = sliding_window_view(values, w)
+        z_naive = (values[w - 1:] - windows_view.mean(axis=1)) / windows_view.std(axis=1, ddof=1)
+        t2 = time.perf_counter()
+        
+        diff = np.max(np.abs(z_fast.values[w - 1:] - z_naive))
+        results[w] = {"streaming_sec": t1 - t0, "naive_sec": t2 - t1, "max_abs_diff": float(diff)}
+        print(f"⏱️  w={w}: 누적합 {t1 - t0:.4f}s, 창별 재계산 {t2 - t1:.4f}s, "
+              f"최대 오차 {diff:.2e} (n={len(values)})")
+    
+    return results
+
+def _compute_quant_metrics_pandas(full_series, start_date, lookback, rank_mode):
+    """
+    pandas Series 기반 계산 경로 (배열 경로 도입 전 방식, 비교 기준).
+    """
+    series = filter_by_date(full_series, start_date)
+    returns = series.pct_change(lookback).dropna()
+    if rank_mode == 'absolute':
+        full_returns = full_series.pct_change(lookback).dropna()
+        percentile = calculate_percentile_rank(returns, mode='absolute', full_returns=full_returns)
+    else:
+        percentile = calculate_percentile_rank(returns, mode='relative')
+    z_score = calculate_zscore(returns)
+    z_scaled = (z_score.clip(-3, 3) + 3) / 6 * 100
+    composite_idx = (percentile + z_scaled) / 2
+    return {"percentile": percentile, "z_score": z_score, "composite_idx": composite_idx}
+
+def benchmark_quant_pipeline(file_path="sp500.csv", start_date="1928-01-03", lookback=252,
+                             rank_mode='absolute', repeats=5):
+    """
+    전체 기간 퀀트 요청에서 pandas 경로와 배열 경로의 지연 시간 / 메모리 할당을 비교합니다.
+    
+    Returns:
+        dict: 경로별 {seconds, peak_mb}
+    """
+    full_series = load_sp500_data(file_path, use_live_data=False)
+    paths = {
+        "pandas": lambda: _compute_quant_metrics_pandas(full_series, start_date, lookback, rank_mode),
+        "array": lambda: compute_quant_metrics(full_series, start_date, lookback, rank_mode)
+    }
+    results = {}
+    
+    for name, run in paths.items():
+        with contextlib.redirect_stdout(io.StringIO()):
+            run()
+            t0 = time.perf_counter()
+            for _ in range(repeats):
+                run()
+            elapsed = (time.perf_counter() - t0) / repeats
+            
+            tracemalloc.start()
+            run()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        
+        results[name] = {"seconds": elapsed, "peak_mb": peak / 1e6}
+        print(f"⏱️  {name}: {elapsed * 1000:.1f}ms, 최대 할당 {peak / 1e6:.2f}MB")
+    
+    print(f"   지연 시간 {results['pandas']['seconds'] / results['array']['seconds']:.1f}배 감소, "
+          f"할당 {results['pandas']['peak_mb'] / results['array']['peak_mb']:.1f}배 감소")
+    return results
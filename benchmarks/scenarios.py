@@ -0,0 +1,29 @@
+"""
+역사적 스트레스 시나리오 재현 벤치마크
+"""
+import time
+import numpy as np
+from data import load_sp500_data
+from analysis.scenarios import replay_scenarios, scenario_windows
+
+def benchmark_scenario_replay(file_path="sp500.csv", forecast_days=252):
+    """
+    전체 과거 구간 재현 시간을 측정하고 가격 이력 무복사 여부를 확인합니다.
+
+    Returns:
+        dict: {seconds, n_windows, zero_copy}
+    """
+    full_series = load_sp500_data(file_path, use_live_data=False)
+    log_prices = np.log(full_series.values)
+
+    t0 = time.perf_counter()
+    result = replay_scenarios(full_series, forecast_days)
+    elapsed = time.perf_counter() - t0
+
+    zero_copy = np.shares_memory(scenario_windows(log_prices, forecast_days), log_prices)
+    print(f"⏱️  {result['n_windows']}개 구간 x {forecast_days}일: {elapsed:.3f}s "
+          f"(창 뷰 무복사: {zero_copy})")
+    for name, scenario in result["named_scenarios"].items():
+        print(f"   {name}: {scenario['return_pct']:+.1f}%, MDD {scenario['max_drawdown']:.1f}%")
+
+    return {"seconds": elapsed, "n_windows": result["n_windows"], "zero_copy": zero_copy}
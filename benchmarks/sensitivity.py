@@ -0,0 +1,52 @@
+"""
+민감도 표면 벤치마크 (요청별 파이프라인과 시간 / 값 비교)
+"""
+import io
+import time
+import contextlib
+import numpy as np
+from data import load_sp500_data
+from analysis.quant_metrics import compute_quant_metrics
+from analysis.sensitivity import default_horizons, compute_sensitivity_surface
+
+def benchmark_sensitivity_surface(file_path="sp500.csv", grid=50, checks=20):
+    """
+    grid x grid 표면 계산 시간을 단일 요청(CSV 로드 + compute_quant_metrics)과 비교하고,
+    무작위 칸을 요청별 파이프라인 결과와 대조합니다.
+
+    Returns:
+        dict: {surface_s, single_request_s, max_abs_error}
+    """
+    full_series = load_sp500_data(file_path, use_live_data=False)
+    horizons = default_horizons(grid)
+
+    # 단일 요청 = CSV 로드 + 요청별 파이프라인 1회 (탭 2 버튼 한 번)
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        compute_quant_metrics(load_sp500_data(file_path, use_live_data=False), "1928-01-03", 252)
+    single = time.perf_counter() - t0
+
+    max_error = 0.0
+    rng = np.random.default_rng(0)
+    for rank_mode, zscore_mode in (('relative', 'full'), ('absolute', 'full'), ('relative', 'expanding')):
+        t0 = time.perf_counter()
+        surface = compute_sensitivity_surface(full_series, horizons, rank_mode=rank_mode,
+                                              zscore_mode=zscore_mode)
+        elapsed = time.perf_counter() - t0
+        print(f"⏱️  {len(horizons)}x{len(surface['start_dates'])} 표면 ({rank_mode}/{zscore_mode}): "
+              f"{elapsed:.3f}s (단일 요청 {single:.3f}s)")
+
+        for _ in range(checks):
+            i = rng.integers(len(horizons))
+            j = rng.integers(len(surface["start_dates"]))
+            if np.isnan(surface["composite"][i, j]):
+                continue
+            with contextlib.redirect_stdout(io.StringIO()):
+                ref = compute_quant_metrics(full_series, surface["start_dates"][j], int(horizons[i]),
+                                            rank_mode, zscore_mode)
+            expected = (ref["percentile"].iloc[-1], ref["z_score"].iloc[-1], ref["current_val"])
+            actual = (surface["percentile"][i, j], surface["z_score"][i, j], surface["composite"][i, j])
+            max_error = max(max_error, float(np.max(np.abs(np.subtract(actual, expected)))))
+
+    print(f"   요청별 파이프라인 대비 최대 오차: {max_error:.2e}")
+    return {"surface_s": elapsed, "single_request_s": single, "max_abs_error": max_error}
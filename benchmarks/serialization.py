@@ -0,0 +1,59 @@
+"""
+결과 저장 / 불러오기 벤치마크 (Arrow IPC / Parquet)
+"""
+import os
+import time
+import tempfile
+import numpy as np
+from data import load_sp500_data
+from analysis.monte_carlo import compute_monte_carlo_analysis
+from analysis.serialization import _pyarrow, save_result, load_result
+
+def benchmark_result_io(file_path="sp500.csv", start_date="2010-01-01", iterations=10000):
+    """
+    10,000 경로 몬테카를로 결과의 재계산 / 저장 / 불러오기 시간을 비교합니다.
+
+    Returns:
+        dict: {recompute_s, arrow_load_s, parquet_load_s, arrow_mb, parquet_mb, allocated_mb, equal}
+    """
+    pa = _pyarrow()
+    full_series = load_sp500_data(file_path, use_live_data=False)
+
+    t0 = time.perf_counter()
+    result = compute_monte_carlo_analysis(full_series, start_date, iterations=iterations)
+    recompute = time.perf_counter() - t0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        arrow_path = os.path.join(tmp, "result.arrow")
+        parquet_path = os.path.join(tmp, "result.parquet")
+        arrow_size = save_result(result, arrow_path, 'arrow')
+        parquet_size = save_result(result, parquet_path, 'parquet')
+
+        allocated = pa.total_allocated_bytes()
+        t0 = time.perf_counter()
+        loaded = load_result(arrow_path)
+        arrow_load = time.perf_counter() - t0
+        allocated = pa.total_allocated_bytes() - allocated
+
+        t0 = time.perf_counter()
+        archived = load_result(parquet_path)
+        parquet_load = time.perf_counter() - t0
+
+        equal = all([
+            np.array_equal(loaded["price_list"], result["price_list"]),
+            np.array_equal(archived["price_list"], result["price_list"]),
+            loaded["rank_ts"].equals(result["rank_ts"]),
+            loaded["terminal_stats"] == result["terminal_stats"],
+            loaded["percentile_bands"].keys() == result["percentile_bands"].keys()
+        ])
+        del loaded, archived
+
+    print(f"⏱️  재계산 ({iterations}경로): {recompute:.3f}s")
+    print(f"   Arrow 메모리 맵 불러오기: {arrow_load * 1000:.1f}ms ({arrow_size / 1e6:.1f}MB, "
+          f"Arrow 할당 {allocated / 1e6:.2f}MB)")
+    print(f"   Parquet 불러오기: {parquet_load * 1000:.1f}ms ({parquet_size / 1e6:.1f}MB)")
+    print(f"   원본과 일치: {equal}")
+
+    return {"recompute_s": recompute, "arrow_load_s": arrow_load, "parquet_load_s": parquet_load,
+            "arrow_mb": arrow_size / 1e6, "parquet_mb": parquet_size / 1e6,
+            "allocated_mb": allocated / 1e6, "equal": equal}
@@ -0,0 +1,90 @@
+"""
+세션 결과 메모리 장시간 부하 테스트
+"""
+import io
+import os
+import time
+import contextlib
+import numpy as np
+import pandas as pd
+from data import load_sp500_data
+from analysis import compute_monte_carlo_analysis, compute_quant_metrics
+from utils.session_memory import SessionMemoryGovernor, result_nbytes
+
+def _rss_bytes():
+    """
+    현재 프로세스 RSS (Linux /proc, 그 외에는 최대 RSS).
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+def soak_test(file_path="sp500.csv", sessions=300, requests=3000, budget_mb=64, iterations=2000, seed=0):
+    """
+    수백 개 세션이 Tab 1 / Tab 2 결과를 저장하고 다시 보는 상황을 흉내 내어 메모리 상한을 확인합니다.
+
+    - 세션마다 Monte Carlo(스필 + 재계산) / 퀀트 결과(재계산만) 저장
+    - 최근 세션일수록 자주 다시 보는 접근 패턴 (일부는 오래된 세션 재방문 -> 복원)
+    - 관리자 사용량 / 프로세스 RSS를 주기적으로 기록
+
+    Returns:
+        dict: 관리자 통계 + 최대 RSS 증가량 + 관리 없이 보관했을 때의 총 크기
+    """
+    full_series = load_sp500_data(file_path, use_live_data=False)
+    rng = np.random.default_rng(seed)
+    starts = pd.date_range("1990-01-01", "2020-01-01", periods=sessions)
+
+    def monte_carlo(i):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return compute_monte_carlo_analysis(full_series, starts[i].strftime("%Y-%m-%d"), 252,
+                                                iterations=iterations, method='sampled')
+
+    def quant(i):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return compute_quant_metrics(full_series, starts[i], 252)
+
+    governor = SessionMemoryGovernor(budget_mb << 20)
+    baseline_rss = _rss_bytes()
+    peak_rss, unmanaged = baseline_rss, 0
+    t0 = time.perf_counter()
+    try:
+        for step in range(requests):
+            # 새 세션 유입 (앞쪽 요청), 이후에는 최근 세션 위주로 재방문
+            if step < sessions:
+                i = step
+            else:
+                i = int(min(sessions - 1, rng.exponential(sessions / 4)))
+                i = sessions - 1 - i
+            session_id = f"session-{i:04d}"
+
+            if not governor.contains(session_id, "tab1_data"):
+                result = monte_carlo(i)
+                unmanaged += result_nbytes(result)
+                governor.put(session_id, "tab1_data", result, recompute=lambda i=i: monte_carlo(i))
+                result = quant(i)
+                unmanaged += result_nbytes(result)
+                governor.put(session_id, "tab2_data", result, recompute=lambda i=i: quant(i), spill=False)
+            else:
+                data = governor.get(session_id, "tab1_data" if rng.random() < 0.7 else "tab2_data")
+                assert data is not None
+
+            peak_rss = max(peak_rss, _rss_bytes())
+            if (step + 1) % (requests // 5) == 0:
+                s = governor.stats()
+                print(f"   {step + 1:>5}건: 사용 {s['used_bytes'] / 2**20:6.1f}MB / 예산 {budget_mb}MB, "
+                      f"세션 {s['sessions']}, 메모리 {s['resident']}/{s['entries']}, "
+                      f"RSS +{(_rss_bytes() - baseline_rss) / 2**20:.0f}MB")
+
+        stats = governor.stats()
+    finally:
+        governor.close()
+
+    elapsed = time.perf_counter() - t0
+    print(f"✅ {sessions}개 세션 / {requests}건 ({elapsed:.1f}s): 최대 사용 {stats['peak_bytes'] / 2**20:.1f}MB "
+          f"(관리 없이 보관 시 {unmanaged / 2**20:.0f}MB), 최대 RSS 증가 {(peak_rss - baseline_rss) / 2**20:.0f}MB")
+    print(f"   제거 {stats['evicted']} / 스필 {stats['spilled']} / 파일 복원 {stats['reloaded']} / "
+          f"재계산 {stats['recomputed']} / 삭제 {stats['dropped']}")
+    return {**stats, "peak_rss_growth": peak_rss - baseline_rss, "unmanaged_bytes": unmanaged}
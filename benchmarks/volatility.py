@@ -0,0 +1,43 @@
+"""
+변동성 모델 벤치마크 (EWMA / GARCH 적합 + 시뮬레이션)
+"""
+import time
+import numpy as np
+from data import load_sp500_data, calculate_log_returns, get_data_version
+from analysis.volatility import _FIT_CACHE, fit_volatility_model, simulate_volatility_paths
+
+def benchmark_volatility_models(file_path="sp500.csv", forecast_days=252, iterations=10000):
+    """
+    전체 기간 적합 + 시뮬레이션 소요 시간을 측정합니다.
+
+    Returns:
+        dict: 모델별 {fit_sec, cached_fit_sec, simulate_sec, params}
+    """
+    series = load_sp500_data(file_path, use_live_data=False)
+    mean_return = calculate_log_returns(series).dropna().mean()
+    results = {}
+
+    for model in ('ewma', 'garch'):
+        _FIT_CACHE.pop((get_data_version(series), model), None)
+
+        t0 = time.perf_counter()
+        params = fit_volatility_model(series, model)
+        t1 = time.perf_counter()
+        fit_volatility_model(series, model)
+        t2 = time.perf_counter()
+        simulate_volatility_paths(params, mean_return, forecast_days, iterations)
+        t3 = time.perf_counter()
+
+        results[model] = {
+            "fit_sec": t1 - t0,
+            "cached_fit_sec": t2 - t1,
+            "simulate_sec": t3 - t2,
+            "params": params
+        }
+        print(f"⏱️  {model.upper()}: 적합 {t1 - t0:.3f}s (캐시 {t2 - t1:.6f}s), "
+              f"시뮬레이션 {forecast_days}x{iterations} {t3 - t2:.3f}s")
+        print(f"   alpha={params['alpha']:.4f}, beta={params['beta']:.4f}, "
+              f"현재 일변동성={np.sqrt(params['current_var']):.4%}, "
+              f"장기 일변동성={np.sqrt(params['long_run_var']):.4%}")
+
+    return results
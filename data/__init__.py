@@ -2,18 +2,54 @@
 데이터 처리 모듈
 """
 from .loader import load_sp500_data, filter_by_date
+from .fetcher import (
+    LiveDataRefresher,
+    YFinanceBackend,
+    HTTPBackend,
+    FileBackend,
+    FaultInjection,
+    configure_live_data,
+    get_live_refresher
+)
+from .calendar import TradingCalendar, DataVersionCache, get_trading_calendar, get_data_version
+from .history import PriceHistory, ReturnSeries
 from .calculator import (
     calculate_returns,
     calculate_percentile_rank,
     calculate_zscore,
-    calculate_log_returns
+    calculate_log_returns,
+    calculate_returns_array,
+    calculate_percentile_rank_array,
+    calculate_expanding_percentile_rank_array,
+    calculate_zscore_array,
+    calculate_log_returns_array,
+    ZSCORE_MODES
 )
 
 __all__ = [
     'load_sp500_data',
     'filter_by_date',
+    'LiveDataRefresher',
+    'YFinanceBackend',
+    'HTTPBackend',
+    'FileBackend',
+    'FaultInjection',
+    'configure_live_data',
+    'get_live_refresher',
+    'get_data_version',
+    'DataVersionCache',
+    'TradingCalendar',
+    'get_trading_calendar',
+    'PriceHistory',
+    'ReturnSeries',
     'calculate_returns',
     'calculate_percentile_rank',
     'calculate_zscore',
-    'calculate_log_returns'
+    'calculate_log_returns',
+    'calculate_returns_array',
+    'calculate_percentile_rank_array',
+    'calculate_expanding_percentile_rank_array',
+    'calculate_zscore_array',
+    'calculate_log_returns_array',
+    'ZSCORE_MODES'
 ]
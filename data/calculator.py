@@ -2,6 +2,13 @@
 수익률 및 통계 지표 계산 모듈
 """
 import numpy as np
+import pandas as pd
+from .history import ReturnSeries
+
+def _check_lookback(lookback):
+    # values[:-0]은 빈 배열이 되므로 0 이하 기간은 명시적으로 거부
+    if lookback <= 0:
+        raise ValueError(f"수익률 계산 기간은 1일 이상이어야 합니다: {lookback}")
 
 def calculate_returns(series, lookback):
     """
@@ -14,7 +21,11 @@ def calculate_returns(series, lookback):
     Returns:
         pd.Series: 수익률 시계열 (%)
     """
-    return series.pct_change(lookback).dropna()
+    _check_lookback(lookback)
+    # 위치 기반 슬라이스로 계산 (pct_change + dropna의 중간 객체 생성 없음)
+    values = series.values
+    return pd.Series(values[lookback:] / values[:-lookback] - 1,
+                     index=series.index[lookback:], name=series.name)
 
 def calculate_percentile_rank(returns, mode='relative', full_returns=None):
     """
@@ -41,17 +52,69 @@ def calculate_percentile_rank(returns, mode='relative', full_returns=None):
             lambda x: (np.searchsorted(sorted_values, x) / len(sorted_values)) * 100
         )
 
-def calculate_zscore(returns):
+ZSCORE_MODES = ('full', 'rolling', 'expanding')
+
+def _streaming_moments(values, window=None):
+    """
+    누적합 기반으로 이동/확장 평균과 표준편차를 한 번의 O(n) 패스로 계산합니다.
+    
+    전체 평균으로 중심화한 뒤 누적합을 구해 큰 값의 상쇄 오차를 줄입니다.
+    
+    Args:
+        values: 입력 배열
+        window: 이동 창 길이 (None이면 확장 창)
+    
+    Returns:
+        tuple: (평균 배열, 표준편차 배열) - 표본이 부족한 구간은 NaN
+    """
+    values = np.asarray(values, dtype=float)
+    shift = values.mean() if len(values) > 0 else 0.0
+    x = values - shift
+    
+    cs1 = np.concatenate(([0.0], np.cumsum(x)))
+    cs2 = np.concatenate(([0.0], np.cumsum(x * x)))
+    
+    if window is None:
+        count = np.arange(1, len(x) + 1, dtype=float)
+        s1 = cs1[1:]
+        s2 = cs2[1:]
+    else:
+        count = np.full(len(x), float(window))
+        lower = np.maximum(np.arange(1, len(x) + 1) - window, 0)
+        s1 = cs1[1:] - cs1[lower]
+        s2 = cs2[1:] - cs2[lower]
+        count[:window - 1] = np.nan
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = s1 / count
+        var = np.maximum(s2 - s1 * mean, 0.0) / (count - 1)
+        std = np.sqrt(var)
+    std[count < 2] = np.nan
+    
+    return mean + shift, std
+
+def calculate_zscore(returns, mode='full', window=252):
     """
     Z-score를 계산합니다.
     
     Args:
         returns: 수익률 시계열
+        mode: 'full' (전체 구간 기준), 'rolling' (이동 창), 'expanding' (확장 창)
+        window: rolling 모드의 창 길이 (일)
     
     Returns:
-        pd.Series: Z-score 시계열
+        pd.Series: Z-score 시계열 (rolling/expanding 모드는 표본 부족 구간이 NaN)
     """
-    return (returns - returns.mean()) / returns.std()
+    if mode == 'full':
+        return (returns - returns.mean()) / returns.std()
+    
+    if mode not in ZSCORE_MODES:
+        raise ValueError(f"지원하지 않는 Z-score 모드: {mode}")
+    
+    mean, std = _streaming_moments(returns.values, window if mode == 'rolling' else None)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        z = (returns.values - mean) / std
+    return pd.Series(z, index=returns.index, name=returns.name)
 
 def calculate_log_returns(series):
     """
@@ -64,3 +127,106 @@ def calculate_log_returns(series):
         pd.Series: 로그 수익률
     """
     return np.log(1 + series.pct_change())
+
+# ----------------------------------------
+# 배열 기반 버전 (PriceHistory / ReturnSeries)
+# ----------------------------------------
+
+def calculate_returns_array(prices, lookback):
+    """
+    N일 수익률을 계산합니다 (배열 버전).
+    
+    Args:
+        prices: PriceHistory
+        lookback: 수익률 계산 기간 (일)
+    
+    Returns:
+        ReturnSeries: 수익률 (prices.start + lookback 위치부터)
+    """
+    _check_lookback(lookback)
+    values = prices.values
+    return ReturnSeries(prices.calendar, values[lookback:] / values[:-lookback] - 1,
+                        prices.start + lookback)
+
+def calculate_percentile_rank_array(returns, full_returns=None):
+    """
+    백분위 순위를 계산합니다 (배열 버전, 한 번의 벡터화 이진 탐색).
+    
+    Args:
+        returns: ReturnSeries (순위를 매길 구간)
+        full_returns: 기준 분포 ReturnSeries (None이면 returns 자체 = 상대순위)
+    
+    Returns:
+        ReturnSeries: 백분위 순위 (0~100)
+    """
+    reference = returns if full_returns is None else full_returns
+    sorted_values = np.sort(reference.values)
+    return returns.wrap(np.searchsorted(sorted_values, returns.values) / len(sorted_values) * 100)
+
+def calculate_expanding_percentile_rank_array(returns, min_periods=252, block=512):
+    """
+    확장 창 백분위 순위를 계산합니다 (배열 버전, look-ahead 없음).
+    
+    각 시점의 수익률을 그 이전 시점까지의 수익률 분포에서 순위를 매깁니다 (해당 시점 이후 값 미사용).
+    block 단위로 이전 구간 정렬 배열 이진 탐색 + 블록 내부 비교로 계산합니다.
+    
+    Args:
+        returns: ReturnSeries
+        min_periods: 순위를 매기기 위한 최소 이전 표본 수 (부족한 구간은 NaN)
+        block: 한 번에 처리할 시점 수 (블록 내부 비교 임시 메모리 = block x block)
+    
+    Returns:
+        ReturnSeries: 백분위 순위 (0~100)
+    """
+    values = returns.values
+    n = len(values)
+    below = np.zeros(n)
+    prior = np.empty(0)
+    for start in range(0, n, block):
+        current = values[start:start + block]
+        # 이전 블록까지: 정렬 배열에서 작은 값 개수, 블록 내부: 앞선 시점 중 작은 값 개수
+        below[start:start + len(current)] = (
+            np.searchsorted(prior, current)
+            + np.tril(current[None, :] < current[:, None], k=-1).sum(axis=1)
+        )
+        prior = np.sort(np.concatenate((prior, current)))
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        percentile = below / np.arange(n) * 100
+    percentile[:max(min_periods, 1)] = np.nan
+    return returns.wrap(percentile)
+
+def calculate_zscore_array(returns, mode='full', window=252):
+    """
+    Z-score를 계산합니다 (배열 버전).
+    
+    Args:
+        returns: ReturnSeries
+        mode: 'full', 'rolling', 'expanding'
+        window: rolling 모드의 창 길이 (일)
+    
+    Returns:
+        ReturnSeries: Z-score
+    """
+    values = returns.values
+    if mode == 'full':
+        return returns.wrap((values - values.mean()) / values.std(ddof=1))
+    
+    if mode not in ZSCORE_MODES:
+        raise ValueError(f"지원하지 않는 Z-score 모드: {mode}")
+    
+    mean, std = _streaming_moments(values, window if mode == 'rolling' else None)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return returns.wrap((values - mean) / std)
+
+def calculate_log_returns_array(prices):
+    """
+    일간 로그 수익률을 계산합니다 (배열 버전, 첫 날 제외).
+    
+    Args:
+        prices: PriceHistory
+    
+    Returns:
+        ReturnSeries: 로그 수익률
+    """
+    return ReturnSeries(prices.calendar, np.diff(np.log(prices.values)), prices.start + 1)
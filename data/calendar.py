@@ -0,0 +1,147 @@
+"""
+거래일 캘린더 모듈
+- 정렬된 int64 일(day) 배열 기반의 날짜 -> 위치 변환 (이진 탐색, O(log n))
+- 시작일 필터링 / 기간 오프셋을 위치 슬라이스로 처리 (복사 / 인덱스 재정렬 없음)
+- data, analysis, visualizations 공용 좌표계
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+class DataVersionCache:
+    """
+    데이터 버전 키 기반 LRU 캐시 (크기 상한, 스레드 안전).
+
+    Attributes:
+        maxsize: 최대 항목 수 (초과 시 가장 오래 쓰지 않은 항목 제거)
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key, build):
+        """
+        key의 값을 반환합니다 (없으면 build()로 만들어 저장).
+
+        build는 잠금 밖에서 호출하므로 동시에 같은 key를 요청하면 중복 계산될 수 있습니다.
+        """
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                return self._items[key]
+        value = build()
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+        return value
+
+    def pop(self, key, default=None):
+        with self._lock:
+            return self._items.pop(key, default)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+# 데이터 버전 -> TradingCalendar (최근 버전만 유지)
+_CALENDAR_CACHE = DataVersionCache(16)
+
+def get_data_version(series):
+    """
+    시계열 데이터의 버전 키를 반환합니다 (캐시 키용).
+    
+    Args:
+        series: 가격 시계열
+    
+    Returns:
+        tuple: (데이터 길이, 첫 날짜, 마지막 날짜, 마지막 종가, 날짜 / 종가 내용 해시)
+    """
+    if len(series) == 0:
+        return (0, None, None, None, None)
+    # 중간 행만 수정된 데이터도 다른 버전으로 구분 (2.5만 행 기준 1ms 미만)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.ascontiguousarray(series.index.values.astype('datetime64[ns]')).view(np.int64).data)
+    digest.update(np.ascontiguousarray(series.to_numpy(dtype=float)).data)
+    return (len(series), series.index[0], series.index[-1], float(series.iloc[-1]), digest.hexdigest())
+
+def _to_day(date):
+    return np.datetime64(pd.Timestamp(date), 'D').astype(np.int64)
+
+class TradingCalendar:
+    """
+    거래일 캘린더.
+
+    Attributes:
+        days: 1970-01-01 기준 일수 (int64, 정렬됨)
+        index: 원본 DatetimeIndex
+        closes: 종가 배열 (읽기 전용)
+    """
+
+    def __init__(self, index, closes):
+        self.index = index
+        self.days = np.asarray(index.values.astype('datetime64[D]').astype(np.int64))
+        self.closes = np.asarray(closes, dtype=float).view()
+        self.closes.flags.writeable = False
+
+    def __len__(self):
+        return len(self.days)
+
+    def position(self, date):
+        """
+        date 이상인 첫 거래일의 위치를 반환합니다 (O(log n)).
+        """
+        return int(np.searchsorted(self.days, _to_day(date)))
+
+    def positions(self, dates):
+        """
+        여러 날짜의 위치를 한 번에 반환합니다.
+        """
+        days = np.asarray(pd.DatetimeIndex(dates).values.astype('datetime64[D]').astype(np.int64))
+        return np.searchsorted(self.days, days)
+
+    def slice_from(self, start_date):
+        """
+        시작일 이후 구간의 위치 슬라이스를 반환합니다.
+        """
+        return slice(self.position(start_date), None)
+
+    def offset(self, pos, horizon):
+        """
+        pos에서 horizon 거래일 뒤의 위치를 반환합니다 (범위를 벗어나면 None).
+        """
+        target = pos + horizon
+        return target if 0 <= target < len(self.days) else None
+
+    def date_at(self, pos):
+        """
+        위치의 날짜를 반환합니다.
+        """
+        return self.index[pos]
+
+    def closes_from(self, start_date):
+        """
+        시작일 이후 종가 배열 뷰를 반환합니다 (복사 없음).
+        """
+        return self.closes[self.slice_from(start_date)]
+
+def get_trading_calendar(series):
+    """
+    가격 시계열의 거래일 캘린더를 반환합니다 (데이터 버전별 캐시).
+
+    Args:
+        series: 가격 시계열
+
+    Returns:
+        TradingCalendar: 거래일 캘린더
+    """
+    return _CALENDAR_CACHE.get(get_data_version(series),
+                               lambda: TradingCalendar(series.index, series.values))
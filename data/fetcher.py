@@ -0,0 +1,597 @@
+"""
+실시간 데이터 수집 모듈 (요청 경로 밖에서 실행)
+- 백엔드 교체 가능: yfinance / 풀링 HTTP 세션 / 로컬 파일·HTTP 스텁 (지연·실패 주입)
+- 시간 제한 + 지수 백오프 재시도
+- 잠금 파일로 프로세스 간 단일 실행 (잠금을 못 얻으면 기다리지 않고 건너뜀)
+- 마지막 정상 결과를 스냅샷 파일로 원자적 교체 저장 -> 요청은 항상 스냅샷만 읽음
+- 백그라운드 1회 갱신 / 주기적 갱신 (python -m data.fetcher --interval 900)
+"""
+import os
+import time
+import uuid
+import atexit
+import random
+import tempfile
+import threading
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:
+    # Windows 등: 잠금 파일 + 토큰 방식으로 대체
+    fcntl = None
+
+LIVE_TICKER = "^GSPC"
+SNAPSHOT_DIR = ".live_cache"
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_MAX_AGE = 900
+DEFAULT_FAILURE_COOLDOWN = 60
+
+# ========================================
+# 백엔드
+# ========================================
+class FaultInjection:
+    """
+    스텁 백엔드용 지연 / 실패 주입.
+
+    Attributes:
+        latency: 응답 지연 (초)
+        jitter: 지연에 더할 무작위 범위 (초)
+        failure_rate: 요청 실패 확률 (0~1)
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, failure_rate=0.0, seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def apply(self, timeout=None):
+        with self._lock:
+            delay = self.latency + self._rng.uniform(0, self.jitter)
+            fail = self._rng.random() < self.failure_rate
+        if timeout is not None and delay > timeout:
+            time.sleep(timeout)
+            raise TimeoutError(f"스텁 응답 지연 {delay:.2f}s > 시간 제한 {timeout:.2f}s")
+        time.sleep(delay)
+        if fail:
+            raise ConnectionError("스텁 주입 실패")
+
+def _parse_close_csv(source):
+    # 스냅샷 / 스텁 왕복 시 값이 그대로 보존되도록 round_trip 파서 사용
+    df = pd.read_csv(source, index_col=0, parse_dates=True, float_precision='round_trip')
+    series = df['Close'] if 'Close' in df.columns else df.iloc[:, 0]
+    return series.dropna()
+
+class YFinanceBackend:
+    """
+    yfinance 일별 종가 (yfinance 내부 공유 세션 사용).
+    """
+    name = "yfinance"
+
+    def __init__(self, ticker=LIVE_TICKER):
+        self.ticker = ticker
+
+    def fetch(self, start, timeout=DEFAULT_TIMEOUT):
+        import yfinance as yf
+        live_data = yf.Ticker(self.ticker).history(start=start, timeout=timeout, raise_errors=True)
+        if live_data.empty:
+            return pd.Series(dtype=float, name='Close')
+        series = live_data['Close']
+        series.index = series.index.tz_localize(None)  # 시간대 제거
+        return series
+
+class HTTPBackend:
+    """
+    CSV(Date, Close)를 돌려주는 HTTP 엔드포인트 (풀링된 requests 세션, 연결 재사용).
+
+    GET {url}?start=YYYY-MM-DD
+    """
+    name = "http"
+
+    def __init__(self, url, pool_size=4):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.url = url
+        self.session = requests.Session()
+        # 재시도는 fetch_with_retry에서 처리 (어댑터 재시도 끔)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def fetch(self, start, timeout=DEFAULT_TIMEOUT):
+        import io
+        response = self.session.get(self.url, params={"start": start}, timeout=timeout)
+        response.raise_for_status()
+        return _parse_close_csv(io.StringIO(response.text))
+
+    def close(self):
+        self.session.close()
+
+class FileBackend:
+    """
+    로컬 CSV 스텁 (오프라인 지연 / 실패 동작 확인용).
+    """
+    name = "file"
+
+    def __init__(self, path, faults=None):
+        self.path = path
+        self.faults = faults or FaultInjection()
+
+    def fetch(self, start, timeout=DEFAULT_TIMEOUT):
+        self.faults.apply(timeout)
+        series = _parse_close_csv(self.path)
+        return series[series.index >= pd.Timestamp(start)]
+
+def serve_stub(path, host="127.0.0.1", port=0, faults=None):
+    """
+    로컬 CSV를 HTTPBackend 형식으로 제공하는 스텁 서버를 백그라운드 스레드로 시작합니다.
+
+    Args:
+        path: 원본 CSV 경로
+        host, port: 주소 (port=0이면 빈 포트 자동 선택)
+        faults: FaultInjection (None이면 지연/실패 없음)
+
+    Returns:
+        ThreadingHTTPServer: server.server_address로 주소 확인, shutdown()으로 종료
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from urllib.parse import urlparse, parse_qs
+
+    faults = faults or FaultInjection()
+    source = _parse_close_csv(path)
+
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            try:
+                faults.apply()
+            except (TimeoutError, ConnectionError):
+                self._reply(503, b"injected failure")
+                return
+            start = parse_qs(urlparse(self.path).query).get("start", ["1900-01-01"])[0]
+            body = source[source.index >= pd.Timestamp(start)].to_csv().encode()
+            self._reply(200, body)
+
+        def _reply(self, status, body):
+            self.send_response(status)
+            self.send_header("Content-Type", "text/csv")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+# ========================================
+# 재시도 / 잠금 / 스냅샷
+# ========================================
+def fetch_with_retry(backend, start, timeout=DEFAULT_TIMEOUT, retries=4, base_delay=0.5, max_delay=8.0,
+                     rng=None):
+    """
+    지수 백오프(지터 포함)로 재시도하며 가져옵니다.
+
+    Args:
+        backend: fetch(start, timeout)를 가진 백엔드
+        start: 시작일 문자열
+        timeout: 시도별 시간 제한 (초)
+        retries: 실패 후 재시도 횟수
+        base_delay, max_delay: 대기 시간 base_delay * 2^시도 (최대 max_delay, 50~100% 무작위)
+
+    Returns:
+        tuple: (pd.Series, 시도 횟수)
+
+    Raises:
+        마지막 시도의 예외
+    """
+    rng = rng or random.Random()
+    for attempt in range(retries + 1):
+        try:
+            return backend.fetch(start, timeout=timeout), attempt + 1
+        except Exception as e:
+            if attempt == retries:
+                raise
+            delay = min(max_delay, base_delay * 2 ** attempt) * rng.uniform(0.5, 1.0)
+            print(f"⚠️  {backend.name} 실패 ({attempt + 1}/{retries + 1}): {e} -> {delay:.2f}s 후 재시도")
+            time.sleep(delay)
+
+class FileLock:
+    """
+    잠금 파일 기반 프로세스 간 단일 실행 잠금.
+
+    - POSIX: 잠금 파일에 fcntl.flock (비정상 종료 시 커널이 해제, 회수 불필요)
+    - 그 외: O_CREAT | O_EXCL로 만든 잠금 파일에 보유자 토큰(pid + uuid)을 기록하고,
+      비정상 종료로 남은 잠금은 stale_after 초가 지나면 회수합니다. 회수와 해제는 잠금 파일을
+      고유한 이름으로 원자적으로 옮긴 뒤 확인하므로, 다른 보유자의 잠금을 지우지 않습니다.
+      (여러 프로세스가 같은 오래된 잠금을 동시에 회수하면 드물게 둘이 얻을 수 있으며,
+      refresh가 잠금 안에서 스냅샷을 다시 확인하므로 중복 가져오기로 그칩니다.)
+
+    정상 종료 시에는 보유 중인 잠금을 해제합니다 (백그라운드 갱신 도중 종료 포함).
+    """
+    _held = set()
+
+    def __init__(self, path, stale_after=120.0):
+        self.path = path
+        self.stale_after = stale_after
+        self.acquired = False
+        self.token = None
+        self._fd = None
+
+    def _stash(self):
+        """
+        잠금 파일을 고유한 이름으로 옮깁니다 (원자적, 한 프로세스만 성공).
+
+        Returns:
+            str 또는 None: 옮긴 경로 (이미 없으면 None)
+        """
+        stashed = f"{self.path}.{uuid.uuid4().hex}.stale"
+        try:
+            os.rename(self.path, stashed)
+        except FileNotFoundError:
+            return None
+        return stashed
+
+    def _restore(self, stashed):
+        # 잘못 옮긴 잠금을 되돌림 (그 사이 새 잠금이 생겼으면 되돌리지 않음)
+        try:
+            os.link(stashed, self.path)
+        except OSError:
+            pass
+        os.remove(stashed)
+
+    @staticmethod
+    def _read_token(path):
+        try:
+            with open(path) as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def acquire(self):
+        """
+        기다리지 않고 잠금을 시도합니다.
+
+        Returns:
+            bool: 획득 여부
+        """
+        token = f"{os.getpid()} {uuid.uuid4().hex}"
+        if fcntl is not None:
+            return self._acquire_flock(token)
+        for _ in range(2):
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(fd, token.encode())
+                os.close(fd)
+                self.acquired = True
+                self.token = token
+                FileLock._held.add(self)
+                return True
+            except FileExistsError:
+                try:
+                    age = time.time() - os.path.getmtime(self.path)
+                except FileNotFoundError:
+                    continue
+                if age < self.stale_after:
+                    return False
+                # 오래된 잠금 회수: 옮긴 파일이 여전히 오래된 것인지 확인 (확인 직후 교체된 새 잠금은 되돌림)
+                stashed = self._stash()
+                if stashed is None:
+                    continue
+                if time.time() - os.path.getmtime(stashed) < self.stale_after:
+                    self._restore(stashed)
+                    return False
+                os.remove(stashed)
+        return False
+
+    def _acquire_flock(self, token):
+        fd = os.open(self.path, os.O_CREAT | os.O_RDWR)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        # 진단용 보유자 기록 (잠금 파일 자체는 지우지 않음: 지우면 같은 경로의 다른 inode를 잠글 수 있음)
+        os.ftruncate(fd, 0)
+        os.write(fd, token.encode())
+        self._fd = fd
+        self.acquired = True
+        self.token = token
+        FileLock._held.add(self)
+        return True
+
+    def release(self):
+        """
+        잠금을 해제합니다 (토큰 방식은 이 객체가 기록한 토큰의 잠금일 때만 파일을 지움).
+        """
+        if self.acquired:
+            self.acquired = False
+            FileLock._held.discard(self)
+            if self._fd is not None:
+                fd, self._fd = self._fd, None
+                fcntl.flock(fd, fcntl.LOCK_UN)
+                os.close(fd)
+                return
+            stashed = self._stash()
+            if stashed is None:
+                return
+            if self._read_token(stashed) == self.token:
+                os.remove(stashed)
+            else:
+                # stale_after를 넘겨 회수된 뒤 다른 프로세스가 잡은 잠금
+                self._restore(stashed)
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, *exc):
+        self.release()
+
+@atexit.register
+def _release_held_locks():
+    for lock in list(FileLock._held):
+        lock.release()
+
+def snapshot_path_for(file_path, snapshot_dir=None):
+    """
+    CSV 경로에 대응하는 실시간 스냅샷 경로 (기본: CSV 옆 .live_cache/<이름>_live.csv).
+    """
+    base_dir = snapshot_dir or os.path.join(os.path.dirname(os.path.abspath(file_path)), SNAPSHOT_DIR)
+    stem = os.path.splitext(os.path.basename(file_path))[0]
+    return os.path.join(base_dir, f"{stem}_live.csv")
+
+def read_snapshot(path):
+    """
+    마지막 정상 스냅샷을 읽습니다.
+
+    Returns:
+        pd.Series 또는 None (스냅샷 없음 / 손상)
+    """
+    try:
+        return _parse_close_csv(path)
+    except (FileNotFoundError, ValueError, pd.errors.EmptyDataError):
+        return None
+
+def write_snapshot(series, path):
+    """
+    임시 파일에 쓴 뒤 os.replace로 교체합니다 (읽는 쪽은 항상 완전한 파일만 봄).
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", newline="") as f:
+            series.rename('Close').rename_axis('Date').to_csv(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def snapshot_age(path):
+    """
+    스냅샷 경과 시간 (초, 없으면 None).
+    """
+    try:
+        return time.time() - os.path.getmtime(path)
+    except FileNotFoundError:
+        return None
+
+# ========================================
+# 갱신기
+# ========================================
+def _is_running(thread):
+    return thread is not None and thread.is_alive()
+
+class LiveDataRefresher:
+    """
+    CSV 이후 구간을 백엔드에서 가져와 스냅샷으로 저장하는 갱신기.
+
+    Attributes:
+        file_path: 기준 CSV 경로 (마지막 날짜 다음날부터 가져옴)
+        backend: 데이터 백엔드 (기본 YFinanceBackend)
+        snapshot_path: 스냅샷 파일 경로
+        max_age: 스냅샷 유효 시간 (초, 지나면 갱신 대상)
+        failure_cooldown: 갱신 실패 후 다음 백그라운드 갱신까지 대기 (초)
+        last_error: 마지막 갱신 실패 메시지 (성공 시 None)
+    """
+
+    def __init__(self, file_path="sp500.csv", backend=None, snapshot_dir=None, max_age=DEFAULT_MAX_AGE,
+                 timeout=DEFAULT_TIMEOUT, retries=4, base_delay=0.5, max_delay=8.0,
+                 failure_cooldown=DEFAULT_FAILURE_COOLDOWN):
+        self.file_path = file_path
+        self.backend = backend or YFinanceBackend()
+        self.snapshot_path = snapshot_path_for(file_path, snapshot_dir)
+        self.lock_path = self.snapshot_path + ".lock"
+        self.max_age = max_age
+        self.timeout = timeout
+        self.retries = retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.failure_cooldown = failure_cooldown
+        self.last_error = None
+        self._retry_at = 0.0
+        self._csv_last_date = None
+        self._scheduler = None
+        self._oneshot = None
+        self._thread_lock = threading.Lock()
+        self._stop = threading.Event()
+        # 잠금 보유 최대 시간 = 모든 시도의 시간 제한 + 대기 합 (이후 회수)
+        self.lock_stale_after = (retries + 1) * timeout + retries * max_delay + 30
+
+    def read(self):
+        return read_snapshot(self.snapshot_path)
+
+    def is_stale(self):
+        age = snapshot_age(self.snapshot_path)
+        return age is None or age > self.max_age
+
+    def _live_start(self):
+        if self._csv_last_date is None:
+            self._csv_last_date = _parse_close_csv(self.file_path).index[-1]
+        return (self._csv_last_date + pd.Timedelta(days=1)).strftime('%Y-%m-%d')
+
+    def refresh(self, force=False):
+        """
+        스냅샷을 갱신합니다 (호출 스레드에서 실행).
+
+        다른 프로세스가 갱신 중이면 기다리지 않고 False를 반환합니다.
+
+        Args:
+            force: 스냅샷이 유효해도 갱신
+
+        Returns:
+            bool: 이 호출이 실제로 가져와 저장했는지 여부
+        """
+        os.makedirs(os.path.dirname(self.snapshot_path), exist_ok=True)
+        lock = FileLock(self.lock_path, stale_after=self.lock_stale_after)
+        if not lock.acquire():
+            return False
+        try:
+            # 잠금 대기 중 다른 프로세스가 이미 갱신했으면 생략
+            if not force and not self.is_stale():
+                return False
+            start = self._live_start()
+            t0 = time.perf_counter()
+            series, attempts = fetch_with_retry(self.backend, start, self.timeout, self.retries,
+                                                self.base_delay, self.max_delay)
+            write_snapshot(series, self.snapshot_path)
+            self.last_error = None
+            print(f"✅ 실시간 스냅샷 갱신 ({self.backend.name}): {len(series)}개, "
+                  f"{attempts}회 시도, {time.perf_counter() - t0:.2f}s")
+            return True
+        except Exception as e:
+            self.last_error = str(e)
+            self._retry_at = time.time() + self.failure_cooldown
+            print(f"⚠️  실시간 데이터 갱신 실패 ({self.backend.name}): {e}")
+            print("   마지막 스냅샷을 계속 사용합니다.")
+            return False
+        finally:
+            lock.release()
+
+    def request_refresh(self):
+        """
+        스냅샷이 오래되었으면 백그라운드 스레드로 1회 갱신합니다 (즉시 반환).
+
+        주기적 갱신(start)이 실행 중이면 그쪽에 맡기고 새 스레드를 만들지 않습니다.
+
+        Returns:
+            bool: 새 갱신 스레드를 시작했는지 여부
+        """
+        if not self.is_stale() or time.time() < self._retry_at:
+            return False
+        with self._thread_lock:
+            if _is_running(self._scheduler) or _is_running(self._oneshot):
+                return False
+            self._oneshot = threading.Thread(target=self.refresh, name="live-data-refresh", daemon=True)
+            self._oneshot.start()
+            return True
+
+    def run_forever(self, interval=DEFAULT_MAX_AGE):
+        """
+        interval 초마다 스냅샷을 확인해 오래되었을 때만 갱신합니다 (stop() 호출 시 종료).
+        """
+        self._stop.clear()
+        while not self._stop.is_set():
+            # 스냅샷이 유효하면 잠금도 잡지 않고 다음 주기로
+            if self.is_stale():
+                self.refresh()
+            self._stop.wait(interval)
+
+    def start(self, interval=DEFAULT_MAX_AGE):
+        """
+        주기적 갱신을 백그라운드 스레드로 시작합니다 (진행 중인 1회 갱신과 무관하게 시작).
+        """
+        with self._thread_lock:
+            if _is_running(self._scheduler):
+                return
+            self._scheduler = threading.Thread(target=self.run_forever, args=(interval,),
+                                               name="live-data-scheduler", daemon=True)
+            self._scheduler.start()
+
+    def stop(self, timeout=None):
+        """
+        주기적 갱신을 멈추고 스케줄러 스레드가 끝날 때까지 기다립니다.
+        """
+        self._stop.set()
+        scheduler = self._scheduler
+        if scheduler is not None:
+            scheduler.join(timeout)
+
+    def wait(self, timeout=None):
+        """
+        진행 중인 1회 갱신(request_refresh)이 끝날 때까지 기다립니다.
+        """
+        oneshot = self._oneshot
+        if oneshot is not None:
+            oneshot.join(timeout)
+
+# 프로세스별 갱신기 (CSV 경로별 1개)
+_refreshers = {}
+_refreshers_lock = threading.Lock()
+_default_options = {}
+
+def configure_live_data(**options):
+    """
+    이후 만들어지는 갱신기의 기본 옵션을 설정합니다 (backend, snapshot_dir, max_age, timeout, retries 등).
+
+    이미 만든 갱신기는 버립니다.
+    """
+    with _refreshers_lock:
+        _default_options.clear()
+        _default_options.update(options)
+        _refreshers.clear()
+
+def get_live_refresher(file_path="sp500.csv"):
+    """
+    CSV 경로에 대응하는 프로세스 공용 갱신기를 반환합니다.
+    """
+    key = os.path.abspath(file_path)
+    with _refreshers_lock:
+        refresher = _refreshers.get(key)
+        if refresher is None:
+            refresher = _refreshers[key] = LiveDataRefresher(file_path, **_default_options)
+        return refresher
+
+# ========================================
+# 실행
+# ========================================
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="S&P 500 실시간 스냅샷 갱신")
+    parser.add_argument("--file", default="sp500.csv", help="기준 CSV 경로")
+    parser.add_argument("--backend", choices=["yfinance", "http", "file"], default="yfinance")
+    parser.add_argument("--source", help="http: URL / file: 스텁 CSV 경로")
+    parser.add_argument("--interval", type=float, default=0, help="주기적 갱신 간격 (초, 0이면 1회)")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT)
+    parser.add_argument("--latency", type=float, default=0.0, help="file 스텁 지연 (초)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="file 스텁 실패 확률")
+    args = parser.parse_args()
+
+    if args.backend == "http":
+        backend = HTTPBackend(args.source)
+    elif args.backend == "file":
+        backend = FileBackend(args.source, FaultInjection(args.latency, failure_rate=args.failure_rate))
+    else:
+        backend = YFinanceBackend()
+
+    refresher = LiveDataRefresher(args.file, backend, timeout=args.timeout)
+    if args.interval > 0:
+        print(f"🕒 {args.interval:.0f}초마다 갱신 ({backend.name}) - Ctrl+C로 종료")
+        try:
+            refresher.run_forever(args.interval)
+        except KeyboardInterrupt:
+            pass
+    else:
+        refresher.refresh(force=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+배열 기반 가격 / 수익률 시계열 타입
+- 연속 NumPy 배열 + 공유 거래일 캘린더 (인덱스 정렬 객체 생성 없음)
+- 읽기 전용, 복사 없는 위치 슬라이스
+- pandas 변환은 차트 / API 경계에서만 수행
+"""
+import numpy as np
+import pandas as pd
+from .calendar import get_trading_calendar
+
+class _CalendarArray:
+    """
+    캘린더 위치 [start, start + len(values)) 에 대응하는 읽기 전용 배열.
+    """
+    __slots__ = ('calendar', 'values', 'start')
+
+    def __init__(self, calendar, values, start=0):
+        values = np.asarray(values, dtype=float).view()
+        values.flags.writeable = False
+        self.calendar = calendar
+        self.values = values
+        self.start = start
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, _, step = key.indices(len(self.values))
+            if step != 1:
+                raise ValueError("연속 슬라이스만 지원합니다.")
+            return self.__class__(self.calendar, self.values[key], self.start + start)
+        return self.values[key]
+
+    @property
+    def stop(self):
+        return self.start + len(self.values)
+
+    @property
+    def index(self):
+        """
+        대응하는 DatetimeIndex (차트 / API 경계용).
+        """
+        return self.calendar.index[self.start:self.stop]
+
+    @property
+    def last(self):
+        return float(self.values[-1])
+
+    def from_date(self, start_date):
+        """
+        시작일 이후 구간을 복사 없이 반환합니다.
+        """
+        pos = max(self.calendar.position(start_date) - self.start, 0)
+        return self[pos:]
+
+    def wrap(self, values):
+        """
+        같은 위치의 다른 값 배열을 같은 타입으로 감쌉니다.
+        """
+        return self.__class__(self.calendar, values, self.start)
+
+    def to_series(self, values=None):
+        """
+        pandas Series로 변환합니다 (values를 주면 같은 날짜의 다른 값 배열을 변환).
+        """
+        return pd.Series(self.values if values is None else values, index=self.index)
+
+class PriceHistory(_CalendarArray):
+    """
+    종가 시계열 (전체 기간 또는 그 일부 구간).
+    """
+    __slots__ = ()
+
+    @classmethod
+    def from_series(cls, series):
+        """
+        pandas 가격 시계열에서 생성합니다 (데이터 버전별 캘린더 공유, 종가 배열 복사 없음).
+        """
+        calendar = get_trading_calendar(series)
+        return cls(calendar, calendar.closes, 0)
+
+class ReturnSeries(_CalendarArray):
+    """
+    수익률 / 지표 시계열 (PriceHistory와 같은 캘린더 사용).
+    """
+    __slots__ = ()
@@ -1,16 +1,19 @@
 """
 하이브리드 데이터 로딩 모듈
 - 2025년까지: CSV 파일 사용
-- 2026년 이후: yfinance로 실시간 데이터 가져오기
+- 2026년 이후: 실시간 스냅샷 (fetcher가 요청 경로 밖에서 yfinance로 갱신)
 """
 import pandas as pd
-import yfinance as yf
-from datetime import datetime
+from .calendar import get_trading_calendar
+from .fetcher import get_live_refresher
 
 def load_sp500_data(file_path="sp500.csv", use_live_data=True):
     """
     S&P 500 데이터를 하이브리드 방식으로 로드합니다.
     
+    실시간 구간은 마지막 정상 스냅샷만 읽고, 스냅샷이 오래되었으면
+    백그라운드 갱신을 요청한 뒤 기다리지 않고 반환합니다.
+    
     Args:
         file_path: CSV 파일 경로
         use_live_data: 2026년 이후 실시간 데이터 사용 여부
@@ -34,37 +37,28 @@ def load_sp500_data(file_path="sp500.csv", use_live_data=True):
     if csv_last_date >= today - pd.Timedelta(days=7):
         return csv_series
     
-    try:
-        # 3. yfinance로 2026년 이후 데이터 가져오기
-        print(f"📡 2026년 이후 데이터를 yfinance에서 가져오는 중...")
-        ticker = yf.Ticker("^GSPC")
-        
-        # CSV 마지막 날짜 다음날부터 오늘까지
-        start_date = (csv_last_date + pd.Timedelta(days=1)).strftime('%Y-%m-%d')
-        live_data = ticker.history(start=start_date)
-        
-        if live_data.empty:
-            print("⚠️  yfinance 데이터 없음. CSV만 사용합니다.")
-            return csv_series
-        
-        # 4. 데이터 병합
-        live_series = live_data['Close']
-        live_series.index = live_series.index.tz_localize(None)  # 시간대 제거
-        
-        # CSV와 실시간 데이터 합치기
-        combined_series = pd.concat([csv_series, live_series])
-        combined_series = combined_series[~combined_series.index.duplicated(keep='last')]
-        combined_series = combined_series.sort_index()
-        
-        print(f"✅ 데이터 로드 완료: {combined_series.index[0]} ~ {combined_series.index[-1]}")
-        print(f"   CSV: {len(csv_series)}개, 실시간: {len(live_series)}개, 총: {len(combined_series)}개")
-        
-        return combined_series
-        
-    except Exception as e:
-        print(f"⚠️  yfinance 로드 실패: {e}")
-        print("   CSV 데이터만 사용합니다.")
+    # 3. 마지막 정상 스냅샷 읽기 (오래되었으면 백그라운드 갱신 요청)
+    refresher = get_live_refresher(file_path)
+    if refresher.request_refresh():
+        print(f"📡 2026년 이후 데이터 백그라운드 갱신 시작 ({refresher.backend.name})")
+    live_series = refresher.read()
+    
+    if live_series is None or live_series.empty:
+        print("⚠️  실시간 스냅샷 없음. CSV만 사용합니다.")
         return csv_series
+    
+    # 4. 데이터 병합
+    live_series = live_series[live_series.index > csv_last_date]
+    
+    # CSV와 실시간 데이터 합치기
+    combined_series = pd.concat([csv_series, live_series.rename(csv_series.name)])
+    combined_series = combined_series[~combined_series.index.duplicated(keep='last')]
+    combined_series = combined_series.sort_index()
+    
+    print(f"✅ 데이터 로드 완료: {combined_series.index[0]} ~ {combined_series.index[-1]}")
+    print(f"   CSV: {len(csv_series)}개, 실시간: {len(live_series)}개, 총: {len(combined_series)}개")
+    
+    return combined_series
 
 def filter_by_date(series, start_date):
     """
@@ -75,6 +69,6 @@ def filter_by_date(series, start_date):
         start_date: 시작일 (문자열)
     
     Returns:
-        pd.Series: 필터링된 시계열
+        pd.Series: 필터링된 시계열 (위치 슬라이스, 인덱스 재정렬 없음)
     """
-    return series.loc[start_date:]
+    return series.iloc[get_trading_calendar(series).slice_from(start_date)]
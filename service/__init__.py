@@ -0,0 +1,11 @@
+"""
+로컬 HTTP 분석 서비스 모듈
+"""
+from .server import AnalysisService, serve
+from .encoding import encode_result
+
+__all__ = [
+    'AnalysisService',
+    'serve',
+    'encode_result'
+]
@@ -0,0 +1,6 @@
+"""
+python -m service 로 분석 서비스 실행
+"""
+from .server import main
+
+main()
@@ -0,0 +1,70 @@
+"""
+분석 결과 인코딩 모듈
+- 결과 딕셔너리를 스칼라 메타데이터(JSON)와 배열(바이너리)로 분리
+- 배열은 JSON 리스트 대신 npz(npy 묶음) 또는 Arrow IPC 파일로 전송
+"""
+import io
+import json
+import math
+import numpy as np
+from analysis.serialization import flatten_result, serialize_result
+
+RESPONSE_FORMATS = ('json', 'npz', 'arrow')
+
+def _array_info(arrays):
+    return {key: {"shape": list(a.shape), "dtype": str(a.dtype)} for key, a in arrays.items()}
+
+def _finite(value):
+    # NaN / inf는 표준 JSON이 아니므로 null로 변환
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if isinstance(value, dict):
+        return {key: _finite(v) for key, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(v) for v in value]
+    return value
+
+def dumps_json(payload):
+    """
+    표준 JSON으로 인코딩합니다 (NaN / inf -> null, allow_nan=False).
+    """
+    return json.dumps(_finite(payload), ensure_ascii=False, allow_nan=False).encode('utf-8')
+
+def encode_json(meta, arrays):
+    """
+    메타데이터와 배열 목록(형태/타입만)을 JSON으로 인코딩합니다.
+    """
+    return dumps_json({"meta": meta, "arrays": _array_info(arrays)})
+
+def encode_npz(meta, arrays):
+    """
+    배열을 비압축 npz로 인코딩합니다 (메타데이터는 '__meta__' 문자열 배열, pickle 불필요).
+    """
+    buffer = io.BytesIO()
+    np.savez(buffer, __meta__=np.array(json.dumps(meta, ensure_ascii=False)), **arrays)
+    return buffer.getbuffer()
+
+def encode_result(result, fmt='json'):
+    """
+    결과 딕셔너리를 응답 형식으로 인코딩합니다.
+
+    Args:
+        result: 분석 결과 딕셔너리
+        fmt: 'json' (스칼라 + 배열 목록), 'npz' 또는 'arrow' (배열 포함, pyarrow 필요)
+
+    Returns:
+        tuple: (content_type, bytes-like)
+    """
+    if fmt == 'arrow':
+        # analysis.deserialize_result로 그대로 복원 가능한 Arrow IPC 파일
+        try:
+            return "application/vnd.apache.arrow.file", memoryview(serialize_result(result, 'arrow'))
+        except ImportError as e:
+            raise ValueError(str(e))
+
+    meta, arrays = flatten_result(result)
+    if fmt == 'json':
+        return "application/json; charset=utf-8", encode_json(meta, arrays)
+    if fmt == 'npz':
+        return "application/x-npz", encode_npz(meta, arrays)
+    raise ValueError(f"지원하지 않는 형식: {fmt}")
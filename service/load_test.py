@@ -0,0 +1,134 @@
+"""
+분석 서비스 부하 테스트
+- keep-alive 연결 N개로 요청을 동시에 보내고 p50 / p99 지연과 초당 요청 수를 보고
+
+실행 (서비스가 떠 있을 때): python -m service.load_test --requests 2000 --concurrency 32
+실행 (로컬 인스턴스 자동 기동): python -m service.load_test --spawn
+"""
+import sys
+import time
+import signal
+import asyncio
+import argparse
+import subprocess
+import numpy as np
+
+DEFAULT_PATHS = (
+    "/quant?start=2010-01-01&lookback=252",
+    "/quant?start=1990-01-01&lookback=252&rank_mode=absolute",
+    "/forward?horizon=252",
+    "/montecarlo?start=2010-01-01&iterations=2000&method=analytic",
+)
+
+async def _request(reader, writer, host, path):
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode('latin-1'))
+    await writer.drain()
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode('latin-1').split("\r\n")
+    status = int(lines[0].split(" ", 2)[1])
+    length = 0
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return status, length
+
+async def _worker(host, port, paths, counter, total, latencies, errors):
+    reader, writer = await asyncio.open_connection(host, port, limit=1 << 20)
+    try:
+        while counter[0] < total:
+            i = counter[0]
+            counter[0] += 1
+            t0 = time.perf_counter()
+            status, length = await _request(reader, writer, host, paths[i % len(paths)])
+            latencies.append(time.perf_counter() - t0)
+            if status != 200:
+                errors.append(status)
+            counter[1] += length
+    finally:
+        writer.close()
+
+async def run_load_test(host="127.0.0.1", port=8765, paths=DEFAULT_PATHS, total=1000, concurrency=16):
+    """
+    부하 테스트를 실행합니다.
+
+    Args:
+        host, port: 서비스 주소
+        paths: 요청 경로 목록 (순환 사용)
+        total: 총 요청 수
+        concurrency: 동시 연결 수
+
+    Returns:
+        dict: {requests, errors, p50_ms, p99_ms, mean_ms, rps, mb}
+    """
+    latencies, errors = [], []
+    counter = [0, 0]  # [보낸 요청 수, 받은 바이트]
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(_worker(host, port, list(paths), counter, total, latencies, errors)
+                           for _ in range(concurrency)))
+    elapsed = time.perf_counter() - t0
+
+    ms = np.array(latencies) * 1000
+    return {
+        "requests": len(ms),
+        "errors": len(errors),
+        "p50_ms": float(np.percentile(ms, 50)),
+        "p99_ms": float(np.percentile(ms, 99)),
+        "mean_ms": float(ms.mean()),
+        "rps": len(ms) / elapsed,
+        "mb": counter[1] / 1e6
+    }
+
+async def _wait_until_ready(host, port, timeout=120):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            reader, writer = await asyncio.open_connection(host, port)
+            status, _ = await _request(reader, writer, host, "/health")
+            writer.close()
+            if status == 200:
+                return
+        except OSError:
+            pass
+        await asyncio.sleep(0.5)
+    raise TimeoutError(f"서비스가 {timeout}초 안에 준비되지 않았습니다.")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="분석 서비스 부하 테스트")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--path", action="append", help="요청 경로 (여러 번 지정 가능)")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--spawn", action="store_true", help="로컬 서비스 인스턴스를 띄워서 테스트")
+    args = parser.parse_args(argv)
+
+    paths = args.path or DEFAULT_PATHS
+    server = None
+    if args.spawn:
+        server = subprocess.Popen([sys.executable, "-m", "service", "--port", str(args.port),
+                                   "--no-live", "--quiet"])
+    try:
+        if server is not None:
+            asyncio.run(_wait_until_ready(args.host, args.port))
+        print(f"🔥 부하 테스트: {args.requests}건, 동시 연결 {args.concurrency}개")
+        for path in paths:
+            print(f"   {path}")
+        report = asyncio.run(run_load_test(args.host, args.port, paths, args.requests, args.concurrency))
+        print(f"✅ {report['requests']}건 (오류 {report['errors']}건), 수신 {report['mb']:.1f}MB")
+        print(f"   p50 {report['p50_ms']:.1f}ms, p99 {report['p99_ms']:.1f}ms, "
+              f"평균 {report['mean_ms']:.1f}ms, {report['rps']:.0f} req/s")
+        return report
+    finally:
+        if server is not None:
+            # SIGINT로 종료해야 서비스가 프로세스 풀까지 정리함
+            server.send_signal(signal.SIGINT)
+            try:
+                server.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                server.kill()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,369 @@
+"""
+로컬 HTTP 분석 서비스
+- Streamlit 없이 백분위 / Z-score / 복합 지수 / 몬테카를로 결과를 조회
+- 가격 시계열, 거래일 캘린더, 선행 수익률 인덱스를 메모리에 상주 (요청마다 재로딩 없음)
+- 주기적으로 데이터를 다시 읽어 데이터 버전이 바뀌면 상주 데이터와 작업자를 교체
+- 동시에 들어온 동일 요청은 하나의 계산으로 병합
+- 몬테카를로 시뮬레이션은 프로세스 풀에서 실행 (이벤트 루프 비차단)
+- 배열은 JSON 리스트 대신 npz / Arrow 바이너리로 분할 전송
+
+실행: python -m service --port 8765
+예시: curl "http://127.0.0.1:8765/quant?start=2010-01-01&lookback=252"
+"""
+import os
+import sys
+import math
+import time
+import asyncio
+import argparse
+import traceback
+from urllib.parse import urlsplit, parse_qs
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from data import load_sp500_data, get_trading_calendar, get_data_version, ZSCORE_MODES
+from analysis.quant_metrics import compute_quant_metrics
+from analysis.monte_carlo import MC_METHODS, compute_monte_carlo_analysis
+from analysis.volatility import VOL_MODELS
+from analysis.forward_returns import FORWARD_READINGS, get_forward_return_index
+from .encoding import RESPONSE_FORMATS, encode_result, dumps_json
+
+RANK_MODES = ('relative', 'absolute')
+MAX_ITERATIONS = 50000
+MAX_FORECAST_DAYS = 2520
+# 몬테카를로 경로 행렬 상한 (iterations x days float64 = 약 400 MB)
+MAX_PATH_CELLS = 50_000_000
+WARM_HORIZONS = (252,)
+CHUNK_SIZE = 1 << 20
+KEEPALIVE_TIMEOUT = 15
+RELOAD_INTERVAL = 3600
+
+_STATUS_TEXT = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+                422: "Unprocessable Entity", 500: "Internal Server Error"}
+
+# 프로세스 풀 작업자별 상주 시계열
+_WORKER_SERIES = None
+
+def _init_worker(series, quiet):
+    """
+    작업자 프로세스 초기화: 시계열 / 캘린더 / 선행 수익률 인덱스를 한 번만 준비합니다.
+    """
+    global _WORKER_SERIES
+    if quiet:
+        sys.stdout = open(os.devnull, 'w')
+    # fork된 작업자가 같은 난수 상태를 공유하지 않도록 재시드
+    np.random.seed()
+    _WORKER_SERIES = series
+    get_trading_calendar(series)
+    for horizon in WARM_HORIZONS:
+        get_forward_return_index(series, horizon)
+
+def _monte_carlo_worker(params):
+    return compute_monte_carlo_analysis(_WORKER_SERIES, **params)
+
+class RequestError(Exception):
+    """
+    잘못된 요청 파라미터 (HTTP 400).
+    """
+
+def _param(query, name, default, cast=str, choices=None):
+    values = query.get(name)
+    if not values:
+        return default
+    try:
+        value = cast(values[-1])
+    except ValueError:
+        raise RequestError(f"잘못된 파라미터: {name}={values[-1]}")
+    if choices is not None and value not in choices:
+        raise RequestError(f"{name}는 {', '.join(map(str, choices))} 중 하나여야 합니다.")
+    return value
+
+def _date(value):
+    # 엔진 내부가 아니라 요청 단계에서 날짜 형식 오류를 400으로 거부
+    return pd.Timestamp(value).strftime('%Y-%m-%d')
+
+class AnalysisService:
+    """
+    상주 데이터 기반 분석 서비스.
+
+    Attributes:
+        series: 전체 기간 가격 시계열 (시작 시 로드, reload_interval마다 버전 확인 후 교체)
+        version: series의 데이터 버전 (get_data_version)
+        stats: 요청 / 실제 계산 / 병합 / 데이터 교체 횟수
+    """
+
+    def __init__(self, file_path="sp500.csv", workers=2, use_live_data=True, quiet=False,
+                 reload_interval=RELOAD_INTERVAL):
+        self.file_path = file_path
+        self.workers = workers
+        self.use_live_data = use_live_data
+        self.quiet = quiet
+        self.reload_interval = reload_interval
+        self.series = None
+        self.version = None
+        self.stats = {"requests": 0, "computations": 0, "coalesced": 0, "reloads": 0}
+        self._inflight = {}
+        self._pool = None
+        self._routes = {
+            "/health": self._health,
+            "/quant": self._quant,
+            "/montecarlo": self._montecarlo,
+            "/forward": self._forward
+        }
+
+    def start(self):
+        """
+        데이터를 로드하고 인덱스와 프로세스 풀을 준비합니다.
+        """
+        print(f"📊 데이터 로딩 중... ({self.file_path})")
+        series = load_sp500_data(self.file_path, use_live_data=self.use_live_data)
+        self._install(series, self._warm(series))
+
+    @staticmethod
+    def _warm(series):
+        """
+        캘린더와 선행 수익률 인덱스를 미리 만들고 데이터 버전을 반환합니다.
+        """
+        get_trading_calendar(series)
+        for horizon in WARM_HORIZONS:
+            for reading in FORWARD_READINGS:
+                get_forward_return_index(series, horizon, reading)
+        return get_data_version(series)
+
+    def _install(self, series, version):
+        """
+        상주 시계열을 교체하고 새 시계열을 가진 작업자 풀을 띄웁니다 (이전 풀은 진행 중인 작업 후 종료).
+        """
+        old_pool = self._pool
+        self.series, self.version = series, version
+        self._pool = ProcessPoolExecutor(self.workers, initializer=_init_worker,
+                                         initargs=(series, self.quiet))
+        if old_pool is not None:
+            old_pool.shutdown(wait=False)
+        print(f"✅ 데이터 상주: {len(series)}일 ({series.index[0].date()} ~ "
+              f"{series.index[-1].date()}), 작업자 {self.workers}개")
+
+    async def reload(self):
+        """
+        데이터를 다시 읽어 버전이 바뀌었으면 상주 데이터를 교체합니다.
+
+        Returns:
+            bool: 교체 여부
+        """
+        series = await self._in_thread(load_sp500_data, self.file_path, self.use_live_data)
+        version = await self._in_thread(get_data_version, series)
+        if version == self.version:
+            return False
+        self._install(series, await self._in_thread(self._warm, series))
+        self.stats["reloads"] += 1
+        return True
+
+    async def watch_data(self):
+        """
+        reload_interval초마다 reload()를 실행합니다 (오류는 기록 후 다음 주기에 재시도).
+        """
+        while True:
+            await asyncio.sleep(self.reload_interval)
+            try:
+                await self.reload()
+            except Exception:
+                traceback.print_exc()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    async def _coalesced(self, key, compute):
+        """
+        같은 key의 계산이 진행 중이면 그 결과를 함께 기다립니다.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            self.stats["computations"] += 1
+            task = asyncio.ensure_future(compute())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.stats["coalesced"] += 1
+        return await asyncio.shield(task)
+
+    async def _in_thread(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    async def _health(self, query):
+        return {"status": "ok", "n_days": len(self.series),
+                "last_date": self.series.index[-1], "last_close": float(self.series.iloc[-1]),
+                "inflight": len(self._inflight), **self.stats}
+
+    async def _quant(self, query):
+        params = (
+            _param(query, "start", "2010-01-01", _date),
+            _param(query, "lookback", 252, int),
+            _param(query, "rank_mode", "relative", choices=RANK_MODES),
+            _param(query, "zscore_mode", "full", choices=ZSCORE_MODES),
+            _param(query, "zscore_window", 252, int)
+        )
+        if params[1] < 1 or params[4] < 2:
+            raise RequestError("lookback >= 1, zscore_window >= 2 이어야 합니다.")
+        return await self._coalesced(("quant", self.version) + params,
+                                     lambda: self._in_thread(compute_quant_metrics, self.series, *params))
+
+    async def _montecarlo(self, query):
+        params = {
+            "start_date": _param(query, "start", "2010-01-01", _date),
+            "forecast_days": _param(query, "days", 252, int),
+            "iterations": _param(query, "iterations", 10000, int),
+            "rank_mode": _param(query, "rank_mode", "relative", choices=RANK_MODES),
+            "vol_model": _param(query, "vol_model", "gbm", choices=VOL_MODELS),
+            "method": _param(query, "method", "sampled", choices=MC_METHODS)
+        }
+        if not 1 <= params["iterations"] <= MAX_ITERATIONS or not 2 <= params["forecast_days"] <= MAX_FORECAST_DAYS:
+            raise RequestError(f"iterations는 1~{MAX_ITERATIONS}, days는 2~{MAX_FORECAST_DAYS}이어야 합니다.")
+        if params["iterations"] * params["forecast_days"] > MAX_PATH_CELLS:
+            raise RequestError(f"iterations x days는 {MAX_PATH_CELLS:,} 이하여야 합니다.")
+        loop = asyncio.get_running_loop()
+        return await self._coalesced(("montecarlo", self.version) + tuple(params.values()),
+                                     lambda: loop.run_in_executor(self._pool, _monte_carlo_worker, params))
+
+    async def _forward(self, query):
+        horizon = _param(query, "horizon", 252, int)
+        reading = _param(query, "reading", "percentile", choices=FORWARD_READINGS)
+        value = _param(query, "value", None, float)
+        # 과거 h일 수익률과 이후 h일 수익률이 모두 있어야 함 (2h + 1일 이상)
+        max_horizon = (len(self.series) - 1) // 2
+        if not 1 <= horizon <= max_horizon:
+            raise RequestError(f"horizon은 1~{max_horizon}이어야 합니다.")
+        if value is not None and not math.isfinite(value):
+            raise RequestError(f"잘못된 파라미터: value={value}")
+        index = await self._coalesced(("forward", self.version, horizon, reading),
+                                      lambda: self._in_thread(get_forward_return_index,
+                                                              self.series, horizon, reading))
+        return index.lookup(value)
+
+    async def dispatch(self, method, target):
+        """
+        요청을 처리해 (상태 코드, Content-Type, 본문)을 반환합니다.
+        """
+        self.stats["requests"] += 1
+        url = urlsplit(target)
+        handler = self._routes.get(url.path)
+        if handler is None:
+            return self._error(404, f"알 수 없는 경로: {url.path}")
+        if method != "GET":
+            return self._error(405, "GET 요청만 지원합니다.")
+
+        query = parse_qs(url.query)
+        try:
+            fmt = _param(query, "format", "json", choices=RESPONSE_FORMATS)
+            result = await handler(query)
+            if result is None:
+                return self._error(422, "데이터 부족: 시작일 또는 기간을 조정하세요.")
+            content_type, body = encode_result(result, fmt)
+            return 200, content_type, body
+        except RequestError as e:
+            return self._error(400, str(e))
+        except Exception as e:
+            traceback.print_exc()
+            return self._error(500, f"{type(e).__name__}: {e}")
+
+    @staticmethod
+    def _error(status, message):
+        body = dumps_json({"error": message})
+        return status, "application/json; charset=utf-8", body
+
+    async def handle_connection(self, reader, writer):
+        """
+        HTTP/1.1 연결 처리 (keep-alive 지원, 요청 본문 없는 GET 전용).
+        """
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), KEEPALIVE_TIMEOUT)
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError,
+                        asyncio.TimeoutError, ConnectionError):
+                    break
+
+                lines = head.decode('latin-1').split("\r\n")
+                try:
+                    method, target, version = lines[0].split(" ", 2)
+                except ValueError:
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    name, sep, value = line.partition(":")
+                    if sep:
+                        headers[name.strip().lower()] = value.strip()
+
+                keep_alive = (version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                              and "content-length" not in headers)
+                status, content_type, body = await self.dispatch(method, target)
+                await self._write_response(writer, status, content_type, body, keep_alive)
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _write_response(writer, status, content_type, body, keep_alive):
+        header = (f"HTTP/1.1 {status} {_STATUS_TEXT[status]}\r\n"
+                  f"Content-Type: {content_type}\r\n"
+                  f"Content-Length: {len(body)}\r\n"
+                  f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(header.encode('latin-1'))
+        # 큰 배열 본문은 청크 단위로 흘려보냄 (송신 버퍼 역압 반영, 복사 없는 memoryview 슬라이스)
+        body = memoryview(body)
+        for offset in range(0, len(body), CHUNK_SIZE):
+            writer.write(body[offset:offset + CHUNK_SIZE])
+            await writer.drain()
+        await writer.drain()
+
+async def serve(service, host="127.0.0.1", port=8765):
+    """
+    서비스를 시작하고 종료될 때까지 요청을 처리합니다.
+    """
+    server = await asyncio.start_server(service.handle_connection, host, port)
+    watcher = asyncio.ensure_future(service.watch_data()) if service.reload_interval else None
+    print(f"🚀 분석 서비스 시작: http://{host}:{port} "
+          f"(경로: /health, /quant, /montecarlo, /forward)")
+    sys.stdout.flush()
+    if service.quiet:
+        # 시작 안내만 출력하고 엔진 로그는 버림
+        sys.stdout = open(os.devnull, 'w')
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        if watcher is not None:
+            watcher.cancel()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="S&P 500 로컬 분석 서비스")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--file", default="sp500.csv", help="CSV 파일 경로")
+    parser.add_argument("--workers", type=int, default=2, help="몬테카를로 프로세스 수")
+    parser.add_argument("--no-live", action="store_true", help="실시간 데이터 사용 안 함 (CSV만)")
+    parser.add_argument("--quiet", action="store_true", help="엔진 로그 출력 끄기")
+    parser.add_argument("--reload-interval", type=int, default=RELOAD_INTERVAL,
+                        help="데이터 버전 확인 주기 (초, 0이면 재로딩 안 함)")
+    args = parser.parse_args(argv)
+
+    service = AnalysisService(args.file, args.workers, not args.no_live, args.quiet,
+                              args.reload_interval)
+    service.start()
+    t0 = time.perf_counter()
+    try:
+        asyncio.run(serve(service, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+        print(f"🛑 서비스 종료 (가동 {time.perf_counter() - t0:.0f}s, 요청 {service.stats['requests']}건, "
+              f"계산 {service.stats['computations']}건, 병합 {service.stats['coalesced']}건)",
+              file=sys.__stdout__)
+
+if __name__ == "__main__":
+    main()
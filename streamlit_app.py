@@ -8,22 +8,77 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib import font_manager
 import platform
+import importlib.util
+import functools
 
 # 한글 폰트 설정
 from utils import setup_korean_font, install_font_guide
 
+# 세션 결과 메모리 관리
+from utils import get_session_governor
+
 # 분석 엔진
-from analysis import run_monte_carlo_analysis, run_quant_analysis
+from analysis import run_monte_carlo_analysis, run_quant_analysis, run_scenario_analysis
+from analysis import run_sensitivity_analysis
+from analysis import serialize_result, deserialize_result
+
+# 실시간 데이터
+from data import get_live_refresher, load_sp500_data
 
 # 시각화
 from visualizations import (
     draw_simulation_chart,
     draw_distribution_chart,
+    draw_forward_return_chart,
     draw_percentile_chart,
+    draw_risk_chart,
     draw_composite_chart,
-    draw_zscore_chart
+    draw_zscore_chart,
+    draw_sensitivity_heatmap,
+    InteractivePanel,
+    CHART_BACKENDS
 )
 
+# 실시간 데이터 주기적 갱신 (프로세스당 1개 스레드, 재실행 시 중복 시작 없음)
+get_live_refresher("sp500.csv").start()
+
+@st.cache_resource(ttl=get_live_refresher("sp500.csv").max_age)
+def load_chart_prices(file_path="sp500.csv"):
+    """
+    차트 가격 배경용 가격 시계열 (프로세스 공용, 재실행마다 CSV를 다시 읽지 않음).
+    """
+    return load_sp500_data(file_path)
+
+# 세션 결과 저장소 (모든 세션 공용 메모리 예산, 오래 쓰지 않은 결과는 Arrow 파일 / 재계산으로 복원)
+governor = get_session_governor()
+governor.expire_idle()
+
+def current_session_id():
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx is not None else "local"
+
+def store_result(key, data, recompute=None, spill=True):
+    """
+    현재 세션의 결과를 메모리 관리자에 저장합니다.
+    
+    Args:
+        key: 결과 키 (예: 'tab1_data')
+        data: 결과 객체
+        recompute: 제거 후 다시 계산할 함수 (None이면 스필 파일로만 복원)
+        spill: 제거 시 Arrow 파일로 내릴지 여부
+    """
+    governor.put(current_session_id(), key, data, recompute, spill)
+
+def get_result(key):
+    return governor.get(current_session_id(), key)
+
+def has_result(key):
+    return governor.contains(current_session_id(), key)
+
+def result_version(key):
+    return governor.version(current_session_id(), key)
+
 # 한글 폰트 초기화
 font_name = setup_korean_font()
 
@@ -70,6 +125,33 @@ with st.sidebar:
         help="• relative: 선택 기간 내에서의 상대적 순위\n• absolute: 1928년부터 전체 기간 대비 절대적 순위"
     )
     
+    # 변동성 모델 (Tab 1)
+    vol_model = st.selectbox(
+        "변동성 모델",
+        options=["gbm", "ewma", "garch"],
+        format_func=lambda x: {"gbm": "GBM (고정 변동성)", "ewma": "EWMA", "garch": "GARCH(1,1)"}[x],
+        help="• GBM: 선택 기간 전체의 고정 변동성\n• EWMA / GARCH: 전체 기간으로 적합한 시변 변동성 (현재 국면 반영)"
+    )
+    
+    # 계산 방식 (Tab 1, GBM 전용)
+    mc_method = st.selectbox(
+        "계산 방식",
+        options=["analytic", "sampled"],
+        format_func=lambda x: "정확해 (GBM, 즉시 계산)" if x == "analytic" else "표본 시뮬레이션 (10,000회)",
+        help="• analytic: GBM 최종 분포, 분위수 밴드, CVaR, 하락 도달 확률을 수식으로 정확히 계산 (최대 낙폭 / 회복 기간은 배경 경로로 근사)\n• sampled: 10,000개 경로를 모두 시뮬레이션\nEWMA/GARCH는 항상 표본 시뮬레이션을 사용합니다."
+    )
+    
+    # 차트 렌더링 방식
+    chart_backend = st.selectbox(
+        "차트 렌더링",
+        options=list(CHART_BACKENDS),
+        format_func=lambda x: "정적 이미지 (matplotlib)" if x == "matplotlib" else "인터랙티브 (Plotly)",
+        help="• matplotlib: 서버에서 그린 이미지\n• Plotly: 요약 데이터만 한 번 전송, 확대/이동/라벨/가격 배경 전환은 브라우저에서 처리"
+    )
+    if chart_backend == "plotly" and importlib.util.find_spec("plotly") is None:
+        st.warning("⚠️ plotly가 설치되지 않아 정적 이미지로 표시합니다 (pip install plotly).")
+        chart_backend = "matplotlib"
+    
     #st.markdown("---")
     
     # 정보
@@ -81,11 +163,123 @@ with st.sidebar:
     - absolute 모드: 역사적 위치 파악
     """)
     
+    # 관리자: 세션 결과 메모리 사용량
+    with st.expander("🧠 메모리 사용량 (관리자)"):
+        mem = governor.stats()
+        st.metric("결과 메모리", f"{mem['used_bytes'] / 2**20:.1f} / {mem['budget_bytes'] / 2**20:.0f} MB",
+                  help="모든 세션 합산. 예산을 넘으면 오래 쓰지 않은 결과부터 Arrow 파일로 내리거나 버린 뒤 필요할 때 복원합니다.")
+        st.caption(f"최대 {mem['peak_bytes'] / 2**20:.1f}MB · 세션 {mem['sessions']}개 · "
+                   f"메모리 {mem['resident']}/{mem['entries']}개 결과")
+        st.caption(f"제거 {mem['evicted']} · 스필 {mem['spilled']} · 파일 복원 {mem['reloaded']} · "
+                   f"재계산 {mem['recomputed']}")
+        usage = governor.session_usage()
+        if not usage.empty:
+            usage["session"] = [("▶ " if sid == current_session_id() else "") + sid[:8] for sid in usage["session"]]
+            usage["resident_bytes"] = (usage["resident_bytes"] / 2**20).round(2)
+            st.dataframe(usage.rename(columns={"session": "세션", "resident_bytes": "메모리 (MB)", "entries": "결과",
+                                               "evicted": "제거됨", "last_access": "마지막 접근"}),
+                         hide_index=True, use_container_width=True)
+    
     #st.markdown("---")
     st.caption("v2.0 | 하이브리드 데이터 로딩")
 
+# 차트 영역 생성 / 표시 (렌더링 방식 공용)
+def create_axes(figsize, subplots):
+    """
+    렌더링 방식에 맞는 ax 목록을 만듭니다 (Plotly 모드는 InteractivePanel).
+    
+    Args:
+        figsize: matplotlib 그림 크기
+        subplots: subplot 위치 코드 목록 (예: [331, 332, 312])
+    
+    Returns:
+        tuple: (matplotlib figure 또는 None, ax 목록)
+    """
+    if chart_backend == "plotly":
+        return None, [InteractivePanel() for _ in subplots]
+    fig = plt.figure(figsize=figsize)
+    return fig, [fig.add_subplot(code) for code in subplots]
+
+def show_charts(fig, axes, rows):
+    """
+    그린 차트를 표시합니다.
+    
+    Args:
+        fig: create_axes의 figure (Plotly 모드는 None)
+        axes: create_axes의 ax 목록
+        rows: Plotly 모드의 행별 패널 개수 (예: [3, 1, 1])
+    """
+    if fig is not None:
+        fig.tight_layout()
+        st.pyplot(fig)
+        plt.close(fig)
+        return
+    
+    panels = iter(axes)
+    for n_cols in rows:
+        for col in st.columns(n_cols):
+            with col:
+                st.plotly_chart(next(panels).figure, use_container_width=True,
+                                config={"scrollZoom": True, "displaylogo": False})
+
+# 결과 저장 / 불러오기 (Arrow IPC / Parquet)
+def result_io_panel(tab_key, required_key):
+    """
+    탭 결과를 파일로 내려받거나, 저장된 결과를 재계산 없이 불러옵니다.
+    
+    Args:
+        tab_key: 세션 상태 키 접두사 ('tab1', 'tab2')
+        required_key: 불러온 결과가 이 탭 결과인지 확인할 키
+    """
+    with st.expander("💾 결과 저장 / 불러오기"):
+        col_fmt, col_down, col_up = st.columns([1, 1, 2])
+        with col_fmt:
+            fmt = st.radio("형식", options=["arrow", "parquet"], key=f"{tab_key}_export_fmt",
+                           format_func=lambda x: "Arrow (빠른 불러오기)" if x == "arrow" else "Parquet (압축 보관)")
+        
+        with col_down:
+            if has_result(f'{tab_key}_data'):
+                try:
+                    # 결과는 다운로드 파일을 만들 때만 조회 (재실행마다 스필된 결과를 복원하지 않음).
+                    # 같은 결과 버전 / 형식의 직렬화 결과는 재사용 (결과 객체는 참조하지 않음)
+                    version = result_version(f'{tab_key}_data')
+                    cached = get_result(f'{tab_key}_export')
+                    if not cached or cached[0] != version or cached[1] != fmt:
+                        cached = None
+                        if st.button("📦 다운로드 파일 만들기", key=f"{tab_key}_prepare",
+                                     use_container_width=True):
+                            data = get_result(f'{tab_key}_data')
+                            if data:
+                                cached = (version, fmt, serialize_result(data, fmt).to_pybytes())
+                                store_result(f'{tab_key}_export', cached, spill=False)
+                    if cached:
+                        st.download_button("⬇️ 결과 다운로드", data=cached[2],
+                                           file_name=f"sp500_{tab_key}_result.{fmt}",
+                                           mime="application/octet-stream", key=f"{tab_key}_download",
+                                           use_container_width=True)
+                except ImportError as e:
+                    st.warning(str(e))
+            else:
+                st.caption("분석을 실행하면 결과를 저장할 수 있습니다.")
+        
+        with col_up:
+            uploaded = st.file_uploader("저장된 결과 불러오기", type=["arrow", "parquet"],
+                                        key=f"{tab_key}_upload")
+            if uploaded is not None and st.session_state.get(f'{tab_key}_upload_id') != uploaded.file_id:
+                try:
+                    loaded = deserialize_result(uploaded.getvalue())
+                    if required_key not in loaded:
+                        st.error("❌ 이 탭의 분석 결과 파일이 아닙니다.")
+                    else:
+                        st.session_state[f'{tab_key}_upload_id'] = uploaded.file_id
+                        store_result(f'{tab_key}_data', loaded)
+                        st.rerun()
+                except (ImportError, ValueError) as e:
+                    st.error(f"❌ 불러오기 실패: {str(e)}")
+
 # 탭 생성
-tab1, tab2 = st.tabs(["📈 종합 분석 (Monte Carlo)", "📊 퀀트 리스크 분석"])
+tab1, tab2, tab3, tab4 = st.tabs(["📈 종합 분석 (Monte Carlo)", "📊 퀀트 리스크 분석", "🧨 스트레스 시나리오",
+                                  "🧭 민감도 분석"])
 
 # ========================================
 # TAB 1: 몬테카를로 시뮬레이션
@@ -95,30 +289,42 @@ with tab1:
     
     # 옵션
     col_opt1, col_opt2, col_opt3 = st.columns([2, 2, 2])
-    with col_opt1:
-        show_label = st.checkbox("수익률 수치 표시", value=True, key="tab1_label")
-    with col_opt2:
-        show_price_bg = st.checkbox("하단 그래프 가격 배경", value=False, key="tab1_price_bg")
+    if chart_backend == "plotly":
+        # 라벨 / 가격 배경은 한 번 그려 두고 차트 버튼·범례로 브라우저에서 전환 (재실행 없음)
+        show_label, show_price_bg = True, False
+        with col_opt1:
+            st.caption("💡 라벨은 차트의 '라벨 표시/숨김' 버튼, 가격 배경은 범례의 'S&P 500 가격'을 눌러 전환")
+    else:
+        with col_opt1:
+            show_label = st.checkbox("수익률 수치 표시", value=True, key="tab1_label")
+        with col_opt2:
+            show_price_bg = st.checkbox("하단 그래프 가격 배경", value=False, key="tab1_price_bg")
     with col_opt3:
         run_analysis_btn = st.button("🚀 분석 실행", type="primary", key="tab1_run", use_container_width=True)
     
 
     
     # 분석 실행
-    if run_analysis_btn or 'tab1_data' in st.session_state:
+    if run_analysis_btn or has_result('tab1_data'):
         if run_analysis_btn:
             with st.spinner("📊 몬테카를로 시뮬레이션 실행 중..."):
                 try:
                     start_date_str = start_date.strftime("%Y-%m-%d")
-                    data = run_monte_carlo_analysis(
+                    compute = functools.partial(
+                        run_monte_carlo_analysis,
                         "sp500.csv",
                         start_date_str,
                         forecast_days=int(forecast_days),
-                        rank_mode=rank_mode
+                        rank_mode=rank_mode,
+                        vol_model=vol_model,
+                        method=mc_method
                     )
+                    data = compute()
                     
                     if data:
-                        st.session_state['tab1_data'] = data
+                        # 복원용 재계산은 같은 난수 시드로 (사용자가 본 결과와 같은 경로)
+                        store_result('tab1_data', data,
+                                     recompute=functools.partial(compute, seed=data['seed']))
                         st.success("✅ 분석 완료!")
                     else:
                         st.error("❌ 분석 실패: 데이터가 부족하거나 오류가 발생했습니다.")
@@ -129,7 +335,7 @@ with tab1:
                     st.stop()
         
         # 데이터 가져오기
-        data = st.session_state.get('tab1_data')
+        data = get_result('tab1_data')
         
         if data:
             # 결과 요약
@@ -146,38 +352,44 @@ with tab1:
                 rank_value = 100 - current_percentile
                 st.metric("현재 순위", f"상위 {rank_value:.1f}%")
             with col_m4:
-                mean_return = np.mean(data['returns_pct'])
+                stats = data.get('terminal_stats')
+                mean_return = stats['mean'] if stats else np.mean(data['returns_pct'])
                 st.metric("예상 평균 수익률", f"{mean_return:+.2f}%")
             
             #st.markdown("---")
             
             # 차트 그리기
-            fig = plt.figure(figsize=(14, 10))
+            fig, axes = create_axes((18, 14), [331, 332, 333, 312, 313])
+            ax1, ax2, ax_fwd, ax_risk, ax3 = axes
             
             # 좌상: 시뮬레이션
-            ax1 = fig.add_subplot(221)
             draw_simulation_chart(ax1, data, show_label=show_label)
             
-            # 우상: 분포
-            ax2 = fig.add_subplot(222)
+            # 중상: 분포
             draw_distribution_chart(ax2, data)
             
+            # 우상: 과거 유사 구간 이후 수익률
+            draw_forward_return_chart(ax_fwd, data)
+            
+            # 중단: 경로 리스크
+            draw_risk_chart(ax_risk, data)
+            
             # 하단: 순위
-            ax3 = fig.add_subplot(212)
             start_date_str = start_date.strftime("%Y-%m-%d")
             draw_percentile_chart(
                 ax3, data,
                 show_price_bg=show_price_bg,
                 start_date=start_date_str,
-                title=f"역사적 순위 지표 ({mode_text})"
+                title=f"역사적 순위 지표 ({mode_text})",
+                prices=load_chart_prices() if show_price_bg or chart_backend == "plotly" else None
             )
             
-            fig.tight_layout()
-            st.pyplot(fig)
-            plt.close(fig)
+            show_charts(fig, axes, [3, 1, 1])
             
     else:
         st.info("👈 좌측 설정을 확인하고 **🚀 분석 실행** 버튼을 눌러주세요.")
+    
+    result_io_panel("tab1", "price_list")
 
 # ========================================
 # TAB 2: 퀀트 리스크 분석
@@ -186,29 +398,51 @@ with tab2:
     #st.header("📊 퀀트 리스크 분석 (3-Panel)")
     
     # 옵션
-    col_opt1, col_opt2 = st.columns([5, 2])
+    col_opt1, col_opt2, col_opt3, col_opt4 = st.columns([3, 2, 2, 2])
     with col_opt1:
         st.info("💡 전역 설정(좌측 사이드바)이 자동으로 연동됩니다.")
     with col_opt2:
+        zscore_mode = st.selectbox(
+            "Z-score 기준",
+            options=["full", "rolling", "expanding"],
+            format_func=lambda x: {"full": "선택 기간 전체", "rolling": "이동 창", "expanding": "확장 창"}[x],
+            key="tab2_zscore_mode",
+            help="• 선택 기간 전체: 기간 전체 평균/표준편차 기준 (미래 정보 포함)\n• 이동 창 / 확장 창: 각 시점까지의 데이터만 사용"
+        )
+    with col_opt3:
+        zscore_window = st.number_input(
+            "이동 창 (일)",
+            min_value=20,
+            max_value=2520,
+            value=252,
+            step=1,
+            key="tab2_zscore_window",
+            disabled=(zscore_mode != "rolling")
+        )
+    with col_opt4:
         run_quant_btn = st.button("🚀 퀀트 지표 실행", type="primary", key="tab2_run", use_container_width=True)
     
 
     
     # 분석 실행
-    if run_quant_btn or 'tab2_data' in st.session_state:
+    if run_quant_btn or has_result('tab2_data'):
         if run_quant_btn:
             with st.spinner("📊 퀀트 지표 계산 중..."):
                 try:
                     start_date_str = start_date.strftime("%Y-%m-%d")
-                    data = run_quant_analysis(
+                    compute = functools.partial(
+                        run_quant_analysis,
                         "sp500.csv",
                         start_date_str,
                         lookback=int(forecast_days),
-                        rank_mode=rank_mode
+                        rank_mode=rank_mode,
+                        zscore_mode=zscore_mode,
+                        zscore_window=int(zscore_window)
                     )
+                    data = compute()
                     
                     if data:
-                        st.session_state['tab2_data'] = data
+                        store_result('tab2_data', data, recompute=compute)
                         st.success("✅ 분석 완료!")
                     else:
                         st.error("❌ 분석 실패: 데이터가 부족하거나 오류가 발생했습니다.")
@@ -219,7 +453,7 @@ with tab2:
                     st.stop()
         
         # 데이터 가져오기
-        data = st.session_state.get('tab2_data')
+        data = get_result('tab2_data')
         
         if data:
             # 결과 요약
@@ -243,26 +477,183 @@ with tab2:
             #st.markdown("---")
             
             # 차트 그리기
-            fig = plt.figure(figsize=(14, 12))
+            fig, axes = create_axes((14, 12), [311, 312, 313])
+            ax1, ax2, ax3 = axes
             
             # 상단: 백분위
-            ax1 = fig.add_subplot(311)
             draw_percentile_chart(ax1, data, title=f"1. 역사적 순위 ({mode_text})")
             
             # 중간: 복합 지수
-            ax2 = fig.add_subplot(312)
             draw_composite_chart(ax2, data)
             
             # 하단: Z-score
-            ax3 = fig.add_subplot(313)
             draw_zscore_chart(ax3, data)
             
-            fig.tight_layout()
-            st.pyplot(fig)
-            plt.close(fig)
+            show_charts(fig, axes, [1, 1, 1])
+            st.caption(f"ℹ️ 백분위와 복합 지수의 과거 구간은 {'전체 기간' if data.get('rank_mode') == 'absolute' else '선택 기간'} "
+                       "전체 분포 기준의 사후(in-sample) 값입니다 (당시 시점 신호 아님). 현재 값만 현재 시점 기준입니다.")
             
     else:
         st.info("👈 좌측 설정을 확인하고 **🚀 퀀트 지표 실행** 버튼을 눌러주세요.")
+    
+    result_io_panel("tab2", "composite_idx")
+
+# ========================================
+# TAB 3: 역사적 스트레스 시나리오
+# ========================================
+with tab3:
+    # 옵션
+    col_opt1, col_opt2 = st.columns([5, 2])
+    with col_opt1:
+        st.info("💡 과거 모든 구간(분석 기간 길이)과 주요 위기를 현재 가격에 그대로 적용합니다.")
+    with col_opt2:
+        run_scenario_btn = st.button("🚀 시나리오 실행", type="primary", key="tab3_run", use_container_width=True)
+    
+    # 분석 실행
+    if run_scenario_btn or has_result('tab3_data'):
+        if run_scenario_btn:
+            with st.spinner("🧨 과거 구간 재현 중..."):
+                try:
+                    compute = functools.partial(run_scenario_analysis, "sp500.csv", forecast_days=int(forecast_days))
+                    data = compute()
+                    
+                    if data:
+                        # 시나리오 / 민감도 결과는 Arrow 형식 밖 (날짜 객체) -> 재계산으로만 복원
+                        store_result('tab3_data', data, recompute=compute, spill=False)
+                        st.success("✅ 분석 완료!")
+                    else:
+                        st.error("❌ 분석 실패: 데이터가 부족하거나 오류가 발생했습니다.")
+                        st.stop()
+                        
+                except Exception as e:
+                    st.error(f"❌ 분석 실패: {str(e)}")
+                    st.stop()
+        
+        # 데이터 가져오기
+        data = get_result('tab3_data')
+        
+        if data:
+            stats = data['terminal_stats']
+            
+            # 메트릭 표시
+            col_m1, col_m2, col_m3, col_m4 = st.columns(4)
+            with col_m1:
+                st.metric("현재 가격", f"${data['current_price']:,.2f}")
+            with col_m2:
+                st.metric("재현 구간 수", f"{data['n_windows']:,}개")
+            with col_m3:
+                st.metric("중윗값 수익률", f"{stats['quantiles'][50]:+.2f}%")
+            with col_m4:
+                st.metric("하위 5% 수익률", f"{stats['var_95']:+.2f}%")
+            
+            # 차트 그리기
+            fig, axes = create_axes((14, 5), [121, 122])
+            ax1, ax2 = axes
+            
+            # 좌: 과거 구간 시나리오
+            draw_simulation_chart(ax1, data, show_label=True)
+            
+            # 우: 분포
+            draw_distribution_chart(ax2, data)
+            
+            show_charts(fig, axes, [2])
+            
+            # 주요 위기 시나리오 표
+            named = data.get('named_scenarios', {})
+            if named:
+                st.dataframe(pd.DataFrame([
+                    {
+                        "시나리오": name,
+                        "시작일": scenario['start'].strftime("%Y-%m-%d"),
+                        f"{data['days']}일 후 수익률 (%)": round(scenario['return_pct'], 1),
+                        "최대 낙폭 (%)": round(scenario['max_drawdown'], 1),
+                        "최저 가격 ($)": round(scenario['trough_price'], 2)
+                    }
+                    for name, scenario in named.items()
+                ]), hide_index=True, use_container_width=True)
+            
+    else:
+        st.info("👈 좌측 설정을 확인하고 **🚀 시나리오 실행** 버튼을 눌러주세요.")
+
+# ========================================
+# TAB 4: 분석 기간 x 시작일 민감도
+# ========================================
+with tab4:
+    # 옵션
+    col_opt1, col_opt2, col_opt3, col_opt4, col_opt5 = st.columns([3, 2, 2, 2, 2])
+    with col_opt1:
+        st.info("💡 분석 기간(20~1000일)과 시작일 조합별 현재 지표를 한 번에 계산합니다. ★ = 현재 설정")
+    with col_opt2:
+        sens_metric = st.selectbox(
+            "지표",
+            options=["composite", "percentile", "z_score"],
+            format_func=lambda x: {"composite": "복합 리스크 지수", "percentile": "현재 백분위", "z_score": "Z-score"}[x],
+            key="tab4_metric"
+        )
+    with col_opt3:
+        sens_zscore_mode = st.selectbox(
+            "Z-score 기준",
+            options=["full", "expanding"],
+            format_func=lambda x: {"full": "선택 기간 전체", "expanding": "확장 창"}[x],
+            key="tab4_zscore_mode"
+        )
+    with col_opt4:
+        sens_grid = st.slider("격자 크기", min_value=10, max_value=100, value=50, step=10, key="tab4_grid")
+    with col_opt5:
+        run_sens_btn = st.button("🚀 민감도 실행", type="primary", key="tab4_run", use_container_width=True)
+    
+    # 분석 실행
+    if run_sens_btn or has_result('tab4_data'):
+        if run_sens_btn:
+            with st.spinner("🧭 민감도 표면 계산 중..."):
+                try:
+                    compute = functools.partial(
+                        run_sensitivity_analysis,
+                        "sp500.csv",
+                        horizons=np.unique(np.linspace(20, 1000, sens_grid).astype(int)),
+                        rank_mode=rank_mode,
+                        zscore_mode=sens_zscore_mode,
+                        n_starts=sens_grid
+                    )
+                    data = compute()
+                    
+                    if data:
+                        store_result('tab4_data', data, recompute=compute, spill=False)
+                        st.success("✅ 분석 완료!")
+                    else:
+                        st.error("❌ 분석 실패: 데이터가 부족하거나 오류가 발생했습니다.")
+                        st.stop()
+                        
+                except Exception as e:
+                    st.error(f"❌ 분석 실패: {str(e)}")
+                    st.stop()
+        
+        # 데이터 가져오기
+        data = get_result('tab4_data')
+        
+        if data:
+            values = data[sens_metric]
+            mode_text = "절대순위" if data.get("rank_mode") == "absolute" else "상대순위"
+            
+            # 메트릭 표시
+            col_m1, col_m2, col_m3, col_m4 = st.columns(4)
+            with col_m1:
+                st.metric("순위 모드", mode_text)
+            with col_m2:
+                st.metric("격자", f"{values.shape[0]} x {values.shape[1]}")
+            with col_m3:
+                st.metric("최솟값", f"{np.nanmin(values):.2f}")
+            with col_m4:
+                st.metric("최댓값", f"{np.nanmax(values):.2f}")
+            
+            # 차트 그리기
+            fig, axes = create_axes((14, 7), [111])
+            draw_sensitivity_heatmap(axes[0], data, metric=sens_metric,
+                                     marker=(pd.Timestamp(start_date), int(forecast_days)))
+            show_charts(fig, axes, [1])
+            
+    else:
+        st.info("👈 좌측 설정을 확인하고 **🚀 민감도 실행** 버튼을 눌러주세요.")
 
 # Footer
 st.markdown("---")
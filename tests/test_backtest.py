@@ -0,0 +1,45 @@
+"""
+backtest_threshold_grid 손계산 검증: 거래 짝짓기, 같은 날 청산 우선, 다음 거래일 적용
+"""
+import numpy as np
+import pytest
+from analysis import backtest_threshold_grid
+
+# t:         0    1    2     3    4    5    6    7
+READINGS = [50,  10,  30,   95,  50,   5,  99,  50]
+CLOSES = [100,  50,  55, 60.5,  50,  50,  45, 47.5]
+
+def test_hand_computed_mean_reversion():
+    # (진입 <= 20, 청산 >= 90): t1 진입 -> t3 청산, t5 진입 -> t6 청산
+    # (진입 <= 60, 청산 >= 40): t0 / t4 / t7은 진입·청산이 동시에 성립 -> 청산 우선이라 같은 포지션
+    result = backtest_threshold_grid(READINGS, CLOSES, [20, 60], [90, 40], periods_per_year=7)
+
+    # 포지션 [F, T, T, F, F, T, F, F]는 다음 거래일 수익률부터 적용:
+    # 거래 1 = 50 -> 55 -> 60.5 (+21%), 거래 2 = 50 -> 45 (-10%), t0 -> t1의 -50%는 미보유
+    for i, j in [(0, 0), (1, 1)]:
+        assert result["n_trades"][i, j] == 2
+        assert result["hit_rate"][i, j] == pytest.approx(50.0)
+        assert result["cagr"][i, j] == pytest.approx((1.21 * 0.9 - 1) * 100)
+        assert result["max_drawdown"][i, j] == pytest.approx((0.9 - 1) * 100)
+        assert result["exposure"][i, j] == pytest.approx(3 / 8 * 100)
+        assert result["turnover"][i, j] == pytest.approx(4.0)
+
+    assert result["buy_hold_cagr"] == pytest.approx((47.5 / 100 - 1) * 100)
+    assert result["n_days"] == 8
+
+def test_open_trade_closes_on_last_day():
+    # (진입 <= 60, 청산 >= 90): t0 진입 후 t3 청산, t4 재진입 후 t6 청산, t7 재진입 (미청산)
+    result = backtest_threshold_grid(READINGS, CLOSES, [60], [90], periods_per_year=7)
+
+    # 거래: t0->t3 (100 -> 60.5), t4->t6 (50 -> 45), t7->t7 (수익 0): 모두 승리 아님
+    assert result["n_trades"][0, 0] == 3
+    assert result["hit_rate"][0, 0] == 0
+    assert result["cagr"][0, 0] == pytest.approx((0.605 * 0.9 - 1) * 100)
+    assert result["exposure"][0, 0] == pytest.approx(6 / 8 * 100)
+
+def test_momentum_mirrors_mean_reversion():
+    mirrored = backtest_threshold_grid(100 - np.asarray(READINGS), CLOSES, [80], [10],
+                                       direction='momentum', periods_per_year=7)
+    base = backtest_threshold_grid(READINGS, CLOSES, [20], [90], periods_per_year=7)
+    for key in ("cagr", "max_drawdown", "hit_rate", "n_trades", "exposure", "turnover"):
+        np.testing.assert_allclose(mirrored[key], base[key])
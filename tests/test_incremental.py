@@ -0,0 +1,81 @@
+"""
+IncrementalQuantState 증분 업데이트 == 전체 재계산 동치성 검증
+"""
+import io
+import contextlib
+from pathlib import Path
+import numpy as np
+import pytest
+from data import load_sp500_data, ZSCORE_MODES
+from analysis import IncrementalQuantState, compute_quant_metrics
+
+CSV_PATH = Path(__file__).resolve().parents[1] / "sp500.csv"
+START_DATE = "2010-01-01"
+LOOKBACK = 252
+HOLDOUT = 20
+
+@pytest.fixture(scope="module")
+def full_series():
+    return load_sp500_data(str(CSV_PATH), use_live_data=False)
+
+@pytest.mark.parametrize("zscore_mode", ZSCORE_MODES)
+@pytest.mark.parametrize("rank_mode", ["relative", "absolute"])
+def test_append_matches_full_recompute(full_series, rank_mode, zscore_mode):
+    base, new_bars = full_series.iloc[:-HOLDOUT], full_series.iloc[-HOLDOUT:]
+    with contextlib.redirect_stdout(io.StringIO()):
+        state = IncrementalQuantState(base, START_DATE, LOOKBACK, rank_mode, zscore_mode)
+
+        for i, (date, close) in enumerate(new_bars.items()):
+            latest = state.append(date, close)
+            expected = compute_quant_metrics(full_series.iloc[:len(base) + i + 1], START_DATE,
+                                             LOOKBACK, rank_mode, zscore_mode)
+
+            assert latest["percentile"] == pytest.approx(expected["percentile"].iloc[-1], abs=1e-8)
+            assert latest["z_score"] == pytest.approx(expected["z_score"].iloc[-1], abs=1e-8)
+            assert latest["composite"] == pytest.approx(expected["current_val"], abs=1e-8)
+
+    # 결과 시계열의 날짜 축은 전체 재계산과 같아야 함 (과거 값은 각 시점 기준이므로 최신 값만 비교)
+    result = state.to_result()
+    assert result["percentile"].index.equals(expected["percentile"].index)
+    assert result["current_val"] == pytest.approx(expected["current_val"], abs=1e-8)
+
+@pytest.mark.parametrize("zscore_mode", ZSCORE_MODES)
+@pytest.mark.parametrize("rank_mode", ["relative", "absolute"])
+def test_to_result_fields_vs_batch_recompute(full_series, rank_mode, zscore_mode):
+    """
+    to_result()와 일괄 재계산의 필드별 관계:
+    - 날짜 축, 메타데이터(lookback/rank_mode/zscore_mode/zscore_window), current_val, 마지막 행: 동일
+    - z_score: rolling/expanding은 인과적이므로 전 구간 동일, full은 과거 값이 다를 수 있음
+    - percentile / composite_idx: 과거 값은 각 시점 기준(as-of)이라 다를 수 있음
+      (초기 구간 = base 일괄 계산, 추가 구간 = 그 시점까지 일괄 계산의 마지막 값)
+    """
+    base, new_bars = full_series.iloc[:-HOLDOUT], full_series.iloc[-HOLDOUT:]
+    with contextlib.redirect_stdout(io.StringIO()):
+        state = IncrementalQuantState(base, START_DATE, LOOKBACK, rank_mode, zscore_mode)
+        initial = compute_quant_metrics(base, START_DATE, LOOKBACK, rank_mode, zscore_mode)
+        as_of = []
+        for i, (date, close) in enumerate(new_bars.items()):
+            state.append(date, close)
+            as_of.append(compute_quant_metrics(full_series.iloc[:len(base) + i + 1], START_DATE,
+                                               LOOKBACK, rank_mode, zscore_mode))
+    result, batch = state.to_result(), as_of[-1]
+
+    assert set(result) == set(batch)
+    for key in ("lookback", "rank_mode", "zscore_mode", "zscore_window"):
+        assert result[key] == batch[key]
+    assert result["current_val"] == pytest.approx(batch["current_val"], abs=1e-8)
+    for key in ("percentile", "z_score", "composite_idx"):
+        assert result[key].index.equals(batch[key].index)
+        assert result[key].iloc[-1] == pytest.approx(batch[key].iloc[-1], abs=1e-8)
+
+        # as-of 구성: 초기 구간은 base 일괄 계산, 추가 구간은 각 시점 일괄 계산의 마지막 값
+        head = result[key].iloc[:len(initial[key])]
+        tail = result[key].iloc[len(initial[key]):].values
+        np.testing.assert_allclose(head.values, initial[key].values, atol=1e-8)
+        np.testing.assert_allclose(tail, [r[key].iloc[-1] for r in as_of], atol=1e-8)
+
+    if zscore_mode == 'full':
+        assert not np.allclose(result["z_score"].values, batch["z_score"].values, atol=1e-8)
+    else:
+        np.testing.assert_allclose(result["z_score"].values, batch["z_score"].values, atol=1e-8)
+    assert not np.allclose(result["percentile"].values, batch["percentile"].values, atol=1e-8)
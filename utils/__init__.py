@@ -7,6 +7,7 @@ import matplotlib.font_manager as fm
 import platform
 import os
 import warnings
+from .session_memory import SessionMemoryGovernor, get_session_governor, result_nbytes
 
 def setup_korean_font():
     """
@@ -0,0 +1,360 @@
+"""
+세션 결과 메모리 관리 모듈
+- 세션별 분석 결과(st.session_state에 두던 tabN_data)의 실제 바이트 크기를 측정
+- 프로세스 전체(모든 세션 합산) 예산을 넘으면 가장 오래 쓰지 않은 결과부터 제거 (LRU)
+- 제거된 결과는 Arrow 파일로 내려 두었다가 메모리 맵으로 다시 읽거나 (복사 없음), 재계산 함수로 복원
+- 오래 접속하지 않은 세션의 결과 / 스필 파일 정리
+"""
+import os
+import sys
+import time
+import atexit
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+DEFAULT_BUDGET_MB = 512
+DEFAULT_IDLE_TTL = 3600
+
+# ========================================
+# 크기 측정
+# ========================================
+def _root_array(array):
+    while isinstance(array.base, np.ndarray):
+        array = array.base
+    return array
+
+def result_nbytes(obj, _seen=None):
+    """
+    결과 객체가 차지하는 메모리(바이트)를 추정합니다.
+
+    numpy 배열은 데이터 크기(nbytes)로, 같은 메모리를 공유하는 뷰는 한 번만 셉니다.
+    pandas 객체는 값 / 인덱스 배열로 나누어 세고, 컨테이너는 재귀적으로 합산합니다.
+
+    Args:
+        obj: 결과 딕셔너리 등 임의 객체
+
+    Returns:
+        int: 바이트 수
+    """
+    seen = set() if _seen is None else _seen
+    if isinstance(obj, np.ndarray):
+        root = _root_array(obj)
+        if id(root) in seen:
+            return 0
+        seen.add(id(root))
+        return int(root.nbytes)
+    if isinstance(obj, pd.Series):
+        return result_nbytes(obj.to_numpy(), seen) + result_nbytes(obj.index, seen)
+    if isinstance(obj, pd.DataFrame):
+        return sum(result_nbytes(obj[col], seen) for col in obj.columns) + result_nbytes(obj.index, seen)
+    if isinstance(obj, pd.Index):
+        if id(obj) in seen:
+            return 0
+        seen.add(id(obj))
+        if obj.dtype == object:
+            return int(obj.memory_usage(deep=True))
+        return result_nbytes(obj.to_numpy(), seen)
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(result_nbytes(k, seen) + result_nbytes(v, seen) for k, v in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return sys.getsizeof(obj) + sum(result_nbytes(v, seen) for v in obj)
+    return sys.getsizeof(obj)
+
+# ========================================
+# 스필 (Arrow IPC)
+# ========================================
+def _arrow_dump(value, path):
+    from analysis.serialization import save_result
+    save_result(value, path, fmt='arrow')
+
+def _arrow_load(path):
+    from analysis.serialization import load_result
+    return load_result(path, memory_map=True)
+
+class _Entry:
+    """
+    세션 결과 1개의 상태 (value가 None이면 제거됨 -> 스필 파일 또는 재계산으로 복원).
+    """
+    __slots__ = ('session_id', 'key', 'value', 'nbytes', 'recompute', 'spill', 'spill_path', 'last_access',
+                 'version')
+
+    def __init__(self, session_id, key, value, nbytes, recompute, spill, version):
+        self.session_id = session_id
+        self.key = key
+        self.value = value
+        self.nbytes = nbytes
+        self.recompute = recompute
+        self.spill = spill
+        self.spill_path = None
+        self.last_access = time.time()
+        self.version = version
+
+    @property
+    def resident(self):
+        return self.value is not None
+
+    @property
+    def restorable(self):
+        return self.resident or self.spill_path is not None or self.recompute is not None
+
+# ========================================
+# 메모리 관리자
+# ========================================
+class SessionMemoryGovernor:
+    """
+    모든 세션의 결과를 하나의 메모리 예산으로 관리하는 LRU 저장소 (스레드 안전).
+
+    Attributes:
+        budget_bytes: 메모리에 둘 결과의 총 크기 상한
+        spill_dir: 제거된 결과의 Arrow 파일 위치
+        used_bytes: 현재 메모리에 있는 결과 크기 합
+    """
+
+    def __init__(self, budget_bytes=DEFAULT_BUDGET_MB << 20, spill_dir=None, dump=_arrow_dump, load=_arrow_load):
+        self.budget_bytes = int(budget_bytes)
+        self.spill_dir = spill_dir or tempfile.mkdtemp(prefix="sp500_spill_")
+        self._owns_spill_dir = spill_dir is None
+        self._dump = dump
+        self._load = load
+        self._entries = OrderedDict()    # (session_id, key) -> _Entry, 앞쪽이 가장 오래 쓰지 않은 결과
+        self._lock = threading.RLock()
+        self.used_bytes = 0
+        self.peak_bytes = 0
+        self._next_version = 0
+        self.counters = {"stored": 0, "evicted": 0, "spilled": 0, "reloaded": 0, "recomputed": 0, "dropped": 0}
+        os.makedirs(self.spill_dir, exist_ok=True)
+
+    # ---- 저장 / 조회 ----
+    def put(self, session_id, key, value, recompute=None, spill=True):
+        """
+        결과를 저장합니다 (같은 키의 이전 결과는 대체).
+
+        Args:
+            session_id: 세션 ID
+            key: 결과 키 (예: 'tab1_data')
+            value: 결과 객체
+            recompute: 제거 후 복원할 때 호출할 인자 없는 함수 (None이면 스필 파일만 사용)
+            spill: 제거 시 Arrow 파일로 내릴지 여부 (결과 딕셔너리 형식만 가능)
+        """
+        nbytes = result_nbytes(value)
+        with self._lock:
+            self._next_version += 1
+            entry = _Entry(session_id, key, value, nbytes, recompute, spill, self._next_version)
+            self._remove((session_id, key))
+            self._entries[(session_id, key)] = entry
+            self._account(entry.nbytes)
+            self.counters["stored"] += 1
+            self._enforce(keep=entry)
+
+    def get(self, session_id, key, default=None):
+        """
+        결과를 반환합니다. 제거된 결과는 스필 파일 / 재계산으로 복원합니다.
+
+        Returns:
+            결과 객체 (없거나 복원할 수 없으면 default)
+        """
+        with self._lock:
+            entry = self._entries.get((session_id, key))
+            if entry is None:
+                return default
+            entry.last_access = time.time()
+            self._entries.move_to_end((session_id, key))
+            if entry.resident:
+                return entry.value
+            spill_path, recompute = entry.spill_path, entry.recompute
+
+        # 복원은 잠금 밖에서 (다른 세션이 기다리지 않도록)
+        value, source = None, None
+        if spill_path is not None:
+            try:
+                value, source = self._load(spill_path), "reloaded"
+            except Exception as e:
+                print(f"⚠️  스필 파일 읽기 실패 ({key}): {e}")
+        if value is None and recompute is not None:
+            try:
+                value, source = recompute(), "recomputed"
+            except Exception as e:
+                print(f"⚠️  재계산 실패 ({key}): {e}")
+        if value is None:
+            self.pop(session_id, key)
+            return default
+
+        nbytes = result_nbytes(value)
+        with self._lock:
+            # 복원 중 대체 / 삭제되었으면 그 상태를 따름
+            if self._entries.get((session_id, key)) is not entry:
+                return value
+            if not entry.resident:
+                entry.value, entry.nbytes = value, nbytes
+                self._account(nbytes)
+                self.counters[source] += 1
+                self._enforce(keep=entry)
+            return entry.value
+
+    def contains(self, session_id, key):
+        """
+        복원 가능한 결과가 있는지 확인합니다 (메모리에 없어도 True일 수 있음).
+        """
+        with self._lock:
+            entry = self._entries.get((session_id, key))
+            return entry is not None and entry.restorable
+
+    def version(self, session_id, key):
+        """
+        결과의 버전 번호를 반환합니다 (put마다 증가, 제거 후 복원해도 유지).
+
+        결과 객체를 붙잡지 않고 파생 캐시(다운로드 파일 등)의 유효성을 확인할 때 사용합니다.
+
+        Returns:
+            int: 버전 번호 (결과가 없으면 None)
+        """
+        with self._lock:
+            entry = self._entries.get((session_id, key))
+            return None if entry is None else entry.version
+
+    def pop(self, session_id, key):
+        with self._lock:
+            self._remove((session_id, key))
+
+    def drop_session(self, session_id):
+        """
+        세션의 모든 결과와 스필 파일을 삭제합니다.
+        """
+        with self._lock:
+            for entry_key in [k for k in self._entries if k[0] == session_id]:
+                self._remove(entry_key)
+
+    def expire_idle(self, max_idle=DEFAULT_IDLE_TTL):
+        """
+        max_idle 초 동안 접근하지 않은 세션을 삭제합니다 (종료된 브라우저 탭 정리).
+
+        Returns:
+            int: 삭제한 세션 수
+        """
+        now = time.time()
+        with self._lock:
+            last_seen = {}
+            for (session_id, _), entry in self._entries.items():
+                last_seen[session_id] = max(last_seen.get(session_id, 0), entry.last_access)
+            idle = [sid for sid, t in last_seen.items() if now - t > max_idle]
+            for session_id in idle:
+                self.drop_session(session_id)
+            return len(idle)
+
+    # ---- 상태 ----
+    def stats(self):
+        """
+        Returns:
+            dict: 예산 / 사용량 / 최대 사용량 / 결과 수 / 세션 수 / 카운터
+        """
+        with self._lock:
+            entries = list(self._entries.values())
+            return {
+                "budget_bytes": self.budget_bytes,
+                "used_bytes": self.used_bytes,
+                "peak_bytes": self.peak_bytes,
+                "entries": len(entries),
+                "resident": sum(e.resident for e in entries),
+                "spilled_files": sum(e.spill_path is not None for e in entries),
+                "sessions": len({e.session_id for e in entries}),
+                **self.counters
+            }
+
+    def session_usage(self):
+        """
+        Returns:
+            pd.DataFrame: 세션별 메모리 사용량 / 결과 수 / 마지막 접근 (사용량 내림차순)
+        """
+        with self._lock:
+            rows = {}
+            for entry in self._entries.values():
+                row = rows.setdefault(entry.session_id, {"session": entry.session_id, "resident_bytes": 0,
+                                                         "entries": 0, "evicted": 0, "last_access": 0.0})
+                row["entries"] += 1
+                row["resident_bytes"] += entry.nbytes if entry.resident else 0
+                row["evicted"] += not entry.resident
+                row["last_access"] = max(row["last_access"], entry.last_access)
+        df = pd.DataFrame(list(rows.values()), columns=["session", "resident_bytes", "entries", "evicted",
+                                                         "last_access"])
+        df["last_access"] = pd.to_datetime(df["last_access"], unit='s')
+        return df.sort_values("resident_bytes", ascending=False, ignore_index=True)
+
+    def close(self):
+        """
+        모든 결과를 비우고 스필 디렉터리를 삭제합니다.
+        """
+        with self._lock:
+            for entry_key in list(self._entries):
+                self._remove(entry_key)
+        if self._owns_spill_dir:
+            shutil.rmtree(self.spill_dir, ignore_errors=True)
+
+    # ---- 내부 ----
+    def _account(self, delta):
+        self.used_bytes += delta
+        self.peak_bytes = max(self.peak_bytes, self.used_bytes)
+
+    def _remove(self, entry_key):
+        entry = self._entries.pop(entry_key, None)
+        if entry is None:
+            return
+        if entry.resident:
+            self._account(-entry.nbytes)
+            entry.value = None
+        self._delete_spill(entry)
+
+    def _delete_spill(self, entry):
+        if entry.spill_path is not None:
+            try:
+                os.remove(entry.spill_path)
+            except OSError:
+                pass    # 메모리 맵으로 열린 파일 (Windows) -> 디렉터리 정리 시 삭제
+            entry.spill_path = None
+
+    def _evict(self, entry):
+        # 스필 파일이 이미 있으면 (다시 읽은 결과) 쓰지 않고 참조만 해제
+        if entry.spill and entry.spill_path is None:
+            path = os.path.join(self.spill_dir, f"{abs(hash((entry.session_id, entry.key, id(entry))))}.arrow")
+            try:
+                self._dump(entry.value, path)
+                entry.spill_path = path
+                self.counters["spilled"] += 1
+            except Exception as e:
+                print(f"⚠️  스필 실패 ({entry.key}): {e}")
+
+        self._account(-entry.nbytes)
+        entry.value = None
+        self.counters["evicted"] += 1
+        if not entry.restorable:
+            del self._entries[(entry.session_id, entry.key)]
+            self.counters["dropped"] += 1
+
+    def _enforce(self, keep=None):
+        # 방금 저장 / 복원한 결과는 예산보다 커도 유지 (다음 저장 때 제거 대상)
+        for entry in list(self._entries.values()):
+            if self.used_bytes <= self.budget_bytes:
+                break
+            if entry is not keep and entry.resident:
+                self._evict(entry)
+
+# 프로세스 공용 관리자 (Streamlit 세션은 같은 프로세스의 스레드)
+_governor = None
+_governor_lock = threading.Lock()
+
+def get_session_governor():
+    """
+    프로세스 공용 SessionMemoryGovernor를 반환합니다 (처음 호출 시 생성).
+
+    예산은 환경 변수 SP500_SESSION_BUDGET_MB (기본 512MB).
+    """
+    global _governor
+    with _governor_lock:
+        if _governor is None:
+            budget_mb = float(os.environ.get("SP500_SESSION_BUDGET_MB", DEFAULT_BUDGET_MB))
+            _governor = SessionMemoryGovernor(int(budget_mb * (1 << 20)))
+            atexit.register(_governor.close)
+        return _governor
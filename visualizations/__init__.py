@@ -3,13 +3,22 @@
 """
 from .simulation import draw_simulation_chart
 from .distribution import draw_distribution_chart
+from .forward_returns import draw_forward_return_chart
 from .percentile import draw_percentile_chart
+from .risk import draw_risk_chart
 from .quant_panel import draw_composite_chart, draw_zscore_chart
+from .sensitivity import draw_sensitivity_heatmap
+from .interactive import InteractivePanel, CHART_BACKENDS
 
 __all__ = [
     'draw_simulation_chart',
     'draw_distribution_chart',
+    'draw_forward_return_chart',
     'draw_percentile_chart',
+    'draw_risk_chart',
     'draw_composite_chart',
-    'draw_zscore_chart'
+    'draw_zscore_chart',
+    'draw_sensitivity_heatmap',
+    'InteractivePanel',
+    'CHART_BACKENDS'
 ]
@@ -3,20 +3,30 @@
 """
 import matplotlib.pyplot as plt
 import numpy as np
+from .interactive import is_interactive, distribution_figure
 
 def draw_distribution_chart(ax, data):
     """
     최종 수익률 확률 분포를 시각화합니다.
     
     Args:
-        ax: matplotlib axes 객체
+        ax: matplotlib axes 객체 또는 InteractivePanel (Plotly)
         data: 분석 결과 딕셔너리
     """
+    if is_interactive(ax):
+        return distribution_figure(ax, data)
+    
     ax.clear()
     rets = data["returns_pct"]
     
-    # 히스토그램
-    n, bins, patches = ax.hist(rets, bins=50, color='teal', alpha=0.3, edgecolor='white')
+    # 히스토그램 (analytic 모드는 정확한 구간 확률 사용)
+    density = data.get("terminal_density")
+    if density is not None:
+        edges = density["bins"]
+        n, bins, patches = ax.hist(edges[:-1], bins=edges, weights=density["probs"] * 100,
+                                   color='teal', alpha=0.3, edgecolor='white')
+    else:
+        n, bins, patches = ax.hist(rets, bins=50, color='teal', alpha=0.3, edgecolor='white')
     
     # 0% 기준 색상 구분
     for i in range(len(patches)):
@@ -25,10 +35,14 @@ def draw_distribution_chart(ax, data):
         else:
             patches[i].set_facecolor('#2ecc71')  # 수익: 초록
     
-    # 통계 계산
-    win_rate = np.mean(rets > 0) * 100
-    mean_ret = np.mean(rets)
-    var_95 = np.percentile(rets, 5)
+    # 통계 계산 (엔진에서 계산된 통계 우선 사용)
+    stats = data.get("terminal_stats")
+    if stats is not None:
+        win_rate, mean_ret, var_95 = stats["win_rate"], stats["mean"], stats["var_95"]
+    else:
+        win_rate = np.mean(rets > 0) * 100
+        mean_ret = np.mean(rets)
+        var_95 = np.percentile(rets, 5)
     
     stats_text = (f"승률: {win_rate:.1f}%\n"
                   f"평균 수익: {mean_ret:+.1f}%\n"
@@ -44,5 +58,5 @@ def draw_distribution_chart(ax, data):
     
     ax.set_title("최종 수익률 확률 분포", fontsize=10)
     ax.set_xlabel("수익률 (%)")
-    ax.set_ylabel("발생 빈도")
+    ax.set_ylabel("확률 (%)" if density is not None else "발생 빈도")
     ax.grid(True, alpha=0.2)
@@ -0,0 +1,57 @@
+"""
+역사적 선행 수익률 조건부 분포 시각화
+"""
+from .interactive import is_interactive, forward_return_figure
+
+def draw_forward_return_chart(ax, data):
+    """
+    현재 백분위 구간에서 과거 이후 N일 수익률 분포를 시각화합니다.
+    
+    구간은 순위 모드(rank_mode)와 관계없이 각 날짜까지의 확장 창 백분위로 나눕니다 (look-ahead 없음).
+    
+    Args:
+        ax: matplotlib axes 객체 또는 InteractivePanel (Plotly)
+        data: 분석 결과 딕셔너리
+    """
+    if is_interactive(ax):
+        return forward_return_figure(ax, data)
+    
+    ax.clear()
+    fwd = data.get("forward_returns")
+    
+    if fwd is None or fwd["summary"]["count"] == 0:
+        ax.text(0.5, 0.5, '데이터 부족: 과거 유사 구간이 없습니다', 
+                ha='center', va='center', transform=ax.transAxes, fontsize=10)
+        ax.set_title("과거 유사 구간 이후 수익률", fontsize=10)
+        return
+    
+    rets = fwd["returns"]
+    summary = fwd["summary"]
+    lo, hi = fwd["range"]
+    
+    # 히스토그램
+    n, bins, patches = ax.hist(rets, bins=40, color='slateblue', alpha=0.3, edgecolor='white')
+    for i in range(len(patches)):
+        if bins[i] < 0:
+            patches[i].set_facecolor('#e74c3c')
+        else:
+            patches[i].set_facecolor('#2ecc71')
+    
+    stats_text = (f"표본: {summary['count']}일\n"
+                  f"승률: {summary['win_rate']:.1f}%\n"
+                  f"중윗값: {summary['quantiles'][50]:+.1f}%\n"
+                  f"하위5%: {summary['quantiles'][5]:.1f}%")
+    
+    ax.text(0.95, 0.95, stats_text, transform=ax.transAxes, fontsize=9,
+            verticalalignment='top', horizontalalignment='right',
+            bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
+    
+    ax.axvline(0, color='black', linewidth=1.5)
+    ax.axvline(summary['quantiles'][50], color='blue', linestyle='--', linewidth=1)
+    
+    # 구간은 rank_mode와 무관하게 확장 창 백분위 기준 -> 상단 백분위와 구분해 표시
+    ax.set_title(f"과거 유사 구간 이후 {fwd['horizon']}일 수익률\n"
+                 f"(확장 창 백분위 {lo:.0f}~{hi:.0f}%, 현재 {fwd['reading_value']:.1f}%)", fontsize=10)
+    ax.set_xlabel("수익률 (%)")
+    ax.set_ylabel("발생 빈도")
+    ax.grid(True, alpha=0.2)
@@ -0,0 +1,325 @@
+"""
+인터랙티브 (Plotly) 차트 백엔드
+- draw_* 함수에 matplotlib ax 대신 InteractivePanel을 넘기면 Plotly 그림을 생성
+- 다운샘플 시계열 / 분위수 밴드 / 히스토그램 구간만 한 번 전송 (float32 바이너리 인코딩)
+- 확대 / 이동 / 라벨 / 가격 배경 전환은 브라우저에서 처리 (서버 재실행 없음)
+- plotly는 인터랙티브 모드에서만 가져옴
+"""
+import numpy as np
+from .payload import downsample_minmax, histogram_payload, stack_paths, price_background
+
+CHART_BACKENDS = ('matplotlib', 'plotly')
+
+_GAIN, _LOSS = '#2ecc71', '#e74c3c'
+
+class InteractivePanel:
+    """
+    matplotlib ax 자리에 넘기는 Plotly 패널.
+
+    Attributes:
+        height: 차트 높이 (px)
+        max_points: 시계열 최대 전송 점 개수
+        figure: draw_* 호출 후 생성된 plotly Figure
+    """
+
+    def __init__(self, height=380, max_points=2000):
+        self.height = height
+        self.max_points = max_points
+        self.figure = None
+
+def is_interactive(ax):
+    return isinstance(ax, InteractivePanel)
+
+def _go():
+    try:
+        import plotly.graph_objects as go
+    except ImportError:
+        raise ImportError("인터랙티브 차트에는 plotly가 필요합니다 (pip install plotly).")
+    return go
+
+def _new_figure(panel, title, xaxis_title=None, yaxis_title=None):
+    go = _go()
+    fig = go.Figure()
+    fig.update_layout(
+        title=dict(text=title, font=dict(size=13)),
+        height=panel.height,
+        template='plotly_white',
+        margin=dict(l=50, r=20, t=60, b=40),
+        legend=dict(orientation='h', yanchor='bottom', y=1.02, x=0, font=dict(size=10)),
+        xaxis_title=xaxis_title,
+        yaxis_title=yaxis_title,
+        bargap=0
+    )
+    panel.figure = fig
+    return go, fig
+
+def _stats_box(fig, lines, x=0.98, xanchor='right'):
+    fig.add_annotation(text="<br>".join(lines), xref='paper', yref='paper', x=x, y=0.98,
+                       xanchor=xanchor, yanchor='top', showarrow=False, align='left',
+                       font=dict(size=11), bgcolor='rgba(255,255,255,0.85)',
+                       bordercolor='#888', borderwidth=1)
+
+def _label_toggle(fig, visible=True):
+    """
+    모든 주석(라벨 / 통계 상자)을 브라우저에서 켜고 끄는 버튼을 추가합니다.
+    """
+    n = len(fig.layout.annotations)
+    if n == 0:
+        return
+    for annotation in fig.layout.annotations:
+        annotation.visible = visible
+    keys = [f"annotations[{i}].visible" for i in range(n)]
+    fig.update_layout(updatemenus=[dict(
+        type='buttons', direction='left', showactive=False,
+        x=1, xanchor='right', y=1.02, yanchor='bottom', font=dict(size=10),
+        buttons=[dict(label='라벨 표시', method='relayout', args=[{k: True for k in keys}]),
+                 dict(label='라벨 숨김', method='relayout', args=[{k: False for k in keys}])]
+    )])
+
+def _histogram_bars(go, fig, counts, edges, name):
+    centers = (edges[:-1] + edges[1:]) / 2
+    colors = np.where(edges[:-1] < 0, _LOSS, _GAIN)
+    fig.add_trace(go.Bar(x=centers.astype(np.float32), y=counts.astype(np.float32),
+                         width=np.diff(edges).astype(np.float32), marker=dict(color=colors.tolist()),
+                         opacity=0.45, name=name, showlegend=False))
+
+def _mark_current(go, fig, x, y, text, color='black', bgcolor='yellow'):
+    fig.add_trace(go.Scatter(x=[x], y=[y], mode='markers', marker=dict(color='black', size=8),
+                             showlegend=False, hoverinfo='skip'))
+    fig.add_annotation(x=x, y=y, text=f"<b>{text}</b>", showarrow=False, xanchor='left',
+                       xshift=6, yshift=8, font=dict(color=color), bgcolor=bgcolor, opacity=0.8)
+
+def simulation_figure(panel, data, show_label=True):
+    """
+    몬테카를로 시나리오 (배경 경로 100개 + 분위수 밴드).
+    """
+    S0 = data["current_price"]
+    price_list = data["price_list"]
+    days = data["days"]
+    x = np.arange(days)
+
+    bands = data.get("percentile_bands")
+    if bands is None:
+        returns_all = (price_list / S0 - 1) * 100
+        bands = {p: np.percentile(returns_all, p, axis=1) for p in (5, 25, 50, 75, 95)}
+
+    go, fig = _new_figure(panel, "S&P 500 향후 수익률 시나리오")
+    px_, py_ = stack_paths(x, (price_list[:, :100] / S0 - 1) * 100)
+    fig.add_trace(go.Scatter(x=px_, y=py_, mode='lines', line=dict(color='#5d6d7e', width=0.7),
+                             opacity=0.25, name='시나리오', hoverinfo='skip'))
+
+    for lo, hi, color, name in ((5, 95, 'rgba(52,152,219,0.15)', '90% 범위'),
+                                (25, 75, 'rgba(41,128,185,0.25)', '50% 범위')):
+        fig.add_trace(go.Scatter(x=x, y=np.asarray(bands[hi], dtype=np.float32), mode='lines',
+                                 line=dict(width=0), showlegend=False, hoverinfo='skip',
+                                 legendgroup=name))
+        fig.add_trace(go.Scatter(x=x, y=np.asarray(bands[lo], dtype=np.float32), mode='lines',
+                                 line=dict(width=0), fill='tonexty', fillcolor=color, name=name,
+                                 legendgroup=name, hoverinfo='skip'))
+
+    median = np.asarray(bands[50], dtype=np.float32)
+    fig.add_trace(go.Scatter(x=x, y=median, mode='lines', line=dict(color='#1c4966', width=2),
+                             name='중윗값', hovertemplate='%{x}일: %{y:+.1f}%<extra></extra>'))
+    fig.add_hline(y=0, line=dict(color='black', width=1), opacity=0.5)
+    fig.add_annotation(x=days - 1, y=float(median[-1]), text=f"<b>중윗값: {median[-1]:+.1f}%</b>",
+                       showarrow=False, xanchor='left', xshift=5, bgcolor='white',
+                       bordercolor='#1c4966')
+    _label_toggle(fig, show_label)
+    return fig
+
+def distribution_figure(panel, data):
+    """
+    최종 수익률 분포 (히스토그램 구간 + 통계).
+    """
+    density = data.get("terminal_density")
+    if density is not None:
+        edges = density["bins"]
+        counts = density["probs"] * 100
+    else:
+        counts, edges = histogram_payload(data["returns_pct"], 50)
+
+    stats = data.get("terminal_stats")
+    if stats is not None:
+        win_rate, mean_ret, var_95 = stats["win_rate"], stats["mean"], stats["var_95"]
+    else:
+        rets = data["returns_pct"]
+        win_rate, mean_ret, var_95 = np.mean(rets > 0) * 100, np.mean(rets), np.percentile(rets, 5)
+
+    go, fig = _new_figure(panel, "최종 수익률 확률 분포", "수익률 (%)",
+                          "확률 (%)" if density is not None else "발생 빈도")
+    _histogram_bars(go, fig, counts, edges, "분포")
+    fig.add_vline(x=0, line=dict(color='black', width=1.5))
+    fig.add_vline(x=mean_ret, line=dict(color='blue', width=1, dash='dash'))
+    _stats_box(fig, [f"승률: {win_rate:.1f}%", f"평균 수익: {mean_ret:+.1f}%",
+                     f"리스크(하위5%): {var_95:.1f}%"])
+    _label_toggle(fig)
+    return fig
+
+def forward_return_figure(panel, data):
+    """
+    현재 확장 창 백분위 구간의 과거 선행 수익률 분포.
+    """
+    fwd = data.get("forward_returns")
+    if fwd is None or fwd["summary"]["count"] == 0:
+        go, fig = _new_figure(panel, "과거 유사 구간 이후 수익률")
+        _stats_box(fig, ["데이터 부족: 과거 유사 구간이 없습니다"], x=0.5, xanchor='center')
+        return fig
+
+    summary = fwd["summary"]
+    lo, hi = fwd["range"]
+    counts, edges = histogram_payload(fwd["returns"], 40)
+
+    # 구간은 rank_mode와 무관하게 확장 창 백분위 기준 (각 날짜까지의 데이터만 사용)
+    go, fig = _new_figure(panel, f"과거 유사 구간 이후 {fwd['horizon']}일 수익률 "
+                                 f"(확장 창 백분위 {lo:.0f}~{hi:.0f}%, 현재 {fwd['reading_value']:.1f}%)",
+                          "수익률 (%)", "발생 빈도")
+    _histogram_bars(go, fig, counts, edges, "선행 수익률")
+    fig.add_vline(x=0, line=dict(color='black', width=1.5))
+    fig.add_vline(x=summary["quantiles"][50], line=dict(color='blue', width=1, dash='dash'))
+    _stats_box(fig, [f"표본: {summary['count']}일", f"승률: {summary['win_rate']:.1f}%",
+                     f"중윗값: {summary['quantiles'][50]:+.1f}%",
+                     f"하위5%: {summary['quantiles'][5]:.1f}%"])
+    _label_toggle(fig)
+    return fig
+
+def risk_title(risk):
+    """
+    경로 리스크 차트 제목 (analytic 모드는 정확해 지표와 배경 경로 근사 지표를 구분).
+    """
+    if risk.get("closed_form"):
+        return f"경로 리스크: 최대 낙폭 분포 (배경 경로 {risk['n_paths']:,}개, CVaR·도달 확률은 정확해)"
+    return f"경로 리스크: 최대 낙폭 분포 ({risk['n_paths']:,}개 경로)"
+
+def risk_figure(panel, data):
+    """
+    경로 리스크: 최대 낙폭 분포 + 지표 상자.
+    """
+    risk = data.get("path_risk")
+    if risk is None:
+        go, fig = _new_figure(panel, "경로 리스크")
+        _stats_box(fig, ["리스크 지표가 없습니다"], x=0.5, xanchor='center')
+        return fig
+
+    mdd_stats = risk["max_drawdown_stats"]
+    counts, edges = histogram_payload(risk["max_drawdown"], 50)
+
+    go, fig = _new_figure(panel, risk_title(risk), "최대 낙폭 (%)", "발생 빈도")
+    fig.add_trace(go.Bar(x=((edges[:-1] + edges[1:]) / 2).astype(np.float32),
+                         y=counts.astype(np.float32), width=np.diff(edges).astype(np.float32),
+                         marker=dict(color='#c0392b'), opacity=0.35, showlegend=False))
+    fig.add_vline(x=mdd_stats["median"], line=dict(color='#922b21', width=1, dash='dash'))
+
+    lines = [f"MDD 중윗값: {mdd_stats['median']:.1f}%", f"MDD 하위5%: {mdd_stats['p5']:.1f}%"]
+    lines += [f"CVaR {level}%: {value:.1f}%" for level, value in risk["cvar"].items()]
+    lines += [f"{level:+d}% 도달 확률: {prob:.1f}%" for level, prob in risk["touch_prob"].items()]
+    if risk["median_recovery_days"] is not None:
+        lines.append(f"회복 기간 중윗값: {risk['median_recovery_days']:.0f}일 "
+                     f"(회복 {risk['recovered_pct']:.0f}%)")
+    lines.append(f"고점 아래 기간: 평균 {risk['mean_underwater_pct']:.0f}%")
+    _stats_box(fig, lines, x=0.02, xanchor='left')
+    _label_toggle(fig)
+    return fig
+
+def percentile_figure(panel, data, show_price_bg=False, start_date=None, show_label=True,
+                      title="백분위 순위", prices=None):
+    """
+    백분위 순위 (가격 배경은 항상 함께 전송하고 범례 클릭으로 브라우저에서 전환).
+    """
+    rank_ts = data["rank_ts"] if "rank_ts" in data else data.get("percentile")
+    if rank_ts is None or len(rank_ts) == 0:
+        go, fig = _new_figure(panel, title)
+        _stats_box(fig, ["데이터 부족: 순위를 계산할 수 없습니다"], x=0.5, xanchor='center')
+        return fig
+
+    go, fig = _new_figure(panel, title)
+    x, y = downsample_minmax(rank_ts.index.values, rank_ts.values, panel.max_points)
+
+    if start_date and prices is not None:
+        try:
+            dates, closes = price_background(prices, start_date)
+            px_, py_ = downsample_minmax(dates.values, closes, panel.max_points)
+            fig.add_trace(go.Scatter(x=px_, y=py_.astype(np.float32), mode='lines', yaxis='y2',
+                                     line=dict(color='gray', width=1), opacity=0.3,
+                                     name='S&P 500 가격', visible=True if show_price_bg else 'legendonly',
+                                     hovertemplate='$%{y:,.0f}<extra></extra>'))
+            fig.update_layout(yaxis2=dict(overlaying='y', side='right', showgrid=False,
+                                          title=dict(text="S&P 500 가격 (USD)", font=dict(color='gray')),
+                                          tickfont=dict(color='gray')))
+        except Exception as e:
+            print(f"⚠️  가격 배경 표시 실패: {e}")
+
+    fig.add_trace(go.Scatter(x=x, y=y.astype(np.float32), mode='lines',
+                             line=dict(color='#2980b9', width=1.2), name='백분위',
+                             hovertemplate='%{x|%Y-%m-%d}: %{y:.1f}%<extra></extra>'))
+    for level, color in ((75, 'red'), (50, 'limegreen'), (25, 'blue')):
+        fig.add_hline(y=level, line=dict(color=color, width=2, dash='dash'), opacity=0.5)
+
+    _mark_current(go, fig, rank_ts.index[-1], float(rank_ts.iloc[-1]), f"{rank_ts.iloc[-1]:.1f}%")
+    fig.update_layout(yaxis=dict(range=[-10, 110]))
+    _label_toggle(fig, show_label)
+    return fig
+
+def composite_figure(panel, data):
+    """
+    복합 리스크 지수.
+    """
+    idx = data["composite_idx"]
+    curr_c = data["current_val"]
+
+    go, fig = _new_figure(panel, f"복합 리스크 지수 (현재: {curr_c:.1f})")
+    fig.add_hrect(y0=80, y1=100, fillcolor='red', opacity=0.1, line_width=0)
+    fig.add_hrect(y0=0, y1=20, fillcolor='blue', opacity=0.1, line_width=0)
+
+    x, y = downsample_minmax(idx.index.values, idx.values, panel.max_points)
+    fig.add_trace(go.Scatter(x=x, y=y.astype(np.float32), mode='lines', showlegend=False,
+                             line=dict(color='#2c3e50', width=1.5),
+                             hovertemplate='%{x|%Y-%m-%d}: %{y:.1f}<extra></extra>'))
+    fig.add_hline(y=50, line=dict(color='gray', dash='dash'), opacity=0.5)
+    _mark_current(go, fig, idx.index[-1], curr_c, f"{curr_c:.1f}", color='#c0392b')
+    fig.update_layout(yaxis=dict(range=[-5, 105]))
+    _label_toggle(fig)
+    return fig
+
+def zscore_figure(panel, data):
+    """
+    Z-score 통계적 괴리도.
+    """
+    z = data["z_score"]
+    curr_z = float(z.iloc[-1])
+
+    go, fig = _new_figure(panel, f"통계적 괴리도 (현재 Z: {curr_z:+.2f}σ)")
+    fig.add_hline(y=2.0, line=dict(color='red', dash='dash'), opacity=0.6)
+    fig.add_hline(y=-2.0, line=dict(color='blue', dash='dash'), opacity=0.6)
+    fig.add_hline(y=0, line=dict(color='black', width=0.8))
+
+    x, y = downsample_minmax(z.index.values, z.values, panel.max_points)
+    fig.add_trace(go.Scatter(x=x, y=y.astype(np.float32), mode='lines', showlegend=False,
+                             line=dict(color='#8e44ad', width=1.2),
+                             hovertemplate='%{x|%Y-%m-%d}: %{y:+.2f}σ<extra></extra>'))
+    _mark_current(go, fig, z.index[-1], curr_z, f"{curr_z:+.2f}σ", color='#8e44ad', bgcolor='white')
+    fig.update_layout(yaxis=dict(range=[-4, 4]))
+    _label_toggle(fig)
+    return fig
+
+def sensitivity_figure(panel, data, metric, style, marker=None):
+    """
+    분석 기간 x 시작일 민감도 히트맵 (칸 위에 마우스를 올리면 기간 / 시작일 / 값 / 표본 수 표시).
+    """
+    label, cmap, vmin, vmax = style
+    horizons = data["horizons"]
+    starts = data["start_dates"]
+    colorscale = 'RdBu' if metric == 'z_score' else 'RdYlBu'
+
+    go, fig = _new_figure(panel, f"민감도 표면: {label}", "분석 시작일", "분석 기간 (일)")
+    fig.add_trace(go.Heatmap(
+        z=np.asarray(data[metric], dtype=np.float32), x=starts, y=horizons,
+        customdata=data["n_obs"], zmin=vmin, zmax=vmax, colorscale=colorscale, reversescale=True,
+        colorbar=dict(title=dict(text=label, side='right')),
+        hovertemplate='시작일 %{x|%Y-%m-%d}<br>기간 %{y}일<br>값 %{z:.2f}<br>표본 %{customdata}<extra></extra>'
+    ))
+    if marker is not None:
+        start, horizon = marker
+        fig.add_trace(go.Scatter(x=[start], y=[horizon], mode='markers', name='현재 설정',
+                                 marker=dict(symbol='star', size=16, color='black',
+                                             line=dict(color='white', width=1))))
+    return fig
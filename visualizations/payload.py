@@ -0,0 +1,85 @@
+"""
+브라우저 차트용 압축 페이로드 생성
+- 긴 시계열은 구간별 최소/최대 보존 다운샘플링 (급락/급등 형태 유지)
+- 분포는 원시 표본 대신 히스토그램 구간 (개수 + 경계)
+- 배경 경로는 NaN으로 구분한 단일 배열 (경로별 trace 없음, x는 int16 / y는 float32)
+- 가격 배경은 거래일 캘린더의 위치 슬라이스 (날짜 라벨 필터링 / 복사 없음)
+"""
+import numpy as np
+from data import get_trading_calendar
+
+def downsample_minmax(x, y, max_points=2000):
+    """
+    구간별 최솟값/최댓값 위치만 남겨 시계열을 줄입니다 (첫/마지막 점 유지).
+
+    Args:
+        x: x 배열 (날짜 등)
+        y: 값 배열
+        max_points: 최대 점 개수
+
+    Returns:
+        tuple: (x, y) 다운샘플 결과
+    """
+    x, y = np.asarray(x), np.asarray(y, dtype=float)
+    n = len(y)
+    if n <= max_points:
+        return x, y
+
+    buckets = max(max_points // 2, 1)
+    size = -(-n // buckets)
+    padded = np.full(buckets * size, np.nan)
+    padded[:n] = y
+    padded = padded.reshape(buckets, size)
+    valid = ~np.isnan(padded).all(axis=1)
+    rows = np.flatnonzero(valid)
+
+    offsets = rows * size
+    lo = offsets + np.nanargmin(padded[valid], axis=1)
+    hi = offsets + np.nanargmax(padded[valid], axis=1)
+    keep = np.unique(np.concatenate(([0, n - 1], lo, hi)))
+    return x[keep], y[keep]
+
+def price_background(prices, start_date):
+    """
+    시작일 이후 가격 배경 (날짜, 종가)을 거래일 캘린더 위치 슬라이스로 반환합니다.
+
+    Args:
+        prices: 이미 로드된 전체 기간 가격 시계열 (캘린더는 데이터 버전별 캐시)
+        start_date: 시작일 (문자열)
+
+    Returns:
+        tuple: (DatetimeIndex, 종가 배열 뷰)
+    """
+    calendar = get_trading_calendar(prices)
+    window = calendar.slice_from(start_date)
+    return calendar.index[window], calendar.closes[window]
+
+def histogram_payload(values, bins=50):
+    """
+    표본 배열을 히스토그램 구간으로 요약합니다.
+
+    Returns:
+        tuple: (counts, edges)
+    """
+    counts, edges = np.histogram(np.asarray(values, dtype=float), bins=bins)
+    return counts, edges
+
+def stack_paths(x, paths):
+    """
+    (days, n_paths) 경로 행렬을 NaN으로 구분한 단일 선 데이터로 합칩니다.
+
+    Args:
+        x: 일 번호 배열 (days,) - 정수
+        paths: 경로 행렬 (days, n_paths)
+
+    Returns:
+        tuple: (x int16, y float32) 배열 (길이 n_paths * (days + 1), 경로 사이 y = NaN)
+    """
+    days, n_paths = paths.shape
+    xs = np.empty((n_paths, days + 1), dtype=np.int16)
+    ys = np.empty((n_paths, days + 1), dtype=np.float32)
+    xs[:, :days] = x
+    xs[:, days] = x[-1]
+    ys[:, :days] = paths.T
+    ys[:, days] = np.nan
+    return xs.reshape(-1), ys.reshape(-1)
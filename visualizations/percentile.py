@@ -3,20 +3,26 @@
 """
 import matplotlib.pyplot as plt
 import pandas as pd
+from .interactive import is_interactive, percentile_figure
+from .payload import price_background
 
 def draw_percentile_chart(ax, data, show_price_bg=False, start_date=None, 
-                          show_label=True, title="백분위 순위"):
+                          show_label=True, title="백분위 순위", prices=None):
     """
     백분위 순위 차트를 시각화합니다.
     
     Args:
-        ax: matplotlib axes 객체
+        ax: matplotlib axes 객체 또는 InteractivePanel (Plotly)
         data: 분석 결과 딕셔너리
         show_price_bg: 가격 배경 표시 여부
         start_date: 시작일 (가격 배경용)
         show_label: 현재 값 라벨 표시 여부
         title: 차트 제목
+        prices: 가격 배경용 전체 기간 가격 시계열 (이미 로드된 것, None이면 배경 없음)
     """
+    if is_interactive(ax):
+        return percentile_figure(ax, data, show_price_bg, start_date, show_label, title, prices)
+    
     ax.clear()
     
     # rank_ts 우선 확인 (Tab 1용), percentile은 Tab 2용
@@ -49,14 +55,12 @@ def draw_percentile_chart(ax, data, show_price_bg=False, start_date=None,
     print(f"✅ percentile 차트: 데이터 유효 ({len(rank_ts)}개 포인트)")
     
     # 가격 배경 표시
-    if show_price_bg and start_date:
+    if show_price_bg and start_date and prices is not None:
         try:
             ax2 = ax.twinx()
-            from data import load_sp500_data, filter_by_date
-            full_series = load_sp500_data("sp500.csv")
-            price_series = filter_by_date(full_series, start_date)
+            dates, closes = price_background(prices, start_date)
             
-            ax2.plot(price_series.index, price_series.values, 
+            ax2.plot(dates, closes, 
                     color='gray', linewidth=1, alpha=0.3, linestyle='-')
             ax2.set_ylabel("S&P 500 가격 (USD)", fontsize=9, color='gray')
             ax2.tick_params(axis='y', labelcolor='gray', labelsize=8)
@@ -2,15 +2,19 @@
 퀀트 리스크 지표 시각화 (3-Panel)
 """
 import matplotlib.pyplot as plt
+from .interactive import is_interactive, composite_figure, zscore_figure
 
 def draw_composite_chart(ax, data):
     """
     복합 리스크 지수를 시각화합니다.
     
     Args:
-        ax: matplotlib axes 객체
+        ax: matplotlib axes 객체 또는 InteractivePanel (Plotly)
         data: 분석 결과 딕셔너리
     """
+    if is_interactive(ax):
+        return composite_figure(ax, data)
+    
     ax.clear()
     idx = data["composite_idx"]
     curr_c = data["current_val"]
@@ -37,9 +41,12 @@ def draw_zscore_chart(ax, data):
     Z-score를 시각화합니다.
     
     Args:
-        ax: matplotlib axes 객체
+        ax: matplotlib axes 객체 또는 InteractivePanel (Plotly)
         data: 분석 결과 딕셔너리
     """
+    if is_interactive(ax):
+        return zscore_figure(ax, data)
+    
     ax.clear()
     z = data["z_score"]
     curr_z = z.iloc[-1]
@@ -0,0 +1,51 @@
+"""
+경로 의존 리스크 지표 시각화
+"""
+from .interactive import is_interactive, risk_figure, risk_title
+
+def draw_risk_chart(ax, data):
+    """
+    시뮬레이션 경로의 최대 낙폭 분포와 리스크 지표를 시각화합니다.
+    
+    Args:
+        ax: matplotlib axes 객체 또는 InteractivePanel (Plotly)
+        data: 분석 결과 딕셔너리
+    """
+    if is_interactive(ax):
+        return risk_figure(ax, data)
+    
+    ax.clear()
+    risk = data.get("path_risk")
+    
+    if risk is None:
+        ax.text(0.5, 0.5, '리스크 지표가 없습니다', 
+                ha='center', va='center', transform=ax.transAxes, fontsize=10)
+        return
+    
+    mdd = risk["max_drawdown"]
+    mdd_stats = risk["max_drawdown_stats"]
+    
+    # 최대 낙폭 히스토그램
+    ax.hist(mdd, bins=50, color='#c0392b', alpha=0.35, edgecolor='white')
+    ax.axvline(mdd_stats["median"], color='#922b21', linestyle='--', linewidth=1)
+    
+    # 지표 텍스트
+    lines = [f"MDD 중윗값: {mdd_stats['median']:.1f}%",
+             f"MDD 하위5%: {mdd_stats['p5']:.1f}%"]
+    for level, value in risk["cvar"].items():
+        lines.append(f"CVaR {level}%: {value:.1f}%")
+    for level, prob in risk["touch_prob"].items():
+        lines.append(f"{level:+d}% 도달 확률: {prob:.1f}%")
+    if risk["median_recovery_days"] is not None:
+        lines.append(f"회복 기간 중윗값: {risk['median_recovery_days']:.0f}일 "
+                     f"(회복 {risk['recovered_pct']:.0f}%)")
+    lines.append(f"고점 아래 기간: 평균 {risk['mean_underwater_pct']:.0f}%")
+    
+    ax.text(0.02, 0.95, "\n".join(lines), transform=ax.transAxes, fontsize=9,
+            verticalalignment='top', horizontalalignment='left',
+            bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
+    
+    ax.set_title(risk_title(risk), fontsize=10)
+    ax.set_xlabel("최대 낙폭 (%)")
+    ax.set_ylabel("발생 빈도")
+    ax.grid(True, alpha=0.2)
@@ -0,0 +1,56 @@
+"""
+분석 기간 x 시작일 민감도 히트맵
+"""
+import numpy as np
+import pandas as pd
+from .interactive import is_interactive, sensitivity_figure
+
+METRIC_STYLES = {
+    "percentile": ("현재 백분위 (%)", 'RdYlBu_r', 0, 100),
+    "z_score": ("현재 Z-score (σ)", 'RdBu_r', -3, 3),
+    "composite": ("현재 복합 리스크 지수", 'RdYlBu_r', 0, 100)
+}
+
+def draw_sensitivity_heatmap(ax, data, metric='composite', marker=None):
+    """
+    분석 기간 x 시작일 격자의 현재 지표를 히트맵으로 시각화합니다.
+
+    Args:
+        ax: matplotlib axes 객체 또는 InteractivePanel (Plotly)
+        data: 민감도 분석 결과 딕셔너리
+        metric: 'percentile', 'z_score', 'composite'
+        marker: (시작일, 분석 기간) 현재 설정 위치 표시 (None이면 생략)
+    """
+    style = METRIC_STYLES[metric]
+    if is_interactive(ax):
+        return sensitivity_figure(ax, data, metric, style, marker)
+
+    ax.clear()
+    label, cmap, vmin, vmax = style
+    values = data[metric]
+    horizons = data["horizons"]
+    starts = data["start_dates"]
+
+    # 시작일 격자는 위치 기준 등간격 -> 열 번호 축에 연도 눈금
+    im = ax.imshow(values, aspect='auto', origin='lower', cmap=cmap, vmin=vmin, vmax=vmax,
+                   interpolation='nearest')
+    ax.figure.colorbar(im, ax=ax, label=label)
+
+    xticks = np.linspace(0, len(starts) - 1, min(10, len(starts))).astype(int)
+    ax.set_xticks(xticks)
+    ax.set_xticklabels([starts[i].strftime('%Y') for i in xticks])
+    yticks = np.linspace(0, len(horizons) - 1, min(10, len(horizons))).astype(int)
+    ax.set_yticks(yticks)
+    ax.set_yticklabels([str(horizons[i]) for i in yticks])
+
+    if marker is not None:
+        start, horizon = marker
+        col = starts.searchsorted(pd.Timestamp(start))
+        row = np.searchsorted(horizons, horizon)
+        ax.scatter(min(col, len(starts) - 1), min(row, len(horizons) - 1), marker='*', s=200,
+                   color='black', edgecolor='white', zorder=5, label='현재 설정')
+        ax.legend(loc='upper right', fontsize='small')
+
+    ax.set_xlabel("분석 시작일")
+    ax.set_ylabel("분석 기간 (일)")
+    ax.set_title(f"민감도 표면: {label} ({len(horizons)}개 기간 x {len(starts)}개 시작일)", fontsize=11)
@@ -3,16 +3,20 @@
 """
 import matplotlib.pyplot as plt
 import numpy as np
+from .interactive import is_interactive, simulation_figure
 
 def draw_simulation_chart(ax, data, show_label=True):
     """
     몬테카를로 시뮬레이션 결과를 시각화합니다.
     
     Args:
-        ax: matplotlib axes 객체
+        ax: matplotlib axes 객체 또는 InteractivePanel (Plotly)
         data: 분석 결과 딕셔너리
         show_label: 라벨 표시 여부
     """
+    if is_interactive(ax):
+        return simulation_figure(ax, data, show_label)
+    
     ax.clear()
     
     S0 = data["current_price"]
@@ -27,12 +31,11 @@ def draw_simulation_chart(ax, data, show_label=True):
     # 1. 배경 시나리오
     ax.plot(x, paths_subset, color='#5d6d7e', alpha=0.25, linewidth=0.7)
     
-    # 2. 분위수 계산
-    p95 = np.percentile(returns_paths_all, 95, axis=1)
-    p75 = np.percentile(returns_paths_all, 75, axis=1)
-    p50 = np.percentile(returns_paths_all, 50, axis=1)
-    p25 = np.percentile(returns_paths_all, 25, axis=1)
-    p5 = np.percentile(returns_paths_all, 5, axis=1)
+    # 2. 분위수 계산 (엔진에서 계산된 밴드 우선 사용)
+    bands = data.get("percentile_bands")
+    if bands is None:
+        bands = {p: np.percentile(returns_paths_all, p, axis=1) for p in (5, 25, 50, 75, 95)}
+    p95, p75, p50, p25, p5 = bands[95], bands[75], bands[50], bands[25], bands[5]
     
     # 3. 신뢰구간
     ax.fill_between(x, p5, p95, color='#3498db', alpha=0.15, label='90% 범위')